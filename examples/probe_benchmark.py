@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: header-only audio probing vs. pydub decoding.
+
+Encodes a few seconds of tone as WAV, OGG/Opus and MP3, then times how long it
+takes to get duration, sample rate and channels from the bytes with
+ttskit.audio.probe and with pydub (which shells out to ffmpeg for anything but
+plain WAV).
+"""
+
+import io
+import time
+
+import numpy as np
+
+from ttskit.audio import codec
+from ttskit.audio.probe import probe
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+
+def tone(seconds: float, sample_rate: int) -> np.ndarray:
+    """Generate a 440 Hz sine tone."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def time_per_call(func, data: bytes, iterations: int) -> float:
+    """Average seconds per call of func(data)."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(data)
+    return (time.perf_counter() - start) / iterations
+
+
+def with_pydub(data: bytes, fmt: str) -> tuple[float, int, int]:
+    """Get duration, sample rate and channels by decoding with pydub."""
+    audio = AudioSegment.from_file(io.BytesIO(data), format=fmt)
+    return len(audio) / 1000.0, audio.frame_rate, audio.channels
+
+
+def main(seconds: float = 10.0, iterations: int = 200) -> None:
+    """Run the benchmark and print a table."""
+    samples = {
+        fmt: codec.encode(tone(seconds, rate), rate, fmt)
+        for fmt, rate in (("wav", 48000), ("ogg", 48000), ("mp3", 44100))
+        if codec.can_encode(fmt)
+    }
+
+    print(f"⏱️  {seconds:g}s of audio, {iterations} iterations each\n")
+    print(f"{'format':<8}{'size':>10}{'probe':>14}{'pydub':>14}{'speedup':>10}")
+    for fmt, data in samples.items():
+        header = probe(data)
+        probe_time = time_per_call(probe, data, iterations)
+        line = f"{fmt:<8}{len(data):>10}{probe_time * 1e6:>11.1f} µs"
+
+        if AudioSegment is None:
+            print(f"{line}{'n/a':>14}")
+            continue
+        try:
+            pydub_time = time_per_call(
+                lambda d, fmt=fmt: with_pydub(d, fmt), data, max(1, iterations // 20)
+            )
+        except Exception as e:
+            print(f"{line}{'failed':>14}  ({type(e).__name__})")
+            continue
+        print(f"{line}{pydub_time * 1e6:>11.1f} µs{pydub_time / probe_time:>9.0f}x")
+        duration, sample_rate, channels = with_pydub(data, fmt)
+        if (sample_rate, channels) != (header.sample_rate, header.channels):
+            print(
+                f"  ⚠️  mismatch: probe {header}, pydub {duration, sample_rate, channels}"
+            )
+
+
+if __name__ == "__main__":
+    main()
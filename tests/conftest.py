@@ -457,7 +457,6 @@ def mock_redis_globally():
         patch("redis.asyncio.Redis", mock_redis_class),
         patch("redis.Redis", mock_redis_class),
         patch("ttskit.cache.redis.redis", MagicMock()),
-        patch("ttskit.utils.rate_limiter.redis", MagicMock()),
     ):
         yield mock_redis_class, mock_redis
 
@@ -576,8 +575,6 @@ def mock_audio_libraries_globally():
         patch("ttskit.audio.pipeline.librosa", mock_librosa),
         patch("ttskit.audio.pipeline.soundfile", mock_soundfile),
         patch("ttskit.audio.pipeline.AudioSegment", mock_audio_segment),
-        patch("ttskit.audio.pipeline.SCIPY_AVAILABLE", False),
-        patch("ttskit.audio.pipeline._scipy_signal", MagicMock()),
     ):
         yield {
             "librosa": mock_librosa,
@@ -866,6 +863,16 @@ def setup_test_environment():
         del os.environ["TTSKIT_CACHE_ENABLED"]
 
 
+@pytest.fixture(autouse=True, scope="function")
+def reset_audio_memory_cache():
+    """Start each test with an empty in-process (L1) audio cache."""
+    from ttskit.cache import memory_cache
+
+    memory_cache.clear()
+    yield
+    memory_cache.clear()
+
+
 # Skip real engine tests by default unless explicitly requested
 def pytest_runtest_setup(item):
     """Skip real engine tests unless explicitly requested."""
@@ -0,0 +1,97 @@
+"""Tests for the decode-once AudioBuffer."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ttskit.audio import codec
+from ttskit.audio.buffer import AudioBuffer
+from ttskit.audio.pcm import PCMBuffer
+from ttskit.audio.pipeline import pipeline
+from ttskit.telegram.base import TelegramAdapter
+
+pytestmark = pytest.mark.skipif(
+    not codec.can_encode("ogg"), reason="libsndfile built without Opus"
+)
+
+
+def tone(seconds=0.5, sample_rate=48000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+class TestAudioBuffer:
+    """Test cases for AudioBuffer."""
+
+    def test_from_encoded_keeps_source_bytes(self):
+        """Test decoding once keeps the input as that format's encoding."""
+        wav = PCMBuffer(tone(), 48000).to_wav_bytes()
+
+        buffer = AudioBuffer.from_encoded(wav, "wav")
+
+        assert buffer.encode("wav") == wav
+        assert buffer.duration == 0.5
+        assert (buffer.sample_rate, buffer.channels) == (48000, 1)
+
+    def test_encode_is_cached_per_format(self):
+        """Test each format is encoded once."""
+        buffer = AudioBuffer.from_pcm(PCMBuffer(tone(), 48000))
+
+        with patch.object(pipeline, "_encode", wraps=pipeline._encode) as encode:
+            first = buffer.encode("ogg")
+            second = buffer.encode("OGG")
+
+        assert first is second
+        assert encode.call_count == 1
+        assert buffer.formats == ["ogg"]
+
+    def test_info_matches_audio_manager_keys(self):
+        """Test info describes the encoding without probing it."""
+        buffer = AudioBuffer.from_pcm(PCMBuffer(tone(), 48000))
+
+        with patch("ttskit.audio.codec.decode") as decode:
+            info = buffer.info("ogg")
+
+        decode.assert_not_called()
+        assert set(info) == {
+            "duration",
+            "sample_rate",
+            "channels",
+            "bitrate",
+            "size",
+            "format",
+        }
+        assert info["duration"] == 0.5
+        assert info["size"] == len(buffer.encode("ogg"))
+
+    def test_converted_and_concatenate(self):
+        """Test conversion to the first part's rate and channels when joining."""
+        stereo = AudioBuffer(np.stack([tone(), tone()], axis=1), 48000, channels=2)
+        mono = AudioBuffer(tone(0.25, 24000), 24000)
+
+        with patch.object(
+            pipeline, "_resample_audio", side_effect=lambda a, o, t: np.repeat(a, 2)
+        ):
+            joined = AudioBuffer.concatenate([mono, stereo])
+
+        assert (joined.sample_rate, joined.channels) == (24000, 1)
+        assert joined.frames == 6000 + 48000
+        assert mono.converted(24000) is mono
+
+
+class TestVoicePayload:
+    """Test adapters take duration from an AudioBuffer."""
+
+    def test_buffer_supplies_duration(self):
+        """Test an AudioBuffer is sent as OGG with its own duration."""
+        buffer = AudioBuffer.from_pcm(PCMBuffer(tone(2.0), 48000))
+
+        data, duration = TelegramAdapter._voice_payload(None, buffer, None)
+
+        assert duration == 2
+        assert data[:4] == b"OggS"
+
+    def test_bytes_pass_through(self):
+        """Test bytes and an explicit duration are left alone."""
+        assert TelegramAdapter._voice_payload(None, b"OggS", 3) == (b"OggS", 3)
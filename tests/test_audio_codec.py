@@ -0,0 +1,106 @@
+"""Tests for in-process audio encoding and decoding."""
+
+import io
+import wave
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ttskit.audio import codec
+from ttskit.audio.pcm import PCMBuffer
+from ttskit.audio.pipeline import AudioPipeline
+from ttskit.utils.audio import to_opus_ogg
+
+pytestmark = pytest.mark.skipif(
+    not codec.can_encode("ogg"), reason="libsndfile built without Opus"
+)
+
+
+def tone(seconds=0.2, sample_rate=48000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+class TestCodec:
+    """Test cases for the codec module."""
+
+    def test_opus_round_trip(self):
+        """Test OGG output is Opus and decodes back to the same length."""
+        data = codec.encode(tone(), 48000, "ogg")
+
+        assert data[:4] == b"OggS"
+        assert b"OpusHead" in data[:64]
+        audio, sr = codec.decode(data)
+        assert sr == 48000
+        assert abs(len(audio) - 9600) < 960
+
+    def test_opus_rejects_unsupported_rate(self):
+        """Test Opus refuses sample rates it cannot run at."""
+        with pytest.raises(ValueError, match="Opus needs"):
+            codec.encode(tone(sample_rate=22050), 22050, "ogg")
+
+    def test_unknown_format(self):
+        """Test unknown formats are reported unsupported."""
+        assert not codec.can_encode("aac")
+        assert not codec.can_decode("aac")
+        with pytest.raises(ValueError):
+            codec.encode(tone(), 48000, "aac")
+
+    def test_mix_channels(self):
+        """Test downmixing and duplicating channels."""
+        stereo = np.array([[1.0, 0.0], [0.0, 1.0]])
+        assert codec.mix_channels(stereo, 1).tolist() == [0.5, 0.5]
+        assert codec.mix_channels(np.array([1.0, 2.0]), 2).tolist() == [
+            [1.0, 1.0],
+            [2.0, 2.0],
+        ]
+
+
+class TestInProcessConversion:
+    """Test conversions that no longer need ffmpeg."""
+
+    def test_save_ogg_is_opus(self):
+        """Test the pipeline encodes PCM straight to Opus."""
+        pcm = PCMBuffer(tone(sample_rate=24000), 24000)
+        pipeline = AudioPipeline()
+
+        data = pipeline._save_audio(pcm.to_float32(), pcm.sample_rate, "ogg")
+
+        assert b"OpusHead" in data[:64]
+        assert codec.decode(data)[1] == 24000
+
+    def test_convert_format_skips_pydub(self):
+        """Test WAV to OGG conversion does not touch pydub."""
+        wav = PCMBuffer(tone(), 48000).to_wav_bytes()
+
+        with patch("ttskit.audio.pipeline.AudioSegment") as mock_segment:
+            data = AudioPipeline().convert_format(wav, "wav", "ogg")
+
+        mock_segment.from_file.assert_not_called()
+        assert b"OpusHead" in data[:64]
+
+    def test_merge_audio_in_process(self):
+        """Test merging decodes and re-encodes without pydub."""
+        part = PCMBuffer(tone(0.1), 48000).to_wav_bytes()
+
+        with patch("ttskit.audio.pipeline.AudioSegment") as mock_segment:
+            data = AudioPipeline().merge_audio([part, part], "wav")
+
+        mock_segment.from_file.assert_not_called()
+        with wave.open(io.BytesIO(data)) as wav_file:
+            assert wav_file.getnframes() == 9600
+
+    def test_to_opus_ogg_without_ffmpeg(self, tmp_path):
+        """Test to_opus_ogg works when ffmpeg is missing."""
+        src = tmp_path / "in.wav"
+        dst = tmp_path / "out" / "out.ogg"
+        stereo = np.stack([tone(), tone()], axis=1)
+        src.write_bytes(codec.encode(stereo, 48000, "wav"))
+
+        with patch("ttskit.utils.audio.check_ffmpeg_available", return_value=False):
+            to_opus_ogg(str(src), str(dst), sample_rate=48000, channels=1)
+
+        audio, sr = codec.decode(str(dst))
+        assert sr == 48000
+        assert audio.ndim == 1
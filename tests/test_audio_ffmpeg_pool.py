@@ -0,0 +1,141 @@
+"""Tests for the warm ffmpeg worker pool."""
+
+import os
+import stat
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ttskit.audio import codec
+from ttskit.audio.ffmpeg_pool import FFmpegPool
+from ttskit.audio.pipeline import AudioPipeline
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="needs /bin/sh")
+
+
+def fake_ffmpeg(tmp_path, body="exec cat"):
+    """Write a stand-in ffmpeg that ignores its arguments."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(f"#!/bin/sh\n{body}\n")
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return str(script)
+
+
+class TestFFmpegPool:
+    """Test cases for FFmpegPool."""
+
+    def test_command_line(self):
+        """Test the command streams stdin to stdout with the given formats."""
+        pool = FFmpegPool(binary="ffmpeg")
+        assert pool.command("mp3", "wav", ("-c:a", "libmp3lame")) == [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "wav",
+            "-i", "pipe:0", "-c:a", "libmp3lame", "-f", "mp3", "pipe:1",
+        ]  # fmt: skip
+
+    def test_spare_is_used_by_next_conversion(self, tmp_path):
+        """Test a conversion leaves a warm spare that the next one takes."""
+        pool = FFmpegPool(workers=2, binary=fake_ffmpeg(tmp_path))
+        try:
+            assert pool.convert(b"one", "mp3") == b"one"
+            assert pool.get_stats()["idle"] == 1
+            assert pool.convert(b"two", "mp3") == b"two"
+
+            stats = pool.get_stats()
+            assert stats["warm_starts"] == 1
+            assert stats["conversions"] == 2
+            assert stats["spawned"] == 3
+        finally:
+            pool.close()
+        assert pool.get_stats()["idle"] == 0
+
+    def test_worker_cap_includes_spares(self, tmp_path):
+        """Test no spare is started when it would exceed the cap."""
+        pool = FFmpegPool(workers=1, binary=fake_ffmpeg(tmp_path))
+
+        assert pool.convert(b"x", "mp3") == b"x"
+        assert pool.get_stats()["idle"] == 0
+        assert pool.get_stats()["spawned"] == 1
+
+    def test_dead_spare_is_replaced(self, tmp_path):
+        """Test a spare that died while idle is discarded."""
+        pool = FFmpegPool(workers=2, binary=fake_ffmpeg(tmp_path))
+        try:
+            pool.convert(b"x", "mp3")
+            spare = pool._idle[("mp3", None, ())][0]
+            spare.kill()
+            spare.wait()
+
+            assert pool.convert(b"y", "mp3") == b"y"
+            assert pool.get_stats()["crashes"] == 1
+        finally:
+            pool.close()
+
+    def test_refill_race_kills_surplus_spare(self, tmp_path):
+        """Test a spare started after another thread filled the slot is stopped."""
+        pool = FFmpegPool(workers=3, binary=fake_ffmpeg(tmp_path))
+        profile = ("mp3", None, ())
+        spawn = pool._spawn
+        started = []
+
+        def racing_spawn(p):
+            # Another thread's spare lands while this one starts
+            other = spawn(p)
+            with pool._lock:
+                pool._idle.setdefault(p, []).append(other)
+            started.append(spawn(p))
+            return started[-1]
+
+        try:
+            with patch.object(pool, "_spawn", side_effect=racing_spawn):
+                pool._refill(profile)
+
+            assert pool.get_stats()["idle"] == 1
+            assert started[0].poll() is not None
+        finally:
+            pool.close()
+
+    def test_crash_is_retried_once(self, tmp_path):
+        """Test a worker killed mid-conversion is retried on a fresh process."""
+        marker = tmp_path / "crashed"
+        body = f'if mkdir "{marker}" 2>/dev/null; then kill -9 $$; fi\nexec cat'
+        pool = FFmpegPool(workers=2, binary=fake_ffmpeg(tmp_path, body), spares=0)
+
+        assert pool.convert(b"data", "mp3") == b"data"
+        assert pool.get_stats()["crashes"] == 1
+
+    def test_failure_raises_with_stderr(self, tmp_path):
+        """Test a non-zero exit raises with ffmpeg's message."""
+        pool = FFmpegPool(
+            binary=fake_ffmpeg(tmp_path, "echo 'Invalid data' >&2; exit 1"), spares=0
+        )
+
+        with pytest.raises(RuntimeError, match="Invalid data"):
+            pool.convert(b"x", "mp3")
+        assert pool.get_stats()["failures"] == 1
+
+    def test_unavailable(self):
+        """Test converting without an ffmpeg binary raises."""
+        with patch("shutil.which", return_value=None):
+            pool = FFmpegPool()
+        assert not pool.available
+        with pytest.raises(RuntimeError, match="ffmpeg not found"):
+            pool.convert(b"x", "mp3")
+
+
+def test_pipeline_decodes_through_pool(tmp_path):
+    """Test formats libsndfile can't read are decoded by the pool, not pydub."""
+    pool = FFmpegPool(binary=fake_ffmpeg(tmp_path), spares=0)
+    # The stand-in ffmpeg echoes its input, so hand it something libsndfile reads back
+    source = codec.encode(np.zeros(800, dtype=np.float32), 8000, "wav")
+
+    with (
+        patch("ttskit.audio.pipeline.get_ffmpeg_pool", return_value=pool),
+        patch("ttskit.audio.pipeline.AudioSegment") as mock_segment,
+    ):
+        data = AudioPipeline().convert_format(source, "aac", "wav")
+
+    mock_segment.from_file.assert_not_called()
+    assert pool.get_stats()["conversions"] == 1
+    audio, sr = codec.decode(data)
+    assert (len(audio), sr) == (800, 8000)
@@ -1,6 +1,7 @@
 """Tests for Audio Manager."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -92,6 +93,22 @@ class TestAudioManager:
 
         assert loaded_data is None
 
+    def test_concurrent_saves_and_loads(self, temp_dir):
+        """Test index updates from many threads keep the LRU bound intact."""
+        manager = AudioManager(cache_dir=str(temp_dir), max_cache_size=20)
+
+        def work(worker):
+            for i in range(50):
+                manager.save_to_cache(f"k{worker}_{i}", b"data")
+                manager.get_from_cache(f"k{worker}_{i // 2}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+
+        assert len(manager.cache_index) == 20
+        assert len(manager._index_store) == 20
+        assert len(list(temp_dir.glob("k*.ogg"))) == 20
+
     def test_get_cache_stats(self, audio_manager_instance):
         """Test getting cache statistics."""
         stats = audio_manager_instance.get_cache_stats()
@@ -0,0 +1,46 @@
+"""Tests for the in-memory PCM buffer."""
+
+import io
+import wave
+
+import numpy as np
+
+from ttskit.audio.pcm import PCMBuffer
+
+
+class TestPCMBuffer:
+    """Test cases for PCMBuffer."""
+
+    def test_from_int16_bytes_does_not_copy(self):
+        """Test wrapping PCM bytes views the original memory."""
+        raw = bytearray(b"\x01\x00\xff\x7f\x00\x80\x00\x00")
+        buf = PCMBuffer.from_int16_bytes(raw, 16000)
+
+        assert np.shares_memory(buf.samples, np.frombuffer(raw, dtype="<i2"))
+        assert buf.samples.tolist() == [1, 32767, -32768, 0]
+        assert buf.frames == 4
+        assert buf.nbytes == len(buf) == 8
+        assert buf.duration == 4 / 16000
+
+    def test_to_float32_range(self):
+        """Test int16 samples are scaled into [-1, 1]."""
+        buf = PCMBuffer.from_int16_bytes(b"\x00\x80\x00\x00\x00\x40", 22050)
+        assert buf.to_float32().tolist() == [-1.0, 0.0, 0.5]
+
+    def test_float_samples_round_trip_to_int16(self):
+        """Test float samples are clipped and converted to 16-bit PCM."""
+        buf = PCMBuffer(np.array([2.0, -2.0, 0.0], dtype=np.float32), 8000)
+        samples = np.frombuffer(buf.to_int16_bytes(), dtype="<i2")
+        assert samples.tolist() == [32767, -32767, 0]
+
+    def test_to_wav_bytes_header(self):
+        """Test the WAV header carries the buffer's sample rate and channels."""
+        raw = b"\x01\x00\x02\x00\x03\x00\x04\x00"
+        buf = PCMBuffer.from_int16_bytes(raw, 16000, channels=2)
+        assert buf.frames == 2
+
+        with wave.open(io.BytesIO(buf.to_wav_bytes()), "rb") as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnchannels() == 2
+            assert wav_file.getsampwidth() == 2
+            assert wav_file.readframes(wav_file.getnframes()) == raw
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, mock_open, patch
 import numpy as np
 import pytest
 
+from ttskit.audio.pcm import PCMBuffer
 from ttskit.audio.pipeline import AudioPipeline, convert_format, process_audio
 
 
@@ -319,6 +320,25 @@ class TestAudioPipeline:
         assert isinstance(result, bytes)
         assert len(result) > 0
 
+    @pytest.mark.asyncio
+    async def test_process_audio_accepts_pcm_buffer(self, pipeline):
+        """Test PCMBuffer input is used directly instead of being decoded."""
+        if not pipeline.is_available():
+            pytest.skip("Audio pipeline not available - missing dependencies")
+
+        pcm = PCMBuffer.from_int16_bytes(b"\x00\x40" * 8, 16000)
+        with patch.object(
+            pipeline, "_save_audio", return_value=b"encoded"
+        ) as mock_save:
+            result = await pipeline.process_audio(
+                pcm, output_format="wav", normalize=False, trim_silence=False
+            )
+
+        assert result == b"encoded"
+        audio, sample_rate = mock_save.call_args.args[:2]
+        assert sample_rate == 16000
+        assert np.allclose(audio, 0.5)
+
     def test_load_audio_not_available(self, pipeline):
         """Test _load_audio when dependencies not available."""
         with patch("ttskit.audio.pipeline.NUMPY_AVAILABLE", False):
@@ -978,19 +998,10 @@ class TestAudioPipelineIntegration:
 
         with patch("ttskit.audio.pipeline.LIBROSA_AVAILABLE", True):
             with patch("librosa.resample") as mock_resample:
-                mock_resample.return_value = np.array([1.0, 2.0, 3.0], dtype=np.float32)
-
                 result = pipeline._resample_audio(audio, orig_sr, 44100)
                 assert isinstance(result, np.ndarray)
-                mock_resample.assert_called_once_with(
-                    audio, orig_sr=orig_sr, target_sr=44100, res_type="linear"
-                )
-
-        with patch("ttskit.audio.pipeline.LIBROSA_AVAILABLE", True):
-            with patch("librosa.resample", side_effect=Exception("librosa error")):
-                result = pipeline._resample_audio(audio, orig_sr, 44100)
-                assert isinstance(result, np.ndarray)
-                assert len(result) > 0
+                assert len(result) == 10
+                mock_resample.assert_not_called()
 
         with patch("ttskit.audio.pipeline.LIBROSA_AVAILABLE", False):
             result = pipeline._resample_audio(audio, orig_sr, orig_sr * 2)
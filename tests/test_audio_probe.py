@@ -0,0 +1,119 @@
+"""Tests for header-only audio probing."""
+
+import struct
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ttskit.audio import codec
+from ttskit.audio.pipeline import AudioPipeline
+from ttskit.audio.probe import AudioHeader, _mp3_frame, probe
+from ttskit.utils.audio_manager import AudioManager
+
+
+def tone(seconds=1.0, sample_rate=48000, channels=1):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    mono = (0.3 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    return mono if channels == 1 else np.stack([mono] * channels, axis=1)
+
+
+def encoded(fmt, seconds=1.0, sample_rate=48000, channels=1):
+    if not codec.can_encode(fmt):
+        pytest.skip(f"libsndfile cannot encode {fmt}")
+    return codec.encode(tone(seconds, sample_rate, channels), sample_rate, fmt)
+
+
+class TestProbe:
+    """Test cases for probe."""
+
+    def test_wav(self):
+        """Test the fmt and data chunks give the exact length."""
+        header = probe(encoded("wav", 1.5, 24000, 2))
+
+        assert header == AudioHeader("wav", 1.5, 24000, 2, 16)
+
+    def test_wav_streamed_size(self):
+        """Test an unset data size falls back to the bytes present."""
+        data = bytearray(encoded("wav", 1.0, 16000))
+        data[40:44] = struct.pack("<I", 0xFFFFFFFF)
+
+        assert probe(bytes(data)).duration == 1.0
+
+    def test_opus_subtracts_pre_skip(self):
+        """Test Opus reports 48 kHz and the granule position minus pre-skip."""
+        header = probe(encoded("ogg", 2.0, 48000, 2))
+
+        assert header == AudioHeader("ogg", 2.0, 48000, 2)
+
+    @pytest.mark.parametrize("sample_rate", [44100, 24000, 8000])
+    def test_mp3_xing_and_lame_gap(self, sample_rate):
+        """Test the Xing frame count less LAME delay and padding."""
+        header = probe(encoded("mp3", 2.0, sample_rate))
+
+        assert header == AudioHeader("mp3", 2.0, sample_rate, 1)
+
+    def test_mp3_frame_scan(self):
+        """Test MP3 without a summary header is measured by walking frames."""
+        data = encoded("mp3", 1.0, 44100, 2)
+        # Drop the Xing frame and append an ID3v1 tag
+        length = _mp3_frame(data, 0)[0]
+        frames = data[length:] + b"TAG" + b"\x00" * 125
+        xing = data.index(b"Xing")
+        (count,) = struct.unpack_from(">I", data, xing + 8)
+
+        header = probe(frames)
+
+        assert header == AudioHeader("mp3", count * 1152 / 44100, 44100, 2)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"test_data",
+            b"\xff\xfb\x90\x00" + b"x" * 1000,
+            b"OggS\x02\x00\x00\x00" + b"x" * 100,
+            b"RIFF\x00\x00\x00\x00WAVE" + b"x" * 100,
+            b"ID3\x04\x00\x00\x00\x00\x00\x00",
+        ],
+    )
+    def test_rejects_malformed(self, data):
+        """Test data that only looks like audio is not parsed."""
+        assert probe(data) is None
+
+
+class TestGetAudioInfo:
+    """Test get_audio_info reads headers instead of decoding."""
+
+    def test_audio_manager_skips_pydub(self):
+        """Test AudioManager returns the usual keys without loading pydub."""
+        data = encoded("ogg", 1.0)
+
+        with patch("pydub.AudioSegment.from_file") as from_file:
+            info = AudioManager.get_audio_info(None, data)
+
+        from_file.assert_not_called()
+        assert info == {
+            "duration": 1.0,
+            "sample_rate": 48000,
+            "channels": 1,
+            "bitrate": int(len(data) * 8 / 1000),
+            "size": len(data),
+            "format": "ogg",
+        }
+
+    def test_pipeline_skips_pydub(self):
+        """Test the pipeline answers from headers even without pydub."""
+        data = encoded("wav", 0.5, 16000)
+
+        with patch("ttskit.audio.pipeline.PYDUB_AVAILABLE", False):
+            info = AudioPipeline().get_audio_info(data, "wav")
+
+        assert info == {
+            "duration": 0.5,
+            "sample_rate": 16000,
+            "channels": 1,
+            "bit_depth": 16,
+            "format": "wav",
+            "size_bytes": len(data),
+        }
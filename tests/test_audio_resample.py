@@ -0,0 +1,134 @@
+"""Tests for the cached polyphase resampler."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ttskit.audio import resample as resample_module
+from ttskit.audio.pipeline import AudioPipeline
+from ttskit.audio.resample import Resampler, design_filter, resample
+
+
+def noise(frames, channels=1, seed=0):
+    shape = (frames,) if channels == 1 else (frames, channels)
+    return np.random.default_rng(seed).standard_normal(shape).astype(np.float32)
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request):
+    """Run with scipy's upfirdn and with the numpy kernel."""
+    if request.param == "numpy":
+        with patch.object(resample_module, "_upfirdn", None):
+            yield request.param
+    else:
+        if resample_module._upfirdn is None:
+            pytest.skip("scipy not installed")
+        yield request.param
+
+
+class TestDesignFilter:
+    """Test cases for design_filter."""
+
+    def test_cached_per_ratio(self):
+        """Test rate pairs with the same ratio share one filter."""
+        assert design_filter(22050, 48000) is design_filter(44100, 96000)
+        assert design_filter(22050, 48000) is not design_filter(22050, 48000, "high")
+
+    def test_unity_dc_gain(self):
+        """Test each phase passes DC unchanged."""
+        filt = design_filter(22050, 48000)
+
+        assert (filt.up, filt.down) == (320, 147)
+        np.testing.assert_allclose(filt.phases.sum(axis=1), 1.0, atol=1e-3)
+
+    def test_invalid(self):
+        """Test bad rates and quality names are rejected."""
+        with pytest.raises(ValueError, match="quality"):
+            design_filter(22050, 48000, "best")
+        with pytest.raises(ValueError, match="sample rates"):
+            design_filter(0, 48000)
+
+
+class TestResample:
+    """Test cases for resample."""
+
+    @pytest.mark.parametrize(
+        "orig_sr,target_sr", [(22050, 48000), (48000, 16000), (44100, 22050)]
+    )
+    def test_matches_resample_poly(self, backend, orig_sr, target_sr):
+        """Test medium quality reproduces scipy's resample_poly."""
+        signal = pytest.importorskip("scipy.signal")
+        audio = noise(5000)
+        filt = design_filter(orig_sr, target_sr)
+
+        result = resample(audio, orig_sr, target_sr)
+
+        expected = signal.resample_poly(audio, filt.up, filt.down)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    def test_stereo_and_short_input(self, backend):
+        """Test channels are resampled independently and tiny inputs survive."""
+        audio = noise(1000, channels=2)
+
+        result = resample(audio, 22050, 48000)
+
+        assert result.shape == (2177, 2)
+        np.testing.assert_allclose(
+            result[:, 1], resample(audio[:, 1].copy(), 22050, 48000), atol=1e-6
+        )
+        assert len(resample(noise(1), 22050, 48000)) == 3
+
+    def test_removes_content_above_new_nyquist(self, backend):
+        """Test a tone above the target Nyquist is filtered out."""
+        t = np.arange(48000) / 48000
+        audio = np.sin(2 * np.pi * 12000 * t).astype(np.float32)
+
+        result = resample(audio, 48000, 16000)
+
+        assert np.abs(result[200:-200]).max() < 0.01
+
+
+class TestResampler:
+    """Test cases for the streaming Resampler."""
+
+    @pytest.mark.parametrize("block", [1, 147, 1000, 4096])
+    def test_blocks_match_one_shot(self, block):
+        """Test streaming in blocks gives the one-shot result."""
+        audio = noise(22050)
+        resampler = Resampler(22050, 48000)
+
+        parts = [
+            resampler.process(audio[i : i + block]) for i in range(0, len(audio), block)
+        ]
+        streamed = np.concatenate(parts + [resampler.flush()])
+
+        np.testing.assert_allclose(streamed, resample(audio, 22050, 48000), atol=1e-5)
+
+    def test_history_is_bounded(self):
+        """Test only the filter's reach of input is kept between blocks."""
+        resampler = Resampler(22050, 48000)
+
+        for _ in range(20):
+            resampler.process(noise(4096))
+
+        assert len(resampler._buffer) <= resampler.filter.taps_per_phase + 1
+
+    def test_reusable_after_flush(self):
+        """Test flush starts a fresh stream."""
+        resampler = Resampler(48000, 16000)
+        first = np.concatenate([resampler.process(noise(999)), resampler.flush()])
+        second = np.concatenate([resampler.process(noise(999)), resampler.flush()])
+
+        np.testing.assert_array_equal(first, second)
+        assert len(resampler.flush()) == 0
+
+
+def test_pipeline_uses_cached_filter():
+    """Test the pipeline resamples through the shared resampler."""
+    audio = noise(2205)
+
+    result = AudioPipeline()._resample_audio(audio, 22050, 48000)
+
+    np.testing.assert_allclose(result, resample(audio, 22050, 48000), atol=1e-6)
@@ -94,7 +94,12 @@ class TestFFmpegAvailability:
 
 
 class TestAudioConversion:
-    """Test audio conversion functionality."""
+    """Test audio conversion functionality through the FFmpeg fallback."""
+
+    @pytest.fixture(autouse=True)
+    def _ffmpeg_path(self):
+        with patch("ttskit.utils.audio._to_opus_ogg_in_process", return_value=False):
+            yield
 
     def test_to_opus_ogg_ffmpeg_not_available(self):
         """Test conversion when FFmpeg is not available."""
@@ -479,6 +484,7 @@ class TestAudioUtilsEdgeCases:
 
             with (
                 patch("ttskit.utils.audio.check_ffmpeg_available", return_value=True),
+                patch("ttskit.utils.audio._to_opus_ogg_in_process", return_value=False),
                 patch("ttskit.utils.audio.AudioSegment.from_file") as mock_from_file,
             ):
                 mock_audio = MagicMock()
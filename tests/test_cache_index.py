@@ -0,0 +1,101 @@
+"""Tests for the SQLite-backed AudioManager cache index."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ttskit.utils.audio_manager import AudioManager
+from ttskit.utils.cache_index import CacheIndexStore, close_all_stores
+from ttskit.utils.performance import cleanup_resources
+
+
+@pytest.fixture()
+def temp_dir():
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
+
+def _entry(last_accessed: float) -> dict:
+    return {
+        "format": "ogg",
+        "size": 1,
+        "created": 0.0,
+        "last_accessed": last_accessed,
+        "metadata": {"lang": "fa"},
+    }
+
+
+def test_store_round_trip_in_lru_order(temp_dir: Path):
+    store = CacheIndexStore(temp_dir / "index.sqlite3")
+    store.put("b", _entry(2.0))
+    store.put("a", _entry(1.0))
+    store.put("c", _entry(3.0))
+    store.touch("a", 4.0)
+    store.delete(["c"])
+    store.close()
+
+    reopened = CacheIndexStore(temp_dir / "index.sqlite3")
+    entries = reopened.load()
+    assert list(entries) == ["b", "a"]
+    assert entries["a"]["last_accessed"] == 4.0
+    assert entries["a"]["metadata"] == {"lang": "fa"}
+    assert len(reopened) == 2
+    reopened.close()
+
+
+async def test_cleanup_resources_flushes_touches(temp_dir: Path):
+    store = CacheIndexStore(temp_dir / "index.sqlite3")
+    store.put("a", _entry(1.0))
+    store.touch("a", 5.0)
+
+    await cleanup_resources()
+
+    reopened = CacheIndexStore(temp_dir / "index.sqlite3")
+    assert reopened.load()["a"]["last_accessed"] == 5.0
+    reopened.close()
+
+    # The store stays usable for the live AudioManager after cleanup
+    store.put("b", _entry(6.0))
+    assert len(store) == 2
+    store.close()
+
+
+def test_close_all_stores_writes_touches(temp_dir: Path):
+    store = CacheIndexStore(temp_dir / "index.sqlite3")
+    store.put("a", _entry(1.0))
+    store.touch("a", 7.0)
+
+    close_all_stores()
+    store.close()
+
+    reopened = CacheIndexStore(temp_dir / "index.sqlite3")
+    assert reopened.load()["a"]["last_accessed"] == 7.0
+    reopened.close()
+
+
+def test_manager_persists_lru_order_across_restarts(temp_dir: Path):
+    m = AudioManager(cache_dir=str(temp_dir), max_cache_size=2)
+    m._save_to_cache("k0", b"0")
+    m._save_to_cache("k1", b"1")
+    assert m._load_from_cache("k0") == b"0"
+    m._index_store.flush()
+
+    m._save_to_cache("k2", b"2")
+    assert list(m.cache_index) == ["k0", "k2"]
+    assert not (temp_dir / "k1.ogg").exists()
+
+    restarted = AudioManager(cache_dir=str(temp_dir), max_cache_size=2)
+    assert list(restarted.cache_index) == ["k0", "k2"]
+    assert not (temp_dir / "cache_index.json").exists()
+
+
+def test_manager_migrates_legacy_json_index(temp_dir: Path):
+    (temp_dir / "old.ogg").write_bytes(b"x")
+    (temp_dir / "cache_index.json").write_text(json.dumps({"old": _entry(1.0)}))
+
+    m = AudioManager(cache_dir=str(temp_dir))
+    assert m.get_from_cache("old") == b"x"
+    assert not (temp_dir / "cache_index.json").exists()
+    assert "old" in CacheIndexStore(temp_dir / "cache_index.sqlite3").load()
@@ -8,7 +8,10 @@ to achieve 100% coverage.
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from ttskit.cache import (
+    CACHE_KEY_VERSION,
     CacheInterface,
     MemoryCache,
     RedisCache,
@@ -17,6 +20,7 @@ from ttskit.cache import (
     get_cache,
     get_cache_config,
     get_cache_stats,
+    get_single_flight,
     is_cache_enabled,
     memory_cache,
     set_cache_config,
@@ -24,6 +28,20 @@ from ttskit.cache import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_caches():
+    """Drop Redis caches reused by get_cache() between tests."""
+    import ttskit.cache
+
+    ttskit.cache._redis_caches.clear()
+    ttskit.cache._async_caches.clear()
+    ttskit.cache._single_flights.clear()
+    yield
+    ttskit.cache._redis_caches.clear()
+    ttskit.cache._async_caches.clear()
+    ttskit.cache._single_flights.clear()
+
+
 class TestCacheInitImports:
     """Test that all imports work correctly."""
 
@@ -131,9 +149,20 @@ class TestCacheKey:
         key = cache_key(text, lang, engine)
 
         payload = json.dumps(
-            {"t": text, "l": lang, "e": engine},
+            {
+                "v": CACHE_KEY_VERSION,
+                "t": text,
+                "l": lang,
+                "e": engine,
+                "vo": None,
+                "r": 1.0,
+                "p": 0.0,
+                "f": None,
+                "fx": None,
+            },
             ensure_ascii=False,
             separators=(",", ":"),
+            sort_keys=True,
         )
 
         import hashlib
@@ -142,6 +171,29 @@ class TestCacheKey:
 
         assert key == expected_key
 
+    def test_cache_key_normalizes_equivalent_requests(self):
+        """Test equivalent text and engine spellings share one key."""
+        key = cache_key("سلام دنیا", "fa", None)
+
+        assert cache_key("  سلام \u200b  دنیا\n", "FA", "smart") == key
+        assert cache_key("سلام دنیا", "fa", "auto", rate=1, pitch=0) == key
+        assert cache_key("Cafe\u0301", "fr", "edge") == cache_key(
+            "Caf\u00e9", "fr", "edge"
+        )
+
+    def test_cache_key_covers_output_parameters(self):
+        """Test every parameter that changes the audio changes the key."""
+        base = cache_key("hello", "en", "edge")
+        variants = [
+            cache_key("hello", "en", "edge", voice="en-US-AriaNeural"),
+            cache_key("hello", "en", "edge", rate=1.25),
+            cache_key("hello", "en", "edge", pitch=2.0),
+            cache_key("hello", "en", "edge", output_format="mp3"),
+            cache_key("hello", "en", "edge", effects={"normalize": True}),
+        ]
+
+        assert len({base, *variants}) == len(variants) + 1
+
 
 class TestGetCache:
     """Test get_cache function."""
@@ -163,6 +215,68 @@ class TestGetCache:
             assert cache == mock_redis_instance
             mock_redis_cache.assert_called_once_with("redis://localhost:6379")
 
+    def test_get_cache_reuses_connected_redis_cache(self):
+        """Test get_cache connects once and reuses the Redis cache."""
+        with (
+            patch("ttskit.cache.REDIS_AVAILABLE", True),
+            patch("ttskit.cache.settings") as mock_settings,
+            patch("ttskit.cache.RedisCache") as mock_redis_cache,
+        ):
+            mock_settings.enable_caching = True
+            mock_settings.redis_url = "redis://localhost:6379"
+
+            first = get_cache()
+            second = get_cache()
+
+            assert first is second
+            mock_redis_cache.assert_called_once_with("redis://localhost:6379")
+
+            # A cache whose connection failed is rebuilt on the next call
+            first._client = None
+            get_cache()
+            assert mock_redis_cache.call_count == 2
+
+    def test_get_async_cache_is_shared(self):
+        """Test get_async_cache returns one AsyncRedisCache per URL."""
+        from ttskit.cache import AsyncRedisCache, get_async_cache
+
+        with (
+            patch("ttskit.cache.REDIS_AVAILABLE", True),
+            patch("ttskit.cache.settings") as mock_settings,
+            patch("ttskit.cache.RedisCache"),
+        ):
+            mock_settings.enable_caching = True
+            mock_settings.redis_url = "redis://localhost:6379"
+            mock_settings.cache_ttl = 60
+
+            cache = get_async_cache()
+
+            assert isinstance(cache, AsyncRedisCache)
+            assert get_async_cache() is cache
+
+            mock_settings.enable_caching = False
+            assert get_async_cache() is None
+
+    def test_get_async_cache_skips_unreachable_redis(self):
+        """Test get_async_cache leaves L3 out when Redis does not answer."""
+        from ttskit.cache import get_async_cache
+
+        with (
+            patch("ttskit.cache.REDIS_AVAILABLE", True),
+            patch("ttskit.cache.settings") as mock_settings,
+            patch("ttskit.cache.RedisCache") as mock_redis_cache,
+        ):
+            mock_settings.enable_caching = True
+            mock_settings.redis_url = "redis://unreachable:6379"
+            mock_settings.cache_ttl = 60
+            # RedisCache drops its client when the ping fails
+            mock_redis_cache.return_value._client = None
+
+            assert get_async_cache() is None
+
+            mock_redis_cache.side_effect = ConnectionError
+            assert get_async_cache() is None
+
     def test_get_cache_with_redis_unavailable(self):
         """Test get_cache when Redis is not available."""
         with (
@@ -217,6 +331,40 @@ class TestGetCache:
 
             assert cache == memory_cache
 
+    def test_get_single_flight_local_by_default(self):
+        """Test get_single_flight coalesces in-process unless Redis is enabled."""
+        with patch("ttskit.cache.settings") as mock_settings:
+            mock_settings.singleflight_redis = False
+            mock_settings.singleflight_lock_ttl = 10
+
+            flight = get_single_flight()
+
+            assert flight.redis_url is None
+            assert flight.lock_ttl == 10
+            assert get_single_flight() is flight
+
+    def test_get_single_flight_with_redis(self):
+        """Test get_single_flight uses a Redis lock when enabled."""
+        with (
+            patch("ttskit.cache.REDIS_AVAILABLE", True),
+            patch("ttskit.cache.settings") as mock_settings,
+            patch("ttskit.cache.RedisCache") as mock_redis_cache,
+        ):
+            mock_settings.singleflight_redis = True
+            mock_settings.singleflight_lock_ttl = 30
+            mock_settings.redis_url = "redis://localhost:6379"
+
+            flight = get_single_flight()
+
+            assert flight.redis_url == "redis://localhost:6379"
+            assert get_single_flight() is flight
+            mock_redis_cache.assert_called_once_with("redis://localhost:6379")
+
+            # A server that does not answer the ping leaves coalescing local
+            mock_settings.singleflight_lock_ttl = 10
+            mock_redis_cache.return_value._client = None
+            assert get_single_flight().redis_url is None
+
     def test_get_cache_fallback_to_memory(self):
         """Test that get_cache falls back to memory cache in all error cases."""
         error_cases = [
@@ -450,8 +598,19 @@ class TestCacheInitAll:
             "MemoryCache",
             "memory_cache",
             "RedisCache",
+            "AsyncRedisCache",
+            "SingleFlight",
+            "TieredAudioCache",
+            "TieredCacheStats",
+            "CACHE_KEY_VERSION",
             "cache_key",
+            "normalize_cache_text",
             "get_cache",
+            "get_async_cache",
+            "get_async_redis",
+            "get_redis_pool_stats",
+            "close_async_redis",
+            "get_single_flight",
             "clear_cache",
             "get_cache_stats",
             "is_cache_enabled",
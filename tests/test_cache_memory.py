@@ -1,5 +1,7 @@
 """Tests for Memory Cache."""
 
+import threading
+
 from ttskit.cache.memory import MemoryCache, memory_cache
 
 
@@ -320,3 +322,67 @@ class TestMemoryCache:
         value = cache.get("key1")
 
         assert value == unicode_value
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test the least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.keys() == ["a", "c"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        """Test the byte budget evicts old blobs and skips oversized ones."""
+        cache = MemoryCache(max_bytes=100)
+
+        cache.set("a", b"x" * 60)
+        cache.set("b", b"y" * 60)
+        assert cache.get("a") is None
+        assert cache.get("b") == b"y" * 60
+
+        cache.set("huge", b"z" * 101)
+        assert cache.get("huge") is None
+
+        stats = cache.get_stats()
+        assert stats["memory_usage_bytes"] == 60
+        assert stats["max_bytes"] == 100
+        assert stats["hit_rate"] == 33.33
+
+    def test_expired_entries_are_purged_lazily(self):
+        """Test expired entries leave the cache without a full scan on access."""
+        cache = MemoryCache()
+
+        cache.set("short", b"abc", ttl=0.001)
+        cache.set("long", b"def", ttl=3600)
+
+        import time
+
+        time.sleep(0.01)
+
+        assert cache.size() == 1
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["memory_usage_bytes"] == 3
+
+    def test_concurrent_access(self):
+        """Test concurrent writers keep the budgets and bookkeeping consistent."""
+        cache = MemoryCache(max_entries=50, max_bytes=10_000)
+
+        def worker(n):
+            for i in range(500):
+                cache.set(f"{n}-{i % 80}", b"v" * 100)
+                cache.get(f"{n}-{(i * 7) % 80}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["total_keys"] <= 50
+        assert stats["memory_usage_bytes"] == 100 * stats["total_keys"]
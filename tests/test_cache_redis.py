@@ -4,7 +4,8 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from ttskit.cache.redis import RedisCache
+from ttskit.cache import redis as redis_module
+from ttskit.cache.redis import AudioBlob, RedisCache
 
 
 class TestRedisCache:
@@ -89,7 +90,8 @@ class TestRedisCache:
 
             cache.set("key1", "value1", ttl=60)
 
-            mock_redis_instance.expire.assert_called_once()
+            assert mock_redis_instance.set.call_args.kwargs == {"ex": 60}
+            mock_redis_instance.expire.assert_not_called()
 
     def test_get_nonexistent_key(self, mock_redis):
         """Test getting non-existent key."""
@@ -668,9 +670,9 @@ class TestRedisCache:
             cache.set("dict_key", {"a": 1, "b": 2})
 
             mock_redis_instance.set.assert_called_once_with(
-                "dict_key", '{"a": 1, "b": 2}'
+                "dict_key", b'\x00TK\x01\x02\x00{"a": 1, "b": 2}', ex=3600
             )
-            mock_redis_instance.expire.assert_called_once()
+            mock_redis_instance.expire.assert_not_called()
 
     def test_set_with_list_value(self, mock_redis):
         """Test setting list value."""
@@ -685,8 +687,10 @@ class TestRedisCache:
 
             cache.set("list_key", [1, 2, 3])
 
-            mock_redis_instance.set.assert_called_once_with("list_key", "[1, 2, 3]")
-            mock_redis_instance.expire.assert_called_once()
+            mock_redis_instance.set.assert_called_once_with(
+                "list_key", b"\x00TK\x01\x02\x00[1, 2, 3]", ex=3600
+            )
+            mock_redis_instance.expire.assert_not_called()
 
     def test_set_with_none_ttl(self, mock_redis):
         """Test setting value with None TTL."""
@@ -701,8 +705,10 @@ class TestRedisCache:
 
             cache.set("key", "value", ttl=None)
 
-            mock_redis_instance.set.assert_called_once_with("key", "value")
-            mock_redis_instance.expire.assert_called_once()
+            mock_redis_instance.set.assert_called_once_with(
+                "key", b"\x00TK\x01\x01\x00value", ex=3600
+            )
+            mock_redis_instance.expire.assert_not_called()
 
     def test_set_with_no_client(self, mock_redis):
         """Test setting value when no client available."""
@@ -880,3 +886,126 @@ class TestRedisCache:
         with patch("ttskit.cache.redis.REDIS_AVAILABLE", False):
             with pytest.raises(ImportError, match="Redis package not installed"):
                 RedisCache()
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by RedisCache."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.round_trips = 0
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None):
+        self.round_trips += 1
+        self.data[key] = value
+        self.expiry[key] = ex if ex is not None else px
+        return True
+
+    def pipeline(self, transaction=True):
+        fake = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def set(self, key, value, ex=None, px=None):
+                self.commands.append((key, value, ex, px))
+
+            def execute(self):
+                fake.round_trips += 1
+                for key, value, ex, px in self.commands:
+                    fake.data[key] = value
+                    fake.expiry[key] = ex if ex is not None else px
+                return [True] * len(self.commands)
+
+        return Pipeline()
+
+
+class TestRedisCacheStorageFormat:
+    """Test cases for the typed, binary-safe value format."""
+
+    @pytest.fixture
+    def cache_and_client(self):
+        client = FakeRedis()
+        with patch("ttskit.cache.redis.redis.Redis.from_url", return_value=client):
+            yield RedisCache(), client
+
+    def test_binary_values_round_trip_verbatim(self, cache_and_client):
+        """Test bytes that look like JSON or text come back as the same bytes."""
+        cache, _ = cache_and_client
+        for payload in (b'{"a": 1}', b"OggS\x00\x02", b"\xff\xfb\x90", b""):
+            cache.set("k", payload)
+            assert cache.get("k") == payload
+
+    def test_typed_values_round_trip(self, cache_and_client):
+        """Test strings and JSON values keep their type."""
+        cache, _ = cache_and_client
+        for value in ("42", 42, 3.5, True, None, [1, "x"], {"a": {"b": 1}}):
+            cache.set("k", value)
+            assert cache.get("k", default="missing") == value
+
+    def test_audio_metadata_round_trip(self, cache_and_client):
+        """Test audio is stored with codec, sample rate and duration."""
+        cache, client = cache_and_client
+        cache.set_audio("a", b"OggS-data", "ogg", sample_rate=48000, duration=1.5)
+
+        blob = cache.get_audio("a")
+        assert blob == AudioBlob(b"OggS-data", "ogg", 48000, 1.5)
+        assert cache.get("a") == b"OggS-data"
+        assert client.expiry["a"] == 3600
+
+        cache.set("plain", b"raw")
+        assert cache.get_audio("plain") == AudioBlob(b"raw")
+        assert cache.get_audio("missing") is None
+
+    def test_legacy_values_are_still_read(self, cache_and_client):
+        """Test values written before the typed format decode as before."""
+        cache, client = cache_and_client
+        client.data["json"] = b'{"a": 1}'
+        client.data["text"] = b"plain"
+
+        assert cache.get("json") == {"a": 1}
+        assert cache.get("text") == "plain"
+
+    def test_large_text_is_compressed(self, cache_and_client):
+        """Test large non-audio values are zstd-compressed when available."""
+        if not redis_module.ZSTD_AVAILABLE:
+            pytest.skip("zstandard not installed")
+        cache, client = cache_and_client
+        value = {"text": "سلام " * 2000}
+        cache.set("big", value)
+
+        assert len(client.data["big"]) < 1000
+        assert cache.get("big") == value
+
+    def test_get_many_and_set_many_use_one_round_trip(self, cache_and_client):
+        """Test batch operations are pipelined and keep per-key stats."""
+        cache, client = cache_and_client
+        cache.set_many({"a": b"1", "b": "2", "c": [3]}, ttl=60)
+        assert client.round_trips == 1
+        assert client.expiry == {"a": 60, "b": 60, "c": 60}
+
+        found = cache.get_many(["a", "b", "c", "missing"])
+        assert client.round_trips == 2
+        assert found == {"a": b"1", "b": "2", "c": [3]}
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["sets"]) == (3, 1, 3)
+
+    def test_fractional_ttl_uses_milliseconds(self, cache_and_client):
+        """Test sub-second TTLs are sent as PX."""
+        cache, client = cache_and_client
+        cache.set("k", "v", ttl=0.25)
+        assert client.expiry["k"] == 250
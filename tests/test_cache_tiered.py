@@ -0,0 +1,133 @@
+"""Tests for the tiered (memory/disk/Redis) audio cache."""
+
+import threading
+
+from ttskit.cache.memory import MemoryCache
+from ttskit.cache.redis import AudioBlob
+from ttskit.cache.tiered import TieredAudioCache
+
+
+class FakeDisk:
+    """Stand-in for AudioManager's cache methods."""
+
+    def __init__(self):
+        self.files = {}
+        self.formats = {}
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_from_cache(self, key):
+        return self.files.get(key)
+
+    def save_to_cache(self, key, data, format="ogg"):
+        self.release.wait(5)
+        self.files[key] = data
+        self.formats[key] = format
+
+
+class FakeRedis:
+    """Stand-in for AsyncRedisCache."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+        self.codecs = {}
+
+    async def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    async def get_audio(self, key):
+        if key not in self.data:
+            return None
+        return AudioBlob(self.data[key], self.codecs.get(key, ""))
+
+    async def set_audio(self, key, data, codec, sample_rate=0, duration=0.0, ttl=None):
+        if self.fail:
+            raise ConnectionError("down")
+        self.data[key] = data
+        self.codecs[key] = codec
+        return True
+
+
+def make_cache(**kwargs):
+    tiers = {"memory": MemoryCache(), "disk": FakeDisk(), "redis": FakeRedis()}
+    tiers.update(kwargs)
+    return TieredAudioCache(**tiers)
+
+
+class TestTieredAudioCache:
+    """Test cases for TieredAudioCache."""
+
+    async def test_redis_hit_is_promoted(self):
+        """Test an L3 hit fills L1 and is written back to disk."""
+        cache = make_cache()
+        cache.redis.data["k"] = b"audio"
+
+        assert await cache.get("k") == b"audio"
+        await cache.flush()
+
+        assert cache.memory.get("k") == b"audio"
+        assert cache.disk.files["k"] == b"audio"
+        assert await cache.get("k") == b"audio"
+
+        stats = cache.get_stats()
+        assert stats["l1"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+        assert stats["l2"]["misses"] == 1
+        assert stats["l3"]["hits"] == 1
+        assert stats["hit_ratio"] == 1.0
+
+    async def test_redis_hit_keeps_codec(self):
+        """Test an L3 hit is written to disk with the codec Redis stored."""
+        cache = make_cache()
+        await cache.redis.set_audio("k", b"audio", "mp3")
+
+        await cache.get("k")
+        await cache.flush()
+
+        assert cache.disk.formats["k"] == "mp3"
+
+    async def test_disk_hit_is_promoted(self):
+        """Test an L2 hit fills L1 without touching Redis."""
+        cache = make_cache()
+        cache.disk.files["k"] = b"audio"
+
+        assert await cache.get("k") == b"audio"
+
+        assert cache.memory.get("k") == b"audio"
+        assert cache.get_stats()["l3"] == {"hits": 0, "misses": 0, "hit_ratio": 0.0}
+
+    async def test_miss_in_every_tier(self):
+        """Test a full miss returns None and counts a miss per tier."""
+        cache = make_cache()
+
+        assert await cache.get("missing") is None
+        stats = cache.get_stats()
+        assert [stats[tier]["misses"] for tier in ("l1", "l2", "l3")] == [1, 1, 1]
+        assert stats["hit_ratio"] == 0.0
+
+    async def test_set_does_not_wait_for_slow_tiers(self):
+        """Test set returns while the disk write is still blocked."""
+        cache = make_cache()
+        cache.disk.release.clear()
+
+        await cache.set("k", b"audio")
+
+        assert cache.memory.get("k") == b"audio"
+        assert "k" not in cache.disk.files
+        assert cache.get_stats()["pending_writes"] >= 1
+
+        cache.disk.release.set()
+        await cache.flush()
+        assert cache.disk.files["k"] == b"audio"
+        assert cache.redis.data["k"] == b"audio"
+        assert cache.get_stats()["write_behind"] == {"writes": 2, "failures": 0}
+
+    async def test_write_behind_failure_is_counted(self):
+        """Test a failing tier write is logged and counted, not raised."""
+        cache = make_cache(redis=FakeRedis(fail=True), disk=None)
+
+        await cache.set("k", b"audio")
+        await cache.flush()
+
+        assert cache.memory.get("k") == b"audio"
+        assert cache.get_stats()["write_behind"] == {"writes": 0, "failures": 1}
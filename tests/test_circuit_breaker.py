@@ -0,0 +1,88 @@
+"""Tests for engine circuit breakers."""
+
+from ttskit.engines.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the breaker opens after the configured consecutive failures."""
+        breaker = CircuitBreaker("edge", failure_threshold=3)
+
+        breaker.record_failure(RuntimeError("boom"))
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.state == CLOSED
+        breaker.record_success()
+        breaker.record_failure(RuntimeError("boom"))
+        breaker.record_failure(RuntimeError("boom"))
+        assert breaker.state == CLOSED
+
+        breaker.record_failure(RuntimeError("timeout"))
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.get_stats()["last_error"] == "timeout"
+
+    def test_opens_on_error_rate(self):
+        """Test the breaker opens on a high error rate without a failure streak."""
+        breaker = CircuitBreaker(
+            "edge", failure_threshold=10, error_rate_threshold=0.5, min_requests=6
+        )
+
+        for _ in range(2):
+            breaker.record_success()
+            breaker.record_failure("error")
+        assert breaker.state == CLOSED
+
+        breaker.record_success()
+        breaker.record_failure("error")
+        assert breaker.state == OPEN
+        assert breaker.get_stats()["error_rate"] == 0.5
+
+    def test_half_open_probe_closes_or_reopens(self):
+        """Test probes are limited while half-open and decide the next state."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "edge", failure_threshold=1, recovery_timeout=10.0, clock=clock
+        )
+
+        breaker.record_failure("down")
+        assert breaker.state == OPEN
+        clock.now = 5.0
+        assert not breaker.allow_request()
+        assert breaker.get_stats()["retry_in"] == 5.0
+
+        clock.now = 10.0
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure("still down")
+        assert breaker.state == OPEN
+
+        clock.now = 20.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
+        assert breaker.get_stats()["consecutive_failures"] == 0
+
+    def test_reset(self):
+        """Test reset closes the breaker and clears the last error."""
+        breaker = CircuitBreaker("edge", failure_threshold=1)
+        breaker.record_failure("down")
+
+        breaker.reset()
+
+        assert breaker.state == CLOSED
+        assert breaker.last_error is None
@@ -27,6 +27,11 @@ def _stub_edge_module(monkeypatch: pytest.MonkeyPatch) -> None:
         async def save(self, path: str) -> None:
             Path(path).write_bytes(b"ID3\x03\x00\x00\x00\x00\x00\x21dummy")
 
+        async def stream(self):
+            yield {"type": "audio", "data": b"ID3\x03"}
+            yield {"type": "WordBoundary", "offset": 0, "duration": 1, "text": "x"}
+            yield {"type": "audio", "data": self.voice.encode()}
+
     monkeypatch.setattr(edge_engine_module, "EDGE_AVAILABLE", True, raising=True)
     monkeypatch.setattr(
         edge_engine_module,
@@ -75,3 +80,120 @@ def test_edge_voice_override_env(monkeypatch: pytest.MonkeyPatch) -> None:
 
     e = EdgeEngine(default_lang="en")
     assert e._pick_voice("fa").startswith("fa-")
+
+
+@pytest.mark.asyncio
+async def test_edge_synth_async_collects_stream_in_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that synth_async joins streamed audio chunks without touching temp files.
+
+    Parameters:
+        monkeypatch: Pytest fixture for setting up Edge module stubs.
+
+    Behavior:
+        Verifies metadata events are skipped, the requested voice is honoured and synth_to_mp3 is never called.
+    """
+    _stub_edge_module(monkeypatch)
+    from ttskit.engines.edge_engine import EdgeEngine
+
+    engine = EdgeEngine(default_lang="en")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("synth_to_mp3 should not be used by synth_async")
+
+    monkeypatch.setattr(engine, "synth_to_mp3", _fail)
+
+    data = await engine.synth_async("hello", "en", voice="en-GB-SoniaNeural")
+    assert data == b"ID3\x03en-GB-SoniaNeural"
+
+    chunks = [chunk async for chunk in engine.synth_stream_async("hello", "fa")]
+    assert chunks == [b"ID3\x03", b"fa-IR-DilaraNeural"]
+
+
+@pytest.mark.asyncio
+async def test_edge_stream_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a stalled Edge stream is aborted after save_timeout_seconds.
+
+    Parameters:
+        monkeypatch: Pytest fixture for setting up Edge module stubs.
+
+    Behavior:
+        Replaces Communicate with a stream that never finishes and expects TTSKitNetworkError.
+    """
+    import asyncio
+
+    import ttskit.engines.edge_engine as edge_engine_module
+    from ttskit.exceptions import TTSKitNetworkError
+
+    class StalledCommunicate:
+        def __init__(self, text: str, voice: str) -> None:
+            pass
+
+        async def stream(self):
+            yield {"type": "audio", "data": b"ID3"}
+            await asyncio.sleep(10)
+            yield {"type": "audio", "data": b"late"}
+
+    monkeypatch.setattr(edge_engine_module, "EDGE_AVAILABLE", True, raising=True)
+    monkeypatch.setattr(
+        edge_engine_module,
+        "edge_tts",
+        type("X", (), {"Communicate": StalledCommunicate}),
+        raising=True,
+    )
+
+    engine = edge_engine_module.EdgeEngine(default_lang="en", save_timeout_seconds=0)
+    engine.save_timeout_seconds = 0.05
+
+    received = []
+    with pytest.raises(TTSKitNetworkError):
+        async for chunk in engine.synth_stream_async("hello", "en"):
+            received.append(chunk)
+    assert received == [b"ID3"]
+
+
+@pytest.mark.asyncio
+async def test_edge_stream_timeout_ignores_consumer_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that a slow consumer does not use up the Edge timeout.
+
+    Parameters:
+        monkeypatch: Pytest fixture for setting up Edge module stubs.
+
+    Behavior:
+        Sleeps between chunks for longer than save_timeout_seconds in total and
+        expects the full stream; a stalled synth_async raises TTSKitNetworkError.
+    """
+    import asyncio
+
+    import ttskit.engines.edge_engine as edge_engine_module
+    from ttskit.exceptions import TTSKitNetworkError
+
+    _stub_edge_module(monkeypatch)
+    engine = edge_engine_module.EdgeEngine(default_lang="en")
+    engine.save_timeout_seconds = 0.05
+
+    received = []
+    async for chunk in engine.synth_stream_async("hello", "en", voice="v"):
+        received.append(chunk)
+        await asyncio.sleep(0.04)
+    assert received == [b"ID3\x03", b"v"]
+
+    class StalledCommunicate:
+        def __init__(self, text: str, voice: str) -> None:
+            pass
+
+        async def stream(self):
+            await asyncio.sleep(10)
+            yield {"type": "audio", "data": b"late"}
+
+    monkeypatch.setattr(
+        edge_engine_module,
+        "edge_tts",
+        type("X", (), {"Communicate": StalledCommunicate}),
+        raising=True,
+    )
+    with pytest.raises(TTSKitNetworkError):
+        await engine.synth_async("hello", "en")
@@ -690,6 +690,52 @@ class TestTTSEngine:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    @pytest.mark.asyncio
+    async def test_synth_stream_async_default_single_chunk(self):
+        """Test the default synth_stream_async yields synth_async output as one chunk."""
+
+        class ConcreteEngine(TTSEngine):
+            def synth_to_mp3(self, text: str, lang: str | None = None) -> str:
+                return "test.mp3"
+
+            async def synth_async(
+                self,
+                text: str,
+                lang: str | None = None,
+                voice: str | None = None,
+                rate: float = 1.0,
+                pitch: float = 0.0,
+            ) -> bytes:
+                return f"{text}|{voice}|{rate}".encode()
+
+            def get_capabilities(self) -> EngineCapabilities:
+                return EngineCapabilities(
+                    offline=False,
+                    ssml=False,
+                    rate_control=False,
+                    pitch_control=False,
+                    languages=["en"],
+                    voices=[],
+                    max_text_length=100,
+                )
+
+            def list_voices(self, lang: str | None = None) -> list[str]:
+                return ["voice1"]
+
+            def is_available(self) -> bool:
+                return True
+
+        engine = ConcreteEngine()
+
+        chunks = [
+            chunk
+            async for chunk in engine.synth_stream_async(
+                "Hello", "en", voice="voice1", rate=1.5
+            )
+        ]
+
+        assert chunks == [b"Hello|voice1|1.5"]
+
     def test_synth_to_file_sync(self):
         """Test synth_to_file method."""
 
@@ -213,11 +213,24 @@ class TestEngineFactoryBranchCoverage:
         with patch("ttskit.config.settings") as mock_settings:
             mock_settings.piper_model_path = "/path/to/model"
             mock_settings.piper_use_cuda = True
+            mock_settings.piper_max_loaded_voices = 2
+            mock_settings.piper_max_loaded_mb = 300
+            mock_settings.piper_preload_voices = "fa_IR-amir-medium"
+            mock_settings.piper_workers = 4
+            mock_settings.piper_intra_op_threads = 1
+            mock_settings.piper_sentence_silence = 0.2
 
             factory.setup_registry(mock_registry)
 
             mock_piper_class.assert_called_once_with(
-                model_path="/path/to/model", use_cuda=True
+                model_path="/path/to/model",
+                use_cuda=True,
+                max_loaded_voices=2,
+                max_loaded_bytes=300 * 1024 * 1024,
+                preload_voices="fa_IR-amir-medium",
+                workers=4,
+                intra_op_threads=1,
+                sentence_silence=0.2,
             )
             mock_registry.register_engine.assert_called_once()
 
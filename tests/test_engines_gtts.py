@@ -3,6 +3,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from httpx import AsyncClient as RealAsyncClient
 
 from ttskit.engines.gtts_engine import GTTSEngine
 
@@ -102,26 +103,24 @@ class TestGTTSEngine:
         """Test async synthesis."""
         engine = GTTSEngine()
 
-        with patch.object(engine, "synth_to_mp3") as mock_synth:
-            mock_synth.return_value = "/tmp/test.mp3"
+        with patch.object(engine, "_fetch_segments") as mock_fetch:
+            mock_fetch.return_value = [b"fake ", b"audio data"]
 
-            with patch("builtins.open", mock_open(b"fake audio data")):
-                result = await engine.synth_async("Hello world", "en")
+            result = await engine.synth_async("Hello world", "en")
 
-                assert isinstance(result, bytes)
-                assert len(result) > 0
+            assert result == b"fake audio data"
+            mock_fetch.assert_called_once_with("Hello world", "en")
 
     def test_synth_roadmap_signature(self):
         """Test roadmap synth method signature."""
         engine = GTTSEngine()
 
-        with patch.object(engine, "synth_to_mp3") as mock_synth:
-            mock_synth.return_value = "/tmp/test.mp3"
+        with patch.object(engine, "_fetch_segments") as mock_fetch:
+            mock_fetch.return_value = [b"fake audio data"]
 
-            with patch("builtins.open", mock_open(b"fake audio data")):
-                result = engine.synth("Hello world", "en", "default", "1.0", "0.0")
+            result = engine.synth("Hello world", "en", "default", "1.0", "0.0")
 
-                assert isinstance(result, bytes)
+            assert isinstance(result, bytes)
 
     def test_get_info(self):
         """Test engine info."""
@@ -145,6 +144,161 @@ class TestGTTSEngine:
         engine.set_available(True)
         assert engine.is_available()
 
+    @pytest.mark.asyncio
+    async def test_synth_async_fetches_segments_concurrently(self):
+        """Test segments are fetched in parallel from a local server and joined in order."""
+        import asyncio as real_asyncio
+        import base64
+        import json
+        import threading
+        import urllib.parse
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        import httpx
+        from gtts import gTTS as RealGTTS
+
+        from ttskit.utils.performance import ConnectionPool, PerformanceConfig
+
+        # Every handler waits until all three segment requests are in flight
+        barrier = threading.Barrier(3, timeout=5)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                rpc = urllib.parse.parse_qs(body.decode())["f.req"][0]
+                segment = json.loads(json.loads(rpc)[0][0][1])[0]
+                barrier.wait()
+                payload = base64.b64encode(f"<{segment[:9]}>".encode()).decode()
+                response = f')]}}\'\n\n[["wrb.fr","jQ1olc","[\\"{payload}\\"]"]]'
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(response.encode())
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        text = " ".join(
+            f"Segment {word} tells how the quick brown fox jumps over the lazy dog today."
+            for word in ("one", "two", "six")
+        )
+        engine = GTTSEngine(
+            endpoint=f"http://127.0.0.1:{server.server_port}/batchexecute"
+        )
+        try:
+            # conftest mocks httpx clients globally; use the real one captured at import
+            with (
+                patch("httpx.AsyncClient", RealAsyncClient),
+                patch("ttskit.utils.performance.httpx", httpx),
+                patch("ttskit.utils.performance.asyncio", real_asyncio),
+            ):
+                pool = ConnectionPool(PerformanceConfig())
+                with (
+                    patch("ttskit.engines.gtts_engine.gTTS", RealGTTS),
+                    patch(
+                        "ttskit.engines.gtts_engine.get_connection_pool",
+                        return_value=pool,
+                    ),
+                ):
+                    result = await engine.synth_async(text, "en")
+                await pool.close_all()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result == b"<Segment o><Segment t><Segment s>"
+
+    def test_synth_async_across_event_loops(self):
+        """Test the shared pool keeps working across separate asyncio.run calls."""
+        import asyncio as real_asyncio
+        import base64
+        import json
+        import threading
+        import urllib.parse
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        import httpx
+        from gtts import gTTS as RealGTTS
+
+        from ttskit.utils.performance import ConnectionPool, PerformanceConfig
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                rpc = urllib.parse.parse_qs(body.decode())["f.req"][0]
+                segment = json.loads(json.loads(rpc)[0][0][1])[0]
+                payload = base64.b64encode(f"<{segment[:9]}>".encode()).decode()
+                response = f')]}}\'\n\n[["wrb.fr","jQ1olc","[\\"{payload}\\"]"]]'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response.encode())
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        text = " ".join(
+            f"Segment {word} tells how the quick brown fox jumps over the lazy dog today."
+            for word in ("one", "two")
+        )
+        engine = GTTSEngine(
+            endpoint=f"http://127.0.0.1:{server.server_port}/batchexecute"
+        )
+        # One request at a time, so the second segment waits on the semaphore
+        pool = ConnectionPool(PerformanceConfig(max_concurrent_requests=1))
+        try:
+            with (
+                patch("httpx.AsyncClient", RealAsyncClient),
+                patch("ttskit.utils.performance.httpx", httpx),
+                patch("ttskit.utils.performance.asyncio", real_asyncio),
+                patch("ttskit.engines.gtts_engine.gTTS", RealGTTS),
+                patch(
+                    "ttskit.engines.gtts_engine.get_connection_pool",
+                    return_value=pool,
+                ),
+            ):
+                results = [
+                    real_asyncio.run(engine.synth_async(text, "en")) for _ in range(2)
+                ]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert results == [b"<Segment o><Segment t>"] * 2
+
+    @pytest.mark.asyncio
+    async def test_synth_async_without_prepare_requests(self):
+        """Test gTTS releases without _prepare_requests fall back to write_to_fp."""
+
+        class PublicOnlyGTTS:
+            def __init__(self, text, lang):
+                self.text = text
+
+            def write_to_fp(self, fp):
+                fp.write(b"ID3" + self.text.encode())
+
+        engine = GTTSEngine()
+        with patch("ttskit.engines.gtts_engine.gTTS", PublicOnlyGTTS):
+            result = await engine.synth_async("hello", "en")
+
+        assert result == b"ID3hello"
+
+    def test_decode_segment_without_audio(self):
+        """Test a response without an audio payload is rejected."""
+        from ttskit.exceptions import TTSKitEngineError
+
+        with pytest.raises(TTSKitEngineError):
+            GTTSEngine._decode_segment(')]}\'\n\n[["wrb.fr","other",null]]')
+
 
 def mock_open(data):
     """Mock open function for testing."""
@@ -0,0 +1,63 @@
+"""Tests for streaming latency statistics."""
+
+import pytest
+
+from ttskit.engines.latency_stats import LatencyStats
+
+
+class TestLatencyStats:
+    """Test cases for LatencyStats."""
+
+    def test_empty_stats(self):
+        """Test statistics before anything was recorded."""
+        stats = LatencyStats()
+
+        assert stats.total == 0
+        assert stats.success_rate == 0.0
+        assert stats.percentile(95) is None
+        assert stats.to_dict()["p95_latency"] == 0.0
+
+    def test_ewma_and_counters(self):
+        """Test the EWMA moves towards new samples and counters add up."""
+        stats = LatencyStats(alpha=0.5)
+
+        stats.record_success(1.0)
+        stats.record_success(3.0)
+        stats.record_failure()
+
+        assert stats.ewma == pytest.approx(2.0)
+        assert stats.successes == 2
+        assert stats.failures == 1
+        assert stats.success_rate == pytest.approx(2 / 3)
+        assert (stats.min_latency, stats.max_latency) == (1.0, 3.0)
+
+    def test_ring_buffer_percentiles(self):
+        """Test percentiles only cover the most recent window."""
+        stats = LatencyStats(window=10)
+
+        for value in range(1, 21):
+            stats.record_success(float(value))
+
+        assert stats.sample_count == 10
+        assert stats.percentile(50) == 15.0
+        assert stats.percentile(95) == 20.0
+        assert stats.percentile(0) == 11.0
+
+    def test_score_is_cached_until_update(self):
+        """Test the routing score is invalidated by new outcomes."""
+        stats = LatencyStats(alpha=1.0)
+        stats.record_success(0.4)
+
+        assert stats.score == pytest.approx(1.0 / 0.5)
+        stats.record_failure()
+        assert stats.score == pytest.approx(0.5 / 0.5)
+
+    def test_cancelled_latency_is_not_an_outcome(self):
+        """Test record_latency adds a sample without counting a request."""
+        stats = LatencyStats()
+
+        stats.record_latency(5.0)
+
+        assert stats.total == 0
+        assert stats.sample_count == 1
+        assert stats.percentile(95) == 5.0
@@ -13,13 +13,17 @@ import pytest
 
 from ttskit.utils.performance import (
     ConnectionPool,
+    ManagedExecutor,
     MemoryOptimizer,
     ParallelProcessor,
     PerformanceConfig,
     PerformanceMonitor,
     cleanup_resources,
     get_connection_pool,
+    get_executor,
+    get_executor_stats,
     get_performance_monitor,
+    shutdown_executors,
 )
 
 
@@ -498,6 +502,95 @@ class TestPerformanceMonitor:
         assert stats["available_mb"] == 500.0
 
 
+class TestManagedExecutor:
+    """Test cases for ManagedExecutor."""
+
+    def test_stats_track_queue_and_utilization(self):
+        """Test queued, active and completed counts follow job progress."""
+        import threading
+
+        executor = ManagedExecutor("test", max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking_job():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        try:
+            first = executor.submit(blocking_job)
+            second = executor.submit(lambda: 1 / 0)
+            assert started.wait(5)
+
+            stats = executor.get_stats()
+            assert stats["max_workers"] == 1
+            assert stats["active"] == 1
+            assert stats["queued"] == 1
+            assert stats["utilization"] == 1.0
+
+            release.set()
+            assert first.result(5) == "done"
+            with pytest.raises(ZeroDivisionError):
+                second.result(5)
+
+            stats = executor.get_stats()
+            assert stats["active"] == 0
+            assert stats["queued"] == 0
+            assert stats["completed"] == 2
+            assert stats["failed"] == 1
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_cancelled_jobs_leave_the_queue(self):
+        """Test jobs cancelled before starting are no longer counted as queued."""
+        import threading
+
+        executor = ManagedExecutor("cancel", max_workers=1)
+        release = threading.Event()
+        try:
+            running = executor.submit(release.wait, 5)
+            waiting = [executor.submit(print) for _ in range(5)]
+            assert all(future.cancel() for future in waiting)
+            assert executor.get_stats()["queued"] == 0
+
+            executor.submit(print)
+            executor.shutdown(wait=False, cancel_futures=True)
+            assert executor.get_stats()["queued"] == 0
+        finally:
+            release.set()
+            executor.shutdown()
+        assert running.result(5) is True
+        assert executor.get_stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_usable_with_run_in_executor(self):
+        """Test the executor works as an event loop executor."""
+        loop = asyncio.get_running_loop()
+        executor = ManagedExecutor("loop", max_workers=2)
+        try:
+            assert await loop.run_in_executor(executor, sum, [1, 2, 3]) == 6
+        finally:
+            executor.shutdown()
+
+    def test_registry_reuses_and_shuts_down_pools(self):
+        """Test named pools are shared, bounded and recreated after shutdown."""
+        shutdown_executors()
+
+        edge_pool = get_executor("edge")
+        assert get_executor("edge") is edge_pool
+        assert get_executor("custom", max_workers=3).max_workers == 3
+        assert set(get_executor_stats()) == {"edge", "custom"}
+
+        shutdown_executors()
+        assert get_executor_stats() == {}
+        with pytest.raises(RuntimeError):
+            edge_pool.submit(print)
+        assert get_executor("edge") is not edge_pool
+        shutdown_executors()
+
+
 class TestGlobalFunctions:
     """Test cases for global utility functions."""
 
@@ -529,9 +622,13 @@ class TestGlobalFunctions:
         pool = get_connection_pool()
         monitor = get_performance_monitor()
 
-        with patch.object(pool, "close_all") as mock_close:
+        with (
+            patch.object(pool, "close_all") as mock_close,
+            patch("ttskit.audio.ffmpeg_pool.shutdown_ffmpeg_pool") as mock_ffmpeg,
+        ):
             await cleanup_resources()
             mock_close.assert_called_once()
+            mock_ffmpeg.assert_called_once()
 
     def test_global_instances_singleton(self):
         """Test that global instances are singletons."""
@@ -1138,7 +1138,7 @@ class TestPiperEngine:
         # If voices are loaded, test the loading process
         if engine.available_voices:
             assert len(engine.available_voices) > 0
-            assert len(engine.voices) > 0
+            assert len(engine.voice_files) > 0
             assert engine._available is True
 
     @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
@@ -1537,7 +1537,7 @@ class TestPiperEngine:
         # If voices are loaded, test the loading process
         if engine.available_voices:
             assert len(engine.available_voices) > 0
-            assert len(engine.voices) > 0
+            assert len(engine.voice_files) > 0
             assert engine._available is True
 
     @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
@@ -1630,7 +1630,7 @@ class TestPiperEngine:
 
         try:
             # Test voice access
-            voice = engine.voices[voice_name]
+            voice = engine._get_voice(voice_name)
             assert voice is not None
 
             result = engine._synth_sync_to_bytes("Hello World", voice_name)
@@ -1959,7 +1959,7 @@ class TestPiperEngine:
         # If voices are loaded, test the loading process
         if engine.available_voices:
             assert len(engine.available_voices) > 0
-            assert len(engine.voices) > 0
+            assert len(engine.voice_files) > 0
             assert engine._available is True
 
     @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
@@ -2052,7 +2052,7 @@ class TestPiperEngine:
 
         try:
             # Test voice access
-            voice = engine.voices[voice_name]
+            voice = engine._get_voice(voice_name)
             assert voice is not None
 
             result = engine._synth_sync_to_bytes("Hello World", voice_name)
@@ -2381,7 +2381,7 @@ class TestPiperEngine:
         # If voices are loaded, test the loading process
         if engine.available_voices:
             assert len(engine.available_voices) > 0
-            assert len(engine.voices) > 0
+            assert len(engine.voice_files) > 0
             assert engine._available is True
 
     @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
@@ -2474,7 +2474,7 @@ class TestPiperEngine:
 
         try:
             # Test voice access
-            voice = engine.voices[voice_name]
+            voice = engine._get_voice(voice_name)
             assert voice is not None
 
             result = engine._synth_sync_to_bytes("Hello World", voice_name)
@@ -2632,3 +2632,204 @@ class TestPiperEngine:
         assert engine.default_lang == "en"
         assert hasattr(engine, "validate_input")
         assert hasattr(engine, "get_capabilities")
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    async def test_synth_stream_async_yields_header_then_sentences(self):
+        """Test streaming synthesis yields a WAV header followed by per-sentence PCM."""
+        from types import SimpleNamespace
+
+        class FakeVoice:
+            def synthesize(self, text, syn_config=None):
+                for pcm in (b"\x01\x00" * 4, b"\x02\x00" * 2):
+                    yield SimpleNamespace(sample_rate=16000, audio_int16_bytes=pcm)
+
+        engine = PiperEngine()
+        engine.voices["en_US-test-low"] = FakeVoice()
+        engine.available_voices.append("en_US-test-low")
+
+        chunks = [
+            chunk
+            async for chunk in engine.synth_stream_async(
+                "One. Two.", "en", voice="en_US-test-low"
+            )
+        ]
+
+        assert len(chunks) == 3
+        header = chunks[0]
+        assert header.startswith(b"RIFF") and header[8:12] == b"WAVE"
+        assert int.from_bytes(header[24:28], "little") == 16000
+        assert chunks[1:] == [b"\x01\x00" * 4, b"\x02\x00" * 2]
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    async def test_synth_stream_async_voice_not_found(self):
+        """Test streaming synthesis raises when the voice is unknown."""
+        engine = PiperEngine()
+
+        with pytest.raises(ValueError, match="No Piper voice found"):
+            async for _ in engine.synth_stream_async("Hello", "en", voice="missing"):
+                pass
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    def test_voices_discovered_without_loading(self, tmp_path):
+        """Test voices are discovered from files and configs but loaded lazily."""
+        from unittest.mock import patch
+
+        (tmp_path / "fa_IR-amir-medium.onnx").write_bytes(b"x" * 10)
+        (tmp_path / "fa_IR-amir-medium.onnx.json").write_text(
+            '{"audio": {"sample_rate": 22050}}'
+        )
+        (tmp_path / "en_US-lessac-low.onnx").write_bytes(b"x" * 20)
+
+        with patch("ttskit.engines.piper_engine.PiperVoice") as mock_voice_cls:
+            engine = PiperEngine(model_path=str(tmp_path))
+
+            mock_voice_cls.load.assert_not_called()
+            assert engine.available_voices == ["en_US-lessac-low", "fa_IR-amir-medium"]
+            assert engine.voices == {}
+            assert engine.is_available() is True
+            assert engine.configs["fa_IR-amir-medium"]["audio"]["sample_rate"] == 22050
+            assert engine.configs["en_US-lessac-low"] == {}
+
+            voice = engine._get_voice("fa_IR-amir-medium")
+            assert voice is engine._get_voice("fa_IR-amir-medium")
+            mock_voice_cls.load.assert_called_once()
+            assert engine.get_model_info("fa_IR-amir-medium")["loaded"] is True
+            assert engine.get_model_info("en_US-lessac-low")["loaded"] is False
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    def test_loaded_voices_lru_eviction(self, tmp_path):
+        """Test loaded voices are bounded by count and by model size."""
+        from unittest.mock import MagicMock, patch
+
+        for name, size in (("a_A-x-low", 100), ("b_B-x-low", 100), ("c_C-x-low", 300)):
+            (tmp_path / f"{name}.onnx").write_bytes(b"x" * size)
+
+        with patch("ttskit.engines.piper_engine.PiperVoice") as mock_voice_cls:
+            mock_voice_cls.load.side_effect = lambda *a, **k: MagicMock()
+
+            engine = PiperEngine(model_path=str(tmp_path), max_loaded_voices=2)
+            engine._get_voice("a_A-x-low")
+            engine._get_voice("b_B-x-low")
+            engine._get_voice("a_A-x-low")
+            engine._get_voice("c_C-x-low")
+            assert list(engine.voices) == ["a_A-x-low", "c_C-x-low"]
+
+            engine = PiperEngine(model_path=str(tmp_path), max_loaded_bytes=250)
+            engine._get_voice("a_A-x-low")
+            engine._get_voice("b_B-x-low")
+            assert engine.loaded_bytes() == 200
+            engine._get_voice("c_C-x-low")
+            # The most recently used voice stays loaded even if it alone exceeds the budget
+            assert list(engine.voices) == ["c_C-x-low"]
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    def test_voice_load_does_not_block_loaded_voices(self, tmp_path):
+        """Test a slow model load only holds up callers of that voice."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import MagicMock, patch
+
+        for name in ("a_A-x-low", "b_B-x-low"):
+            (tmp_path / f"{name}.onnx").write_bytes(b"x")
+        started = threading.Event()
+        release = threading.Event()
+
+        def _load(path, **kwargs):
+            if "b_B" in path:
+                started.set()
+                release.wait(5)
+            return MagicMock()
+
+        with patch("ttskit.engines.piper_engine.PiperVoice") as mock_voice_cls:
+            mock_voice_cls.load.side_effect = _load
+            engine = PiperEngine(model_path=str(tmp_path))
+            loaded = engine._get_voice("a_A-x-low")
+
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                slow = [pool.submit(engine._get_voice, "b_B-x-low") for _ in range(2)]
+                assert started.wait(5)
+                try:
+                    fast = pool.submit(engine._get_voice, "a_A-x-low")
+                    assert fast.result(1) is loaded
+                finally:
+                    release.set()
+                assert slow[0].result(5) is slow[1].result(5)
+
+            assert mock_voice_cls.load.call_count == 2
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    def test_preload_and_failed_load(self, tmp_path):
+        """Test preloading voices and dropping only voices whose model is corrupt."""
+        from unittest.mock import MagicMock, patch
+
+        from ttskit.exceptions import TTSKitEngineError
+
+        class InvalidProtobuf(Exception):  # noqa: N818 - onnxruntime's name
+            """Stand-in for the onnxruntime error raised for a corrupt model."""
+
+        (tmp_path / "fa_IR-amir-medium.onnx").write_bytes(b"x")
+        (tmp_path / "en_US-broken-low.onnx").write_bytes(b"x")
+        (tmp_path / "en_US-flaky-low.onnx").write_bytes(b"x")
+        failures = {"flaky": [MemoryError("out of memory")]}
+
+        def _load(path, **kwargs):
+            if "broken" in path:
+                raise InvalidProtobuf("invalid model")
+            if "flaky" in path and failures["flaky"]:
+                raise failures["flaky"].pop()
+            return MagicMock()
+
+        with patch("ttskit.engines.piper_engine.PiperVoice") as mock_voice_cls:
+            mock_voice_cls.load.side_effect = _load
+            engine = PiperEngine(
+                model_path=str(tmp_path), preload_voices="fa_IR-amir-medium, missing"
+            )
+            assert list(engine.voices) == ["fa_IR-amir-medium"]
+
+            with pytest.raises(TTSKitEngineError):
+                engine._get_voice("en_US-broken-low")
+            assert "en_US-broken-low" not in engine.available_voices
+
+            # A transient failure keeps the voice, so the next request can load it
+            with pytest.raises(TTSKitEngineError):
+                engine._get_voice("en_US-flaky-low")
+            assert "en_US-flaky-low" in engine.available_voices
+            assert engine._get_voice("en_US-flaky-low") is not None
+
+    @pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+    async def test_synth_pcm_async_uses_voice_sample_rate(self, tmp_path):
+        """Test PCM synthesis keeps the voice's native sample rate end to end."""
+        import io
+        import wave
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, patch
+
+        from ttskit.audio.pcm import PCMBuffer
+
+        (tmp_path / "en_US-test-low.onnx").write_bytes(b"x")
+        (tmp_path / "en_US-test-low.onnx.json").write_text(
+            '{"audio": {"sample_rate": 16000}}'
+        )
+
+        voice = MagicMock()
+        voice.config = SimpleNamespace(sample_rate=16000)
+        voice.synthesize.return_value = [
+            SimpleNamespace(sample_rate=16000, audio_int16_bytes=b"\x01\x00" * 4)
+        ]
+
+        with patch("ttskit.engines.piper_engine.PiperVoice") as mock_voice_cls:
+            mock_voice_cls.load.return_value = voice
+            engine = PiperEngine(model_path=str(tmp_path))
+            assert engine._voice_sample_rate("en_US-test-low") == 16000
+
+            pcm = await engine.synth_pcm_async("Hello", "en")
+            assert isinstance(pcm, PCMBuffer)
+            assert pcm.sample_rate == 16000
+            assert pcm.frames == 4
+
+            audio = await engine.synth_async("Hello", "en")
+            with wave.open(io.BytesIO(audio), "rb") as wav_file:
+                assert wav_file.getframerate() == 16000
+
+        with wave.open(io.BytesIO(engine._raw_audio_to_wav(b"\x00\x00", 16000))) as f:
+            assert f.getframerate() == 16000
@@ -0,0 +1,201 @@
+"""Tests for the Piper process pool backend."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ttskit.engines import piper_pool
+from ttskit.engines.piper_engine import PIPER_AVAILABLE, PiperEngine
+
+
+class FakeVoice:
+    """Minimal stand-in for PiperVoice yielding fixed PCM per sentence."""
+
+    config = SimpleNamespace(sample_rate=22050)
+
+    def synthesize(self, text, syn_config=None):
+        for sentence in text.split("."):
+            if sentence.strip():
+                yield SimpleNamespace(
+                    sample_rate=22050, audio_int16_bytes=b"\x01\x00" * len(sentence)
+                )
+
+
+@pytest.mark.skipif(not piper_pool.PIPER_POOL_AVAILABLE, reason="Piper not available")
+class TestWorkerFunctions:
+    """Worker-side functions, exercised in-process."""
+
+    def test_init_worker_preloads_and_synthesizes(self):
+        """Test the initializer preloads voices once and synthesis reuses them."""
+        with patch.object(
+            piper_pool, "load_voice_with_threads", return_value=FakeVoice()
+        ) as mock_load:
+            piper_pool._init_worker(
+                {"fa_IR-amir-medium": ("/m/fa.onnx", "/m/fa.onnx.json")},
+                ["fa_IR-amir-medium", "unknown"],
+                False,
+                2,
+            )
+            mock_load.assert_called_once_with(
+                "/m/fa.onnx", "/m/fa.onnx.json", use_cuda=False, intra_op_threads=2
+            )
+
+            sample_rate, pcm = piper_pool._synthesize_in_worker(
+                "ab. cde.", "fa_IR-amir-medium"
+            )
+            assert sample_rate == 22050
+            assert pcm == b"\x01\x00" * 6
+            assert mock_load.call_count == 1
+
+    def test_worker_voices_are_bounded(self, tmp_path):
+        """Test each worker keeps at most max_loaded_voices, evicting the LRU one."""
+        voice_files = {}
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.onnx").write_bytes(b"x" * 10)
+            voice_files[name] = (str(tmp_path / f"{name}.onnx"), None)
+
+        with patch.object(
+            piper_pool,
+            "load_voice_with_threads",
+            side_effect=lambda *a, **k: FakeVoice(),
+        ) as mock_load:
+            piper_pool._init_worker(voice_files, [], False, 1, 2)
+            for name in ("a", "b", "a", "c"):
+                piper_pool._synthesize_in_worker("hi.", name)
+
+            assert list(piper_pool._worker_voices) == ["a", "c"]
+            assert mock_load.call_count == 3
+
+            piper_pool._init_worker(voice_files, [], False, 1, 0, 15)
+            for name in ("a", "b"):
+                piper_pool._synthesize_in_worker("hi.", name)
+
+            assert list(piper_pool._worker_voices) == ["b"]
+
+    def test_unknown_voice_raises(self):
+        """Test synthesis with a voice the pool does not know."""
+        piper_pool._init_worker({}, [], False, 1)
+        with pytest.raises(ValueError, match="No Piper voice found"):
+            piper_pool._synthesize_in_worker("hello", "missing")
+
+    def test_load_voice_sets_thread_options(self, tmp_path):
+        """Test ONNX session options carry the configured intra-op threads."""
+        config_path = tmp_path / "v.onnx.json"
+        config_path.write_text("{}")
+
+        with (
+            patch.object(piper_pool, "onnxruntime") as mock_ort,
+            patch.object(piper_pool, "PiperConfig") as mock_config,
+            patch.object(piper_pool, "PiperVoice") as mock_voice,
+        ):
+            piper_pool.load_voice_with_threads(
+                str(tmp_path / "v.onnx"), intra_op_threads=3
+            )
+
+            options = mock_ort.SessionOptions.return_value
+            assert options.intra_op_num_threads == 3
+            assert options.inter_op_num_threads == 1
+            mock_ort.InferenceSession.assert_called_once_with(
+                str(tmp_path / "v.onnx"),
+                sess_options=options,
+                providers=["CPUExecutionProvider"],
+            )
+            mock_config.from_dict.assert_called_once_with({})
+            mock_voice.assert_called_once()
+
+
+@pytest.mark.skipif(not piper_pool.PIPER_POOL_AVAILABLE, reason="Piper not available")
+def test_pool_recovers_from_killed_worker():
+    """Test a killed worker breaks the executor only until it is rebuilt."""
+    import os
+    import signal
+
+    pool = piper_pool.PiperProcessPool({}, workers=1)
+    try:
+        # Unknown voices fail fast in the worker, which is enough to start it
+        with pytest.raises(ValueError, match="No Piper voice found"):
+            pool.submit("hi", "missing").result(60)
+        broken = pool._executor
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+
+        with pytest.raises(ValueError, match="No Piper voice found"):
+            pool.submit("hi", "missing").result(60)
+        assert pool._executor is not broken
+        assert pool.restarts == 1
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.skipif(not PIPER_AVAILABLE, reason="Piper TTS not available")
+class TestPiperEngineWithPool:
+    """PiperEngine integration with the process pool."""
+
+    def test_pool_created_only_when_workers_configured(self, tmp_path):
+        """Test the pool is created for workers > 0 and receives voice locations."""
+        (tmp_path / "fa_IR-amir-medium.onnx").write_bytes(b"x")
+        (tmp_path / "fa_IR-amir-medium.onnx.json").write_text("{}")
+
+        engine = PiperEngine(model_path=str(tmp_path))
+        assert engine._process_pool is None
+
+        with patch("ttskit.engines.piper_engine.PiperProcessPool") as mock_pool_cls:
+            engine = PiperEngine(
+                model_path=str(tmp_path),
+                workers=2,
+                intra_op_threads=1,
+                preload_voices="fa_IR-amir-medium",
+            )
+
+            voice_files = mock_pool_cls.call_args.args[0]
+            assert voice_files == {
+                "fa_IR-amir-medium": (
+                    str(tmp_path / "fa_IR-amir-medium.onnx"),
+                    str(tmp_path / "fa_IR-amir-medium.onnx.json"),
+                )
+            }
+            assert mock_pool_cls.call_args.kwargs["workers"] == 2
+            assert mock_pool_cls.call_args.kwargs["preload_voices"] == [
+                "fa_IR-amir-medium"
+            ]
+            # Voices are loaded by the workers, not by the parent process
+            assert engine.voices == {}
+
+            engine.close()
+            mock_pool_cls.return_value.shutdown.assert_called_once()
+            assert engine._process_pool is None
+
+    async def test_synth_async_splits_sentences_across_pool(self, tmp_path):
+        """Test synth_async submits each sentence to the pool and keeps their order."""
+        from concurrent.futures import Future
+
+        (tmp_path / "en_US-test-low.onnx").write_bytes(b"x")
+
+        def _submit(sentence, voice_name, rate):
+            future = Future()
+            future.set_result((100, sentence.encode()))
+            return future
+
+        with patch("ttskit.engines.piper_engine.PiperProcessPool") as mock_pool_cls:
+            mock_pool = MagicMock()
+            mock_pool.submit.side_effect = _submit
+            mock_pool_cls.return_value = mock_pool
+
+            engine = PiperEngine(
+                model_path=str(tmp_path), workers=2, sentence_silence=0.02
+            )
+            audio = await engine.synth_async("One. Two! Three?", "en", rate=1.2)
+
+            assert [c.args for c in mock_pool.submit.call_args_list] == [
+                ("One.", "en_US-test-low", 1.2),
+                ("Two!", "en_US-test-low", 1.2),
+                ("Three?", "en_US-test-low", 1.2),
+            ]
+            silence = b"\x00\x00" * 2
+            assert audio.startswith(b"RIFF")
+            assert audio.endswith(b"One." + silence + b"Two!" + silence + b"Three?")
+
+            chunks = [chunk async for chunk in engine.synth_stream_async("A. B.", "en")]
+            assert chunks[0].startswith(b"RIFF")
+            assert chunks[1:] == [b"A.", silence, b"B."]
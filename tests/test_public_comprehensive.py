@@ -2,6 +2,8 @@
 
 import asyncio
 import io
+import time
+import wave
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -177,6 +179,39 @@ class TestTTSComprehensive:
             assert isinstance(result, AudioOut)
             assert result.data == b"processed_audio"
 
+    @pytest.mark.asyncio
+    async def test_tts_synth_async_pcm_engine_carries_buffer(self):
+        """Test PCM engine output reaches AudioOut without probing encoded bytes."""
+        import numpy as np
+
+        from ttskit.audio.pcm import PCMBuffer
+
+        class PCMEngine:
+            async def synth_async(self, **kwargs):
+                raise AssertionError("encoded path should not be used")
+
+            async def synth_pcm_async(self, **kwargs):
+                return PCMBuffer(np.zeros(48000, dtype=np.float32), 48000)
+
+        with (
+            patch("ttskit.public.engine_factory") as mock_factory,
+            patch("ttskit.public.audio_manager") as mock_manager,
+        ):
+            mock_factory.get_engine.return_value = PCMEngine()
+            mock_manager.get_from_cache.return_value = None
+
+            tts = TTS(default_lang="en")
+            result = await tts.synth_async(
+                SynthConfig(text="Hello", engine="piper", output_format="wav")
+            )
+
+        mock_manager.get_audio_info.assert_not_called()
+        mock_manager.process_audio.assert_not_called()
+        assert result.duration == 1.0
+        assert result.buffer is not None
+        assert result.data == result.buffer.encode("wav")
+        assert result.size == len(result.data)
+
     @pytest.mark.asyncio
     async def test_tts_synth_async_engine_not_available(self):
         """Test TTS.synth_async with unavailable engine."""
@@ -295,6 +330,135 @@ class TestTTSComprehensive:
                 channels=1,
             )
 
+    @pytest.mark.asyncio
+    async def test_tts_synth_async_coalesces_identical_requests(self):
+        """Test concurrent identical requests share one engine call."""
+
+        async def slow_synth(**kwargs):
+            await asyncio.sleep(0.01)
+            return b"audio_data"
+
+        with (
+            patch("ttskit.public.engine_factory") as mock_factory,
+            patch("ttskit.public.audio_manager") as mock_manager,
+        ):
+            mock_engine = Mock()
+            mock_engine.synth_async = AsyncMock(side_effect=slow_synth)
+            mock_factory.get_engine.return_value = mock_engine
+            mock_manager.get_from_cache.return_value = None
+            mock_manager.process_audio = AsyncMock(return_value=b"processed_audio")
+            mock_manager.get_audio_info.return_value = {"duration": 1.0}
+
+            tts = TTS(default_lang="en")
+            # The single-flight layer is shared, so count from its current state
+            coalesced = tts.single_flight.get_stats()["coalesced"]
+            results = await asyncio.gather(
+                *(
+                    tts.synth_async(SynthConfig(text="Hello", engine="gtts"))
+                    for _ in range(3)
+                )
+            )
+
+            assert [r.data for r in results] == [b"processed_audio"] * 3
+            assert mock_engine.synth_async.await_count == 1
+            await tts.audio_cache.flush()
+            assert mock_manager.save_to_cache.call_count == 1
+            assert tts.single_flight.get_stats()["coalesced"] == coalesced + 2
+
+    @pytest.mark.asyncio
+    async def test_tts_synth_async_mixed_script_segments(self):
+        """Test mixed Persian/English text is routed and cached per language run."""
+        calls = []
+
+        async def fake_synth(**kwargs):
+            calls.append((kwargs["lang"], kwargs["text"]))
+            return kwargs["text"].encode()
+
+        with (
+            patch("ttskit.public.engine_factory") as mock_factory,
+            patch("ttskit.public.audio_manager") as mock_manager,
+            patch("ttskit.public.audio_pipeline") as mock_pipeline,
+        ):
+            mock_engine = Mock()
+            mock_engine.synth_async = AsyncMock(side_effect=fake_synth)
+            mock_factory.get_engine.return_value = mock_engine
+            mock_manager.get_from_cache.return_value = None
+            mock_manager.process_audio = AsyncMock(
+                side_effect=lambda data, **kwargs: data
+            )
+            mock_manager.get_audio_info.return_value = {"duration": 1.0}
+            mock_pipeline.merge_audio.return_value = b"merged"
+
+            tts = TTS(default_lang="fa")
+            with patch.object(tts.router, "select_engine", return_value="edge"):
+                result = await tts.synth_async(
+                    SynthConfig(text="سلام API و API خداحافظ", lang="fa")
+                )
+
+            runs = ["سلام", "API", "و", "API", "خداحافظ"]
+            assert result.data == b"merged"
+            assert sorted(calls) == [
+                ("en", "API"),
+                ("fa", "خداحافظ"),
+                ("fa", "سلام"),
+                ("fa", "و"),
+            ]
+            mock_pipeline.merge_audio.assert_called_once_with(
+                [run.encode() for run in runs], "ogg"
+            )
+            # Four distinct runs plus the merged result
+            await tts.audio_cache.flush()
+            assert mock_manager.save_to_cache.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_tts_synth_async_sentence_cache_partial_hit(self):
+        """Test sentence-cache mode only synthesizes sentences not cached yet."""
+        calls = []
+
+        async def fake_synth(**kwargs):
+            calls.append(kwargs["text"])
+            return kwargs["text"].encode()
+
+        with (
+            patch("ttskit.public.engine_factory") as mock_factory,
+            patch("ttskit.public.audio_manager") as mock_manager,
+            patch("ttskit.public.audio_pipeline") as mock_pipeline,
+        ):
+            mock_engine = Mock()
+            mock_engine.synth_async = AsyncMock(side_effect=fake_synth)
+            mock_factory.get_engine.return_value = mock_engine
+            mock_manager.get_from_cache.return_value = None
+            mock_manager.process_audio = AsyncMock(
+                side_effect=lambda data, **kwargs: data
+            )
+            mock_manager.get_audio_info.return_value = {"duration": 1.0}
+            mock_pipeline.merge_audio.side_effect = lambda parts, fmt: b"|".join(parts)
+
+            tts = TTS(default_lang="en")
+            first = await tts.synth_async(
+                SynthConfig(
+                    text="Good morning. Your code is 1234. Bye.",
+                    engine="gtts",
+                    sentence_cache=True,
+                )
+            )
+            second = await tts.synth_async(
+                SynthConfig(
+                    text="Good morning. Your code is 5678. Bye.",
+                    engine="gtts",
+                    sentence_cache=True,
+                )
+            )
+
+            assert first.data == b"Good morning.|Your code is 1234.|Bye."
+            assert second.data == b"Good morning.|Your code is 5678.|Bye."
+            assert sorted(calls) == [
+                "Bye.",
+                "Good morning.",
+                "Your code is 1234.",
+                "Your code is 5678.",
+            ]
+
     @pytest.mark.asyncio
     async def test_tts_synth_async_engine_failure_with_fallback(self):
         """Test TTS.synth_async with engine failure and successful fallback."""
@@ -534,6 +698,29 @@ class TestTTSComprehensive:
             assert result.bitrate == 192
             assert result.size == len(audio_data)
 
+    def test_tts_bytes_to_audio_out_reads_header(self):
+        """Test cache hits are described from the header and decoded lazily."""
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(b"\x00\x00" * 8000)
+        audio_data = buf.getvalue()
+
+        tts = TTS(default_lang="en")
+        with patch("ttskit.public.AudioBuffer.from_encoded") as from_encoded:
+            result = tts._bytes_to_audio_out(audio_data, "wav")
+        from_encoded.assert_not_called()
+
+        assert (result.duration, result.sample_rate, result.channels) == (
+            0.5,
+            16000,
+            1,
+        )
+        assert result.buffer is None
+        assert result.get_buffer().encode("wav") == audio_data
+
 
 class TestConvenienceFunctionsComprehensive:
     """Comprehensive tests for convenience functions."""
@@ -1192,6 +1379,7 @@ class TestTTSAdvancedScenarios:
 
             assert isinstance(result, AudioOut)
             assert result.data == b"processed_audio"
+            await tts.audio_cache.flush()
             mock_manager.save_to_cache.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1701,6 +1889,33 @@ class TestMissingCoverageFunctions:
             assert isinstance(result, AudioOut)
             assert result.data == b"processed_audio"
 
+    def test_tts_synth_sync_waits_for_cache_writes(self):
+        """Test TTS.synth finishes the background disk write before returning."""
+        with (
+            patch("ttskit.public.engine_factory") as mock_factory,
+            patch("ttskit.public.audio_manager") as mock_manager,
+        ):
+            mock_engine = Mock()
+            mock_engine.synth_async = AsyncMock(return_value=b"audio_data")
+            mock_factory.get_engine.return_value = mock_engine
+
+            mock_manager.get_from_cache.return_value = None
+            mock_manager.process_audio = AsyncMock(return_value=b"processed_audio")
+            mock_manager.get_audio_info.return_value = {"duration": 1.0}
+            saved = []
+
+            def slow_save(key, data, format):
+                time.sleep(0.05)
+                saved.append((data, format))
+
+            mock_manager.save_to_cache.side_effect = slow_save
+
+            tts = TTS(default_lang="en")
+            tts.synth(SynthConfig(text="Write-behind on exit", engine="gtts"))
+
+            assert saved == [(b"processed_audio", "ogg")]
+            assert tts.audio_cache.get_stats()["pending_writes"] == 0
+
     def test_tts_synth_sync_with_fallback(self):
         """Test TTS.synth method with fallback scenario."""
         with (
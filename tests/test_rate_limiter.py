@@ -203,13 +203,21 @@ class TestRateLimiterFunctions:
             assert result["rate_limited"] is False
 
 
+def make_async_redis_client():
+    """Create a mock redis.asyncio client with awaitable commands."""
+    client = MagicMock()
+    for command in ("exists", "ttl", "get", "delete", "setex"):
+        setattr(client, command, AsyncMock())
+    return client
+
+
 class TestRedisRateLimiter:
     """Test RedisRateLimiter class."""
 
     def test_initialization(self):
         """Test RedisRateLimiter initialization."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis.from_url.return_value = MagicMock()
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_get_redis.return_value = make_async_redis_client()
 
             limiter = RedisRateLimiter(
                 redis_url="redis://localhost:6379",
@@ -221,17 +229,16 @@ class TestRedisRateLimiter:
             assert limiter.max_requests == 10
             assert limiter.window_seconds == 60
             assert limiter.block_duration == 120
-            mock_redis.from_url.assert_called_once_with(
-                "redis://localhost:6379", decode_responses=True
-            )
+            assert limiter.redis_url == "redis://localhost:6379"
+            mock_get_redis.assert_not_called()
 
     def test_initialization_default_values(self):
         """Test RedisRateLimiter initialization with default values."""
         with (
-            patch("ttskit.utils.rate_limiter.redis") as mock_redis,
+            patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis,
             patch("ttskit.utils.rate_limiter.settings") as mock_settings,
         ):
-            mock_redis.from_url.return_value = MagicMock()
+            mock_get_redis.return_value = make_async_redis_client()
             mock_settings.rate_limit_rpm = 5
             mock_settings.rate_limit_window = 60
 
@@ -243,8 +250,8 @@ class TestRedisRateLimiter:
 
     def test_keys_method(self):
         """Test _keys method."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis.from_url.return_value = MagicMock()
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_get_redis.return_value = make_async_redis_client()
 
             limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
             count_key, block_key = limiter._keys("user123")
@@ -255,9 +262,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_is_allowed_blocked_user(self):
         """Test is_allowed when user is blocked."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.return_value = True
             mock_redis_client.ttl.return_value = 30
@@ -272,9 +279,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_is_allowed_blocked_user_negative_ttl(self):
         """Test is_allowed when user is blocked with negative TTL."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.return_value = True
             mock_redis_client.ttl.return_value = -1
@@ -290,13 +297,14 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_is_allowed_rate_limit_exceeded(self):
         """Test is_allowed when rate limit is exceeded."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.return_value = False
 
             mock_pipeline = MagicMock()
+            mock_pipeline.execute = AsyncMock()
             mock_pipeline.incr.return_value = mock_pipeline
             mock_pipeline.expire.return_value = mock_pipeline
             mock_pipeline.execute.return_value = [11, True]
@@ -313,13 +321,14 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_is_allowed_request_allowed(self):
         """Test is_allowed when request is allowed."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.return_value = False
 
             mock_pipeline = MagicMock()
+            mock_pipeline.execute = AsyncMock()
             mock_pipeline.incr.return_value = mock_pipeline
             mock_pipeline.expire.return_value = mock_pipeline
             mock_pipeline.execute.return_value = [5, True]
@@ -336,9 +345,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_get_user_stats_with_data(self):
         """Test get_user_stats with existing data."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.get.return_value = "5"
             mock_redis_client.ttl.return_value = 30
@@ -358,9 +367,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_get_user_stats_no_data(self):
         """Test get_user_stats with no existing data."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.get.return_value = None
             mock_redis_client.ttl.return_value = -1
@@ -380,9 +389,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_get_user_stats_blocked_ttl_zero(self):
         """Test get_user_stats when blocked but TTL is 0."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.get.return_value = "3"
             mock_redis_client.ttl.return_value = 20
@@ -401,23 +410,23 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_reset_user(self):
         """Test reset_user method."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
             await limiter.reset_user("user123")
 
-            assert mock_redis_client.delete.call_count == 2
-            mock_redis_client.delete.assert_any_call("rl:c:user123")
-            mock_redis_client.delete.assert_any_call("rl:b:user123")
+            mock_redis_client.delete.assert_awaited_once_with(
+                "rl:c:user123", "rl:b:user123"
+            )
 
     @pytest.mark.asyncio
     async def test_get_global_stats(self):
         """Test get_global_stats method."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             limiter = RedisRateLimiter(
                 redis_url="redis://localhost:6379",
@@ -437,13 +446,14 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_get_user_info_success(self):
         """Test get_user_info method with success."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.return_value = False
 
             mock_pipeline = MagicMock()
+            mock_pipeline.execute = AsyncMock()
             mock_pipeline.incr.return_value = mock_pipeline
             mock_pipeline.expire.return_value = mock_pipeline
             mock_pipeline.execute.return_value = [3, True]
@@ -465,9 +475,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_get_user_info_with_exception(self):
         """Test get_user_info method with exception."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.side_effect = Exception("Redis connection error")
 
@@ -483,9 +493,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_redis_rate_limiter_exception_handling(self):
         """Test RedisRateLimiter exception handling in is_allowed."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.exists.side_effect = Exception("Redis connection failed")
 
@@ -497,9 +507,9 @@ class TestRedisRateLimiter:
     @pytest.mark.asyncio
     async def test_redis_rate_limiter_get_user_stats_exception(self):
         """Test RedisRateLimiter exception in get_user_stats."""
-        with patch("ttskit.utils.rate_limiter.redis") as mock_redis:
-            mock_redis_client = MagicMock()
-            mock_redis.from_url.return_value = mock_redis_client
+        with patch("ttskit.utils.rate_limiter.get_async_redis") as mock_get_redis:
+            mock_redis_client = make_async_redis_client()
+            mock_get_redis.return_value = mock_redis_client
 
             mock_redis_client.get.side_effect = Exception("Redis get failed")
 
@@ -0,0 +1,167 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ttskit.cache.singleflight import SingleFlight
+
+REDIS_URL = "redis://localhost:6379/0"
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis commands used by SingleFlight."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+@pytest.fixture
+def client():
+    fake = FakeRedis()
+    with patch("ttskit.cache.singleflight.get_async_redis", return_value=fake):
+        yield fake
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test identical concurrent calls run the function once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def synthesize():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"audio"
+
+        results = await asyncio.gather(
+            *(flight.do("hello", synthesize) for _ in range(5))
+        )
+
+        assert results == [b"audio"] * 5
+        assert calls == 1
+        assert flight.get_stats()["coalesced"] == 4
+        assert flight.in_flight() == 0
+
+        # Once finished, the key is free again
+        await flight.do("hello", synthesize)
+        assert calls == 2
+
+    async def test_errors_are_shared(self):
+        """Test every waiting caller sees the shared failure."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("engine down")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test the shared call survives the cancellation of one caller."""
+        flight = SingleFlight()
+
+        async def synthesize():
+            await asyncio.sleep(0.02)
+            return b"audio"
+
+        first = asyncio.ensure_future(flight.do("k", synthesize))
+        second = asyncio.ensure_future(flight.do("k", synthesize))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == b"audio"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_redis_lock_coalesces_across_instances(self, client):
+        """Test a second process reuses the result published by the lock holder."""
+        node_a = SingleFlight(REDIS_URL, poll_interval=0.005)
+        node_b = SingleFlight(REDIS_URL, poll_interval=0.005)
+        calls = 0
+
+        async def synthesize():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.03)
+            return b"audio"
+
+        results = await asyncio.gather(
+            node_a.do("k", synthesize), node_b.do("k", synthesize)
+        )
+
+        assert results == [b"audio", b"audio"]
+        assert calls == 1
+        assert node_b.get_stats()["remote_hits"] == 1
+        assert not any(key.endswith(":lock:k") for key in client.data)
+
+    async def test_redis_publishes_encoded_results(self, client):
+        """Test non-bytes results reach other processes through encode."""
+        node_a = SingleFlight(REDIS_URL, poll_interval=0.005)
+        node_b = SingleFlight(REDIS_URL, poll_interval=0.005)
+        calls = 0
+
+        async def synthesize():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.03)
+            return {"audio": b"data"}
+
+        results = await asyncio.gather(
+            node_a.do("k", synthesize, encode=lambda r: r["audio"]),
+            node_b.do("k", synthesize, encode=lambda r: r["audio"]),
+        )
+
+        assert results == [{"audio": b"data"}, b"data"]
+        assert calls == 1
+
+    async def test_redis_rechecks_result_after_taking_lock(self, client):
+        """Test a result published just before the lock was taken is reused."""
+        flight = SingleFlight(REDIS_URL)
+        client.data["ttskit:singleflight:result:k"] = b"remote"
+        # The holder publishes and releases between our first get and set
+        gets = iter([None])
+
+        async def synthesize():
+            raise AssertionError("should reuse the published result")
+
+        with patch.object(
+            client, "get", side_effect=lambda key: next(gets, client.data.get(key))
+        ):
+            assert await flight.do("k", synthesize) == b"remote"
+        assert flight.get_stats()["remote_hits"] == 1
+        assert "ttskit:singleflight:lock:k" not in client.data
+
+    async def test_redis_errors_fall_back_to_local(self, client):
+        """Test synthesis still runs when Redis fails mid-request."""
+        flight = SingleFlight(REDIS_URL)
+
+        async def synthesize():
+            return b"audio"
+
+        with patch.object(client, "get", side_effect=ConnectionError("down")):
+            assert await flight.do("k", synthesize) == b"audio"
+        assert flight.get_stats()["remote_errors"] == 1
@@ -1,5 +1,6 @@
 """Tests for Smart Router."""
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -164,6 +165,18 @@ class TestSmartRouter:
         assert smart_router.stats["successful_requests"] == 0
         assert smart_router.stats["failed_requests"] == 0
 
+    def test_reset_stats_keeps_windows_bounded(self, smart_router):
+        """Test reset clears duration windows in place, keeping their bound."""
+        smart_router.record_success("gtts", 1.0)
+        window = smart_router.performance_metrics["gtts"]
+
+        smart_router.reset_stats()
+        for _ in range(150):
+            smart_router.record_success("gtts", 2.0)
+
+        assert smart_router.performance_metrics["gtts"] is window
+        assert len(window) == window.maxlen == 100
+
     def test_update_stats_success(self, smart_router):
         """Test updating stats for successful request."""
         initial_total = smart_router.stats["total_requests"]
@@ -238,3 +251,114 @@ class TestSmartRouter:
 
         assert "engine1" in filtered_engines
         assert "engine2" not in filtered_engines
+
+    async def test_synth_async_falls_back_through_policy(self, smart_router):
+        """Test a failing engine falls back to the next one and opens its breaker."""
+        failing = Mock()
+        failing.synth_async.side_effect = Exception("upstream unavailable")
+        working = Mock()
+        working.synth_async.return_value = b"piper_audio"
+
+        engines = {"edge": failing, "piper": working}
+        smart_router.failure_threshold = 2
+        smart_router.registry.get_engine.side_effect = engines.get
+        smart_router.registry.get_engines_for_language.return_value = ["edge", "piper"]
+        smart_router.registry.get_available_engines.return_value = ["edge", "piper"]
+        smart_router.select_best_engine = Mock(return_value="edge")
+
+        for _ in range(2):
+            audio, engine_name = await smart_router.synth_async("سلام", "fa")
+            assert (audio, engine_name) == (b"piper_audio", "piper")
+        assert failing.synth_async.call_count == 2
+
+        # Edge's breaker is now open, so it is skipped without being called
+        audio, engine_name = await smart_router.synth_async("سلام", "fa")
+        assert engine_name == "piper"
+        assert failing.synth_async.call_count == 2
+
+        stats = smart_router.get_all_stats()
+        assert stats["edge"]["circuit_state"] == "open"
+        assert stats["edge"]["last_error"] == "upstream unavailable"
+        assert stats["piper"]["circuit_state"] == "closed"
+        assert stats["successful_requests"] == 3
+
+        working.synth_async.side_effect = Exception("model missing")
+        with pytest.raises(AllEnginesFailedError, match="circuit open: edge"):
+            await smart_router.synth_async("سلام", "fa")
+
+    async def test_synth_async_hedges_slow_primary(self, mock_registry):
+        """Test a primary slower than its p95 is raced against the next engine."""
+
+        class DelayedEngine:
+            def __init__(self, delay, audio):
+                self.delay = delay
+                self.audio = audio
+                self.cancelled = False
+
+            def is_available(self):
+                return True
+
+            async def synth_async(self, *args):
+                try:
+                    await asyncio.sleep(self.delay)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+                return self.audio
+
+        edge = DelayedEngine(0.001, b"edge_audio")
+        gtts = DelayedEngine(0.001, b"gtts_audio")
+        engines = {"edge": edge, "gtts": gtts}
+        mock_registry.get_engine.side_effect = engines.get
+        mock_registry.get_engines_for_language.return_value = ["edge", "gtts"]
+        router = SmartRouter(
+            mock_registry, hedging=True, hedge_min_samples=3, hedge_max_ratio=0.25
+        )
+        router.select_best_engine = Mock(return_value="edge")
+
+        for _ in range(3):
+            assert await router.synth_async("hello", "en") == (b"edge_audio", "edge")
+        assert router.get_hedge_stats()["fired"] == 0
+
+        edge.delay = 5.0
+        audio, engine_name = await router.synth_async("hello", "en")
+        await asyncio.sleep(0)
+
+        assert (audio, engine_name) == (b"gtts_audio", "gtts")
+        assert edge.cancelled
+        stats = router.get_all_stats()["hedging"]
+        assert stats["fired"] == 1
+        assert stats["won"] == 1
+        assert stats["win_rate"] == 1.0
+        assert router.get_breaker("edge").get_stats()["consecutive_failures"] == 0
+
+        # The hedge budget (a quarter of all requests) is spent, so no second hedge
+        edge.delay = 0.05
+        audio, engine_name = await router.synth_async("hello", "en")
+        assert engine_name == "edge"
+        assert router.get_hedge_stats()["fired"] == 1
+
+    def test_hedging_disabled_by_default(self, smart_router):
+        """Test hedging is opt-in."""
+        for _ in range(50):
+            smart_router.get_latency_stats("edge", "en").record_success(0.1)
+
+        assert smart_router._hedge_delay("edge", "en") is None
+        assert smart_router.get_latency_percentile("edge", "en") == pytest.approx(0.1)
+
+    def test_ranking_uses_per_language_stats(self, smart_router, mock_registry):
+        """Test the same engine is ranked by its latency for each language."""
+        mock_registry.get_engines_for_language.return_value = ["edge", "gtts"]
+        for _ in range(5):
+            smart_router.get_latency_stats("edge", "fa").record_success(3.0)
+            smart_router.get_latency_stats("gtts", "fa").record_success(1.0)
+            smart_router.get_latency_stats("edge", "en").record_success(0.5)
+            smart_router.get_latency_stats("gtts", "en").record_success(1.0)
+
+        assert smart_router.get_engine_ranking("fa") == ["gtts", "edge"]
+        assert smart_router.get_engine_ranking("en") == ["edge", "gtts"]
+
+        mock_registry.engines = {"edge": Mock(), "gtts": Mock()}
+        stats = smart_router.get_all_stats()
+        assert stats["edge"]["languages"]["fa"]["p95_latency"] == 3.0
+        assert stats["edge"]["languages"]["en"]["total_requests"] == 5
@@ -13,6 +13,8 @@ from ttskit.utils.text import (
     normalize_text,
     remove_emojis,
     split_long_text,
+    split_script_runs,
+    split_sentences,
 )
 from ttskit.utils.text import validate_text as validate_text_utils
 
@@ -316,3 +318,54 @@ class TestTextUtilsIntegration:
                 assert isinstance(validation_result, str | type(None))
             except Exception as e:
                 pytest.fail(f"Edge case '{text}' raised exception: {e}")
+
+
+class TestSentenceSplitting:
+    """Test cases for sentence splitting."""
+
+    def test_split_sentences_keeps_punctuation_and_order(self):
+        """Test sentences keep their terminal punctuation and decimals are not split."""
+        text = "Hello world. Pi is 3.14! Is it?\nسلام دنیا؟ خوبی. Done…"
+        assert split_sentences(text) == [
+            "Hello world.",
+            "Pi is 3.14!",
+            "Is it?",
+            "سلام دنیا؟",
+            "خوبی.",
+            "Done…",
+        ]
+
+    def test_split_sentences_empty_and_long(self):
+        """Test empty input and splitting of over-long sentences."""
+        assert split_sentences("") == []
+        assert split_sentences("   ") == []
+        parts = split_sentences("word " * 50, max_length=40)
+        assert len(parts) > 1
+        assert all(len(part) <= 40 for part in parts)
+
+
+class TestScriptRuns:
+    """Test cases for mixed-script segmentation."""
+
+    def test_split_script_runs_persian_with_english(self):
+        """Test Persian text with embedded English keeps order and punctuation."""
+        text = "سلام، این یک تست با Python 3.12 است."
+        assert split_script_runs(text) == [
+            ("fa", "سلام، این یک تست با"),
+            ("en", "Python 3.12"),
+            ("fa", "است."),
+        ]
+
+    def test_split_script_runs_labels(self):
+        """Test Arabic detection, default labels and letterless text."""
+        assert split_script_runs("مرحبا بك في TTSKit") == [
+            ("ar", "مرحبا بك في"),
+            ("en", "TTSKit"),
+        ]
+        assert split_script_runs("(Hi) سلام", rtl_lang="ar", ltr_lang="fr") == [
+            ("fr", "(Hi)"),
+            ("ar", "سلام"),
+        ]
+        assert split_script_runs("Hello world") == [("en", "Hello world")]
+        assert split_script_runs("123 !") == [("en", "123 !")]
+        assert split_script_runs("  ") == []
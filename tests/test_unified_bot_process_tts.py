@@ -6,7 +6,9 @@ It ensures the bot handles scenarios gracefully.
 
 from __future__ import annotations
 
+import io
 import types
+import wave
 
 import pytest
 
@@ -41,8 +43,11 @@ class _Adapter:
     def delete_message(self, chat_id, mid):
         self.sent.append(("del", chat_id, mid))
 
-    def send_voice(self, chat_id, data, caption, reply_to_message_id=None):
+    def send_voice(
+        self, chat_id, data, caption, reply_to_message_id=None, duration=None
+    ):
         self.sent.append(("voice", chat_id, data, caption, reply_to_message_id))
+        self.duration = duration
 
 
 class _Smart:
@@ -97,6 +102,31 @@ async def test_process_tts_request_cache_hit(monkeypatch):
     assert "voice" in ops and "del" in ops
 
 
+@pytest.mark.asyncio
+async def test_process_tts_request_passes_header_duration(monkeypatch):
+    """Tests the voice duration is read from the audio header, not decoded."""
+    from ttskit.bot.unified_bot import UnifiedTTSBot
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(b"\x00\x00" * 8000 * 3)
+
+    bot = UnifiedTTSBot("t")
+    bot.adapter = _Adapter()
+    bot.smart_router = _Smart("ok")
+
+    import ttskit.utils.audio_manager as am
+
+    monkeypatch.setattr(am.audio_manager, "get_audio", lambda *a, **k: buf.getvalue())
+
+    await bot._process_tts_request(_Msg(), "hello", "en")
+
+    assert bot.adapter.duration == 3
+
+
 @pytest.mark.asyncio
 async def test_process_tts_request_cache_miss_then_synth(monkeypatch):
     """Tests TTS when the cache is missing but synthesis succeeds.
@@ -38,6 +38,8 @@ class SynthRequest(BaseModel):
         rate: Speech rate multiplier (0.1-3.0). 1.0 is normal speed, lower is slower, higher is faster.
         pitch: Pitch adjustment in semitones (-12 to +12). 0.0 is default pitch, negative lowers, positive raises.
         format: Output audio format. Supported: 'ogg', 'mp3', 'wav'. Defaults to 'ogg'.
+        sentence_cache: Reuse cached audio per sentence and synthesize only the
+            sentences not cached yet. Useful for templated texts. Defaults to False.
 
     Example:
         SynthRequest(
@@ -68,6 +70,10 @@ class SynthRequest(BaseModel):
     format: str = Field(
         default="ogg", pattern="^(ogg|mp3|wav)$", description="Output audio format"
     )
+    sentence_cache: bool = Field(
+        default=False,
+        description="Cache per sentence and synthesize only uncached sentences",
+    )
 
 
 class BatchSynthRequest(BaseModel):
@@ -239,6 +245,7 @@ async def synth_audio(
             pitch=request.pitch,
             output_format=request.format,
             cache=True,
+            sentence_cache=request.sentence_cache,
         )
 
         # Synthesize audio
@@ -1,13 +1,15 @@
 """System and admin endpoints router."""
 
 import time
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from ...cache import get_redis_pool_stats
 from ...metrics.advanced import get_metrics_collector
 from ...public import (
+    audio_cache_stats,
     clear_cache,
     get_cache_stats,
     get_config,
@@ -20,7 +22,7 @@ from ...public import (
     is_cache_enabled,
 )
 from ...utils.logging_config import get_logger
-from ...utils.performance import get_performance_monitor
+from ...utils.performance import get_executor_stats, get_performance_monitor
 from ...version import __version__
 from ..dependencies import RequiredAuth, WriteAuth
 
@@ -49,6 +51,14 @@ class CacheStatsResponse(BaseModel):
     hit_rate: float = Field(description="Cache hit rate")
     size: int = Field(description="Cache size in bytes")
     entries: int = Field(description="Number of cache entries")
+    connection_pools: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="Shared async Redis connection pool usage by URL",
+    )
+    tiers: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Audio cache hit ratios per tier (l1 memory, l2 disk, l3 Redis)",
+    )
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -210,6 +220,8 @@ async def get_cache_statistics(
             - hit_rate: Cache efficiency ratio (hits/total_requests)
             - size: Current total cache size in bytes
             - entries: Number of cached audio files stored
+            - connection_pools: Async Redis pool usage (in use/available/max)
+            - tiers: Audio cache hits, misses and hit ratio per tier
     """
     try:
         stats = get_cache_stats()
@@ -222,6 +234,8 @@ async def get_cache_statistics(
             hit_rate=stats.get("hit_rate", 0.0),
             size=stats.get("size", 0),
             entries=stats.get("entries", 0),
+            connection_pools=get_redis_pool_stats(),
+            tiers=audio_cache_stats.as_dict(),
         )
 
     except Exception as e:
@@ -401,7 +415,7 @@ async def get_advanced_metrics(
     Get comprehensive advanced metrics.
 
     Returns detailed performance analytics, engine comparison,
-    language analytics, and system health metrics.
+    language analytics, shared executor load, and system health metrics.
     """
     try:
         metrics_collector = get_metrics_collector()
@@ -418,6 +432,7 @@ async def get_advanced_metrics(
             "engine_comparison": engine_comparison,
             "language_analytics": language_analytics,
             "performance": performance_metrics,
+            "executors": get_executor_stats(),
             "timestamp": time.time(),
             "version": __version__,
         }
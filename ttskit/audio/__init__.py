@@ -9,8 +9,29 @@ graceful degradation when optional dependencies are missing.
 Main components:
 - AudioPipeline: Core audio processing class with extensive capabilities
 - pipeline: Global singleton instance for easy access
+- PCMBuffer: Raw samples plus sample rate, consumed by the pipeline without decoding
+- AudioBuffer: Decode-once audio carrying its metadata and per-format encodings
+- FFmpegPool: Warm ffmpeg workers for formats libsndfile cannot handle
+- AudioHeader: Header-only duration, sample rate and channels for WAV, OGG and MP3
+  (see ttskit.audio.probe)
+- Resampler: Streaming polyphase resampler with cached filters (see
+  ttskit.audio.resample)
 """
 
+from .buffer import AudioBuffer
+from .ffmpeg_pool import FFmpegPool, get_ffmpeg_pool
+from .pcm import PCMBuffer
 from .pipeline import AudioPipeline, pipeline
+from .probe import AudioHeader
+from .resample import Resampler
 
-__all__ = ["AudioPipeline", "pipeline"]
+__all__ = [
+    "AudioBuffer",
+    "AudioHeader",
+    "AudioPipeline",
+    "FFmpegPool",
+    "PCMBuffer",
+    "Resampler",
+    "get_ffmpeg_pool",
+    "pipeline",
+]
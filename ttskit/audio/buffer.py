@@ -0,0 +1,153 @@
+"""Decode-once audio for TTSKit.
+
+An AudioBuffer holds decoded samples together with every encoded form produced
+from them. Audio is decoded at most once, where it enters the pipeline; duration,
+sample rate and channels come from the samples, and each output format is encoded
+on first request and then reused. The buffer travels from the engine through the
+pipeline into AudioOut and on to the Telegram adapters, so no stage has to probe
+encoded bytes for metadata again.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from . import codec
+from .pcm import PCMBuffer
+from .pipeline import pipeline
+
+
+@dataclass
+class AudioBuffer(PCMBuffer):
+    """PCM samples plus their encoded representations, cached per format.
+
+    Attributes:
+        samples: Sample array; int16 or float32, shape (frames,) for mono or
+            (frames, channels) for multi-channel audio.
+        sample_rate: Sample rate in Hz.
+        channels: Number of interleaved channels.
+    """
+
+    _encoded: dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_pcm(cls, pcm: PCMBuffer) -> "AudioBuffer":
+        """Wrap a PCMBuffer's samples without copying them.
+
+        Args:
+            pcm: Raw samples from an engine.
+
+        Returns:
+            AudioBuffer sharing the samples.
+        """
+        if isinstance(pcm, AudioBuffer):
+            return pcm
+        return cls(
+            samples=pcm.samples, sample_rate=pcm.sample_rate, channels=pcm.channels
+        )
+
+    @classmethod
+    def from_encoded(cls, data: bytes, format: str) -> "AudioBuffer":
+        """Decode encoded audio once, keeping the original bytes for format.
+
+        Args:
+            data: Encoded audio bytes.
+            format: Format of data ('ogg', 'mp3', 'wav', ...).
+
+        Returns:
+            AudioBuffer whose encoding in format is data itself.
+
+        Raises:
+            RuntimeError: If the audio cannot be decoded.
+        """
+        samples, sample_rate = pipeline._decode(data, format)
+        channels = 1 if samples.ndim == 1 else int(samples.shape[1])
+        buffer = cls(samples=samples, sample_rate=int(sample_rate), channels=channels)
+        buffer._encoded[format.lower()] = bytes(data)
+        return buffer
+
+    @classmethod
+    def concatenate(cls, buffers: list["AudioBuffer"]) -> "AudioBuffer":
+        """Join buffers end to end, converting to the first one's rate and channels.
+
+        Args:
+            buffers: Buffers in playback order.
+
+        Returns:
+            New AudioBuffer with no cached encodings.
+        """
+        first = buffers[0]
+        parts = [
+            buffer.converted(first.sample_rate, first.channels).to_float32()
+            for buffer in buffers
+        ]
+        return cls(
+            samples=np.concatenate(parts),
+            sample_rate=first.sample_rate,
+            channels=first.channels,
+        )
+
+    def converted(self, sample_rate: int, channels: int | None = None) -> "AudioBuffer":
+        """Get the audio at another sample rate or channel count.
+
+        Args:
+            sample_rate: Target sample rate in Hz.
+            channels: Target channel count (unchanged if None).
+
+        Returns:
+            This buffer if nothing changes, otherwise a new AudioBuffer.
+        """
+        channels = channels or self.channels
+        if sample_rate == self.sample_rate and channels == self.channels:
+            return self
+        samples = codec.mix_channels(self.to_float32(), channels)
+        if sample_rate != self.sample_rate:
+            samples = pipeline._resample_audio(samples, self.sample_rate, sample_rate)
+        return AudioBuffer(
+            samples=np.asarray(samples, dtype=np.float32),
+            sample_rate=int(sample_rate),
+            channels=channels,
+        )
+
+    def encode(self, format: str) -> bytes:
+        """Get the audio encoded in format, encoding it on first use.
+
+        Args:
+            format: Output format ('ogg', 'mp3', 'wav', ...).
+
+        Returns:
+            Encoded audio bytes.
+        """
+        format = format.lower()
+        data = self._encoded.get(format)
+        if data is None:
+            data = pipeline._encode(self.to_float32(), self.sample_rate, format)
+            self._encoded[format] = data
+        return data
+
+    @property
+    def formats(self) -> list[str]:
+        """Formats already encoded."""
+        return list(self._encoded)
+
+    def info(self, format: str) -> dict[str, Any]:
+        """Describe the audio as encoded in format, without probing the bytes.
+
+        Args:
+            format: Output format.
+
+        Returns:
+            dict: Same keys as AudioManager.get_audio_info (duration, sample_rate,
+            channels, bitrate, size, format).
+        """
+        size = len(self.encode(format))
+        duration = self.duration
+        return {
+            "duration": duration,
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "bitrate": max(1, int(size * 8 / duration / 1000)) if duration > 0 else 128,
+            "size": size,
+            "format": format.lower(),
+        }
@@ -0,0 +1,152 @@
+"""In-process audio encoding and decoding for TTSKit.
+
+Encodes and decodes through libsndfile (via soundfile) inside the current
+process, so converting audio does not spawn an ffmpeg subprocess. OGG output is
+Opus, the codec Telegram voice notes use. Which formats are available depends on
+the libsndfile build: OGG/Opus needs libsndfile 1.0.29+, MP3 needs 1.1.0+.
+Callers fall back to pydub/ffmpeg for anything reported unsupported here.
+"""
+
+import io
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+# Sample rates the Opus encoder accepts
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# format -> (libsndfile major format, subtype; None for libsndfile's default)
+_FORMATS: dict[str, tuple[str, str | None]] = {
+    "wav": ("WAV", "PCM_16"),
+    "flac": ("FLAC", "PCM_16"),
+    "ogg": ("OGG", "OPUS"),
+    "opus": ("OGG", "OPUS"),
+    "mp3": ("MP3", "MPEG_LAYER_III"),
+}
+
+
+def _soundfile() -> Any:
+    import soundfile
+
+    return soundfile
+
+
+@lru_cache(maxsize=32)
+def _supported(sf: Any, major: str, subtype: str | None) -> bool:
+    try:
+        if major not in sf.available_formats():
+            return False
+        return subtype is None or subtype in sf.available_subtypes(major)
+    except Exception:
+        return False
+
+
+def can_encode(format: str) -> bool:
+    """Check whether format can be encoded in-process.
+
+    Args:
+        format: Output format ('ogg', 'wav', 'mp3', 'flac', 'opus')
+
+    Returns:
+        True if soundfile is installed and libsndfile supports the format
+    """
+    spec = _FORMATS.get((format or "").lower())
+    if spec is None:
+        return False
+    try:
+        sf = _soundfile()
+    except ImportError:
+        return False
+    return _supported(sf, *spec)
+
+
+def can_decode(format: str) -> bool:
+    """Check whether format can be decoded in-process.
+
+    Args:
+        format: Input format
+
+    Returns:
+        True if soundfile is installed and libsndfile reads the format
+    """
+    spec = _FORMATS.get((format or "").lower())
+    if spec is None:
+        return False
+    try:
+        sf = _soundfile()
+    except ImportError:
+        return False
+    return _supported(sf, spec[0], None)
+
+
+def decode(source: bytes | str) -> tuple[np.ndarray, int]:
+    """Decode audio into float32 samples.
+
+    libsndfile detects the container from the data itself.
+
+    Args:
+        source: Encoded audio bytes or a file path
+
+    Returns:
+        Tuple of (samples, sample_rate); samples have shape (frames,) for mono
+        and (frames, channels) otherwise
+
+    Raises:
+        RuntimeError: If libsndfile cannot read the data
+    """
+    sf = _soundfile()
+    if isinstance(source, bytes | bytearray | memoryview):
+        source = io.BytesIO(bytes(source))
+    try:
+        with sf.SoundFile(source) as f:
+            audio = f.read(dtype="float32")
+            return audio, f.samplerate
+    except Exception as e:
+        raise RuntimeError(f"In-process decode failed: {e}") from e
+
+
+def encode(audio: np.ndarray, sample_rate: int, format: str) -> bytes:
+    """Encode float or int16 samples in-process.
+
+    Args:
+        audio: Samples, shape (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz; for OGG/Opus one of OPUS_SAMPLE_RATES
+        format: Output format
+
+    Returns:
+        Encoded audio bytes
+
+    Raises:
+        ValueError: If the format or the Opus sample rate is unsupported
+    """
+    format = (format or "").lower()
+    if not can_encode(format):
+        raise ValueError(f"In-process encoding not available for {format!r}")
+    major, subtype = _FORMATS[format]
+    if subtype == "OPUS" and sample_rate not in OPUS_SAMPLE_RATES:
+        raise ValueError(
+            f"Opus needs one of {OPUS_SAMPLE_RATES} Hz, got {sample_rate} Hz"
+        )
+    buffer = io.BytesIO()
+    _soundfile().write(buffer, audio, sample_rate, format=major, subtype=subtype)
+    return buffer.getvalue()
+
+
+def mix_channels(audio: np.ndarray, channels: int) -> np.ndarray:
+    """Downmix or duplicate channels.
+
+    Args:
+        audio: Samples, shape (frames,) or (frames, channels)
+        channels: Target channel count
+
+    Returns:
+        Samples with shape (frames,) for mono or (frames, channels)
+    """
+    current = 1 if audio.ndim == 1 else audio.shape[1]
+    if current == channels:
+        return audio
+    mono = audio if audio.ndim == 1 else audio.mean(axis=1)
+    if channels == 1:
+        return mono
+    return np.repeat(mono[:, None], channels, axis=1)
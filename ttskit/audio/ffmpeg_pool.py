@@ -0,0 +1,278 @@
+"""Warm ffmpeg worker pool for TTSKit.
+
+Formats libsndfile cannot handle on a host (MP3 before libsndfile 1.1, for
+example) still go through ffmpeg. Going through pydub forks a fresh ffmpeg for
+every decode and every encode, and the process startup and codec probing sit on
+the request path. This pool keeps ffmpeg processes started ahead of time instead.
+
+The ffmpeg CLI handles one stream per process and exits at end of input, so a
+worker cannot be reused after its conversion. Instead, every conversion profile
+(input format, output format, extra arguments) keeps a spare process already
+running and blocked on stdin. A conversion takes the spare, starts its
+replacement, streams the input through stdin and reads the result from stdout.
+Spares that died while idle are replaced, and a worker killed by a signal
+mid-conversion is retried once on a fresh process. Running and idle workers
+together never exceed the configured cap.
+"""
+
+import shutil
+import subprocess
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+from ..config import settings
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Extra ffmpeg output arguments per target format
+ENCODE_ARGS: dict[str, tuple[str, ...]] = {
+    "ogg": ("-c:a", "libopus"),
+    "mp3": ("-c:a", "libmp3lame"),
+}
+
+_Profile = tuple[str, str | None, tuple[str, ...]]
+
+
+class FFmpegPool:
+    """Bounded pool of pre-started ffmpeg processes converting bytes to bytes.
+
+    Thread safe; conversions block, so call them from an executor in async code.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        binary: str | None = None,
+        timeout: float | None = None,
+        spares: int = 1,
+    ):
+        """Initialize the pool.
+
+        Args:
+            workers: Maximum ffmpeg processes, running or idle (defaults to
+                settings.ffmpeg_workers).
+            binary: ffmpeg executable (defaults to the one on PATH).
+            timeout: Seconds allowed per conversion (defaults to
+                settings.ffmpeg_timeout).
+            spares: Idle processes kept ready per conversion profile.
+        """
+        self.workers = max(1, int(workers or settings.ffmpeg_workers))
+        self.binary = binary or shutil.which("ffmpeg")
+        self.timeout = float(timeout or settings.ffmpeg_timeout)
+        self.spares = max(0, int(spares))
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(self.workers)
+        self._idle: dict[_Profile, list[subprocess.Popen]] = {}
+        self._active = 0
+        self._stats = {
+            "spawned": 0,
+            "conversions": 0,
+            "warm_starts": 0,
+            "crashes": 0,
+            "failures": 0,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Whether an ffmpeg binary was found."""
+        return self.binary is not None
+
+    def command(
+        self,
+        output_format: str,
+        input_format: str | None = None,
+        args: Sequence[str] = (),
+    ) -> list[str]:
+        """Build the ffmpeg command line for a conversion profile.
+
+        Args:
+            output_format: ffmpeg muxer for the output (e.g. 'mp3', 'au')
+            input_format: ffmpeg demuxer for the input; probed if None
+            args: Extra output arguments, such as the codec
+
+        Returns:
+            Command as a list of arguments
+        """
+        cmd = [self.binary, "-hide_banner", "-loglevel", "error"]
+        if input_format:
+            cmd += ["-f", input_format]
+        return cmd + ["-i", "pipe:0", *args, "-f", output_format, "pipe:1"]
+
+    def convert(
+        self,
+        data: bytes,
+        output_format: str,
+        input_format: str | None = None,
+        args: Sequence[str] = (),
+    ) -> bytes:
+        """Convert audio with a pooled ffmpeg process.
+
+        Args:
+            data: Input audio bytes
+            output_format: ffmpeg muxer for the output
+            input_format: ffmpeg demuxer for the input; probed if None
+            args: Extra output arguments, such as the codec
+
+        Returns:
+            Converted audio bytes
+
+        Raises:
+            RuntimeError: If ffmpeg is unavailable, fails or times out
+        """
+        if not self.available:
+            raise RuntimeError("ffmpeg not found")
+        profile = (output_format, input_format, tuple(args))
+
+        with self._slots:
+            with self._lock:
+                self._active += 1
+            try:
+                retried = False
+                while True:
+                    proc = self._take(profile)
+                    self._refill(profile)
+                    try:
+                        out, err = proc.communicate(data, timeout=self.timeout)
+                    except subprocess.TimeoutExpired as e:
+                        proc.kill()
+                        proc.communicate()
+                        self._count("failures")
+                        raise RuntimeError(
+                            f"ffmpeg timed out after {self.timeout}s"
+                        ) from e
+                    if proc.returncode == 0:
+                        self._count("conversions")
+                        return out
+                    if proc.returncode < 0 and not retried:
+                        retried = True
+                        self._count("crashes")
+                        logger.warning(
+                            f"ffmpeg worker died with signal {-proc.returncode}, retrying"
+                        )
+                        continue
+                    self._count("failures")
+                    message = err.decode("utf-8", errors="replace").strip()
+                    raise RuntimeError(
+                        f"ffmpeg exited with {proc.returncode}: {message}"
+                    )
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with 'workers' (the cap), 'active', 'idle' and counters
+            for spawned processes, conversions, warm starts, crashes and failures
+        """
+        with self._lock:
+            idle = sum(len(procs) for procs in self._idle.values())
+            return {
+                "workers": self.workers,
+                "active": self._active,
+                "idle": idle,
+                **self._stats,
+            }
+
+    def close(self) -> None:
+        """Stop the idle workers. The pool stays usable and starts new ones on demand."""
+        with self._lock:
+            idle = [proc for procs in self._idle.values() for proc in procs]
+            self._idle.clear()
+        for proc in idle:
+            proc.kill()
+            proc.communicate()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _spawn(self, profile: _Profile) -> subprocess.Popen:
+        proc = subprocess.Popen(  # noqa: S603
+            self.command(*profile),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            shell=False,
+        )
+        self._count("spawned")
+        return proc
+
+    def _take(self, profile: _Profile) -> subprocess.Popen:
+        """Get a running spare for profile, or start a process."""
+        with self._lock:
+            idle = self._idle.get(profile, [])
+            while idle:
+                proc = idle.pop()
+                if proc.poll() is None:
+                    self._stats["warm_starts"] += 1
+                    return proc
+                self._stats["crashes"] += 1
+                logger.warning(f"Idle ffmpeg worker exited with {proc.returncode}")
+                proc.communicate()
+            # Make room under the cap by retiring a spare kept for another profile
+            evicted = None
+            total = self._active + sum(len(p) for p in self._idle.values())
+            if total > self.workers:
+                for procs in self._idle.values():
+                    if procs:
+                        evicted = procs.pop(0)
+                        break
+        if evicted is not None:
+            evicted.kill()
+            evicted.communicate()
+        return self._spawn(profile)
+
+    def _refill(self, profile: _Profile) -> None:
+        """Start spares for profile while under the worker cap."""
+        while True:
+            with self._lock:
+                idle = self._idle.setdefault(profile, [])
+                total = self._active + sum(len(p) for p in self._idle.values())
+                if len(idle) >= self.spares or total >= self.workers:
+                    return
+            try:
+                proc = self._spawn(profile)
+            except OSError as e:
+                logger.warning(f"Could not start ffmpeg worker: {e}")
+                return
+            with self._lock:
+                # Other threads may have filled the profile or the pool meanwhile
+                idle = self._idle.setdefault(profile, [])
+                total = self._active + sum(len(p) for p in self._idle.values())
+                surplus = len(idle) >= self.spares or total >= self.workers
+                if not surplus:
+                    idle.append(proc)
+            if surplus:
+                proc.kill()
+                proc.communicate()
+                return
+
+
+_pool: FFmpegPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_ffmpeg_pool() -> FFmpegPool:
+    """Retrieve or create the shared ffmpeg pool.
+
+    Returns:
+        FFmpegPool: Shared instance.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = FFmpegPool()
+        return _pool
+
+
+def shutdown_ffmpeg_pool() -> None:
+    """Stop the shared pool's idle workers and forget it."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
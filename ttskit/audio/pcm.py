@@ -0,0 +1,113 @@
+"""Typed in-memory PCM audio for TTSKit.
+
+Engines that synthesize raw samples (such as Piper) can hand a PCMBuffer to the
+audio pipeline instead of wrapping the samples in a WAV or MP3 container that the
+pipeline would immediately decode again. Encoding then happens once, at the
+output stage.
+"""
+
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class PCMBuffer:
+    """Raw PCM samples together with their sample rate.
+
+    Attributes:
+        samples: Sample array; int16 or float32, shape (frames,) for mono or
+            (frames, channels) for multi-channel audio.
+        sample_rate: Sample rate in Hz.
+        channels: Number of interleaved channels.
+    """
+
+    samples: np.ndarray
+    sample_rate: int
+    channels: int = 1
+
+    @classmethod
+    def from_int16_bytes(
+        cls, data: bytes | bytearray | memoryview, sample_rate: int, channels: int = 1
+    ) -> "PCMBuffer":
+        """Wrap little-endian 16-bit PCM bytes without copying them.
+
+        Args:
+            data: Raw 16-bit PCM bytes.
+            sample_rate: Sample rate in Hz.
+            channels: Number of interleaved channels.
+
+        Returns:
+            PCMBuffer viewing the given memory.
+        """
+        samples = np.frombuffer(data, dtype="<i2")
+        if channels > 1:
+            samples = samples.reshape(-1, channels)
+        return cls(samples=samples, sample_rate=int(sample_rate), channels=channels)
+
+    @property
+    def frames(self) -> int:
+        """Number of sample frames."""
+        return int(self.samples.shape[0])
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the sample data in bytes."""
+        return int(self.samples.nbytes)
+
+    def __len__(self) -> int:
+        return self.nbytes
+
+    def to_float32(self) -> np.ndarray:
+        """Return samples as float32 in [-1, 1].
+
+        Returns:
+            Float32 array with the same shape as ``samples``.
+        """
+        if self.samples.dtype == np.int16:
+            return self.samples.astype(np.float32) / 32768.0
+        return self.samples.astype(np.float32, copy=False)
+
+    def to_int16_bytes(self) -> bytes:
+        """Return samples as little-endian 16-bit PCM bytes.
+
+        Returns:
+            Raw PCM bytes.
+        """
+        if self.samples.dtype == np.int16:
+            return self.samples.astype("<i2", copy=False).tobytes()
+        clipped = np.clip(self.samples, -1.0, 1.0)
+        return (clipped * 32767.0).astype("<i2").tobytes()
+
+    def to_wav_bytes(self) -> bytes:
+        """Encode as a 16-bit PCM WAV file.
+
+        Returns:
+            WAV file bytes.
+        """
+        pcm = self.to_int16_bytes()
+        block_align = self.channels * 2
+        header = (
+            b"RIFF"
+            + struct.pack("<I", 36 + len(pcm))
+            + b"WAVEfmt "
+            + struct.pack(
+                "<IHHIIHH",
+                16,
+                1,
+                self.channels,
+                self.sample_rate,
+                self.sample_rate * block_align,
+                block_align,
+                16,
+            )
+            + b"data"
+            + struct.pack("<I", len(pcm))
+        )
+        return header + pcm
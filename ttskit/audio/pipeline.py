@@ -13,11 +13,17 @@ for easy access to audio processing features throughout the TTSKit ecosystem.
 
 import asyncio
 import io
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ..config import settings
 from ..utils.logging_config import get_logger
+from ..utils.performance import get_executor
 from ..utils.temp_manager import TempFileManager
+from . import codec
+from .ffmpeg_pool import ENCODE_ARGS, get_ffmpeg_pool
+from .pcm import PCMBuffer
+from .probe import probe
+from .resample import resample
 
 logger = get_logger(__name__)
 
@@ -35,13 +41,6 @@ try:
 except ImportError:
     LIBROSA_AVAILABLE = False
 
-try:
-    from scipy import signal as _scipy_signal
-
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-
 try:
     import soundfile
 
@@ -140,7 +139,7 @@ class AudioPipeline:
 
     async def process_audio(
         self,
-        audio_data: bytes,
+        audio_data: bytes | PCMBuffer,
         input_format: str = "wav",
         output_format: str = "mp3",
         sample_rate: int | None = None,
@@ -151,8 +150,8 @@ class AudioPipeline:
         """Process audio data with various enhancements.
 
         Args:
-            audio_data: Input audio data
-            input_format: Input audio format
+            audio_data: Input audio data, encoded bytes or a PCMBuffer (used without decoding)
+            input_format: Input audio format (ignored for PCMBuffer input)
             output_format: Output audio format
             sample_rate: Target sample rate
             normalize: Whether to normalize audio
@@ -165,7 +164,7 @@ class AudioPipeline:
         if not self.is_available():
             raise RuntimeError("Audio pipeline not available - missing dependencies")
 
-        if len(audio_data) < 1024:
+        if not isinstance(audio_data, PCMBuffer) and len(audio_data) < 1024:
             return audio_data
 
         if len(audio_data) < 1024 * 1024:
@@ -179,26 +178,25 @@ class AudioPipeline:
                 effects,
             )
 
-        # Run processing in thread pool for larger files
+        # Run processing in the shared audio thread pool for larger files
         loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            processed_data = await loop.run_in_executor(
-                executor,
-                self._process_audio_sync,
-                audio_data,
-                input_format,
-                output_format,
-                sample_rate,
-                normalize,
-                trim_silence,
-                effects,
-            )
+        processed_data = await loop.run_in_executor(
+            get_executor("audio"),
+            self._process_audio_sync,
+            audio_data,
+            input_format,
+            output_format,
+            sample_rate,
+            normalize,
+            trim_silence,
+            effects,
+        )
 
         return processed_data
 
     def _process_audio_sync(
         self,
-        audio_data: bytes,
+        audio_data: bytes | PCMBuffer,
         input_format: str,
         output_format: str,
         sample_rate: int | None,
@@ -237,16 +235,21 @@ class AudioPipeline:
 
         return self._save_audio(audio, sr, output_format)
 
-    def _load_audio(self, audio_data: bytes, format: str) -> tuple[np.ndarray, int]:
+    def _load_audio(
+        self, audio_data: bytes | PCMBuffer, format: str
+    ) -> tuple[np.ndarray, int]:
         """Load audio data.
 
         Args:
-            audio_data: Audio data bytes
+            audio_data: Audio data bytes, or a PCMBuffer whose samples are used directly
             format: Audio format
 
         Returns:
             Tuple of (audio_array, sample_rate)
         """
+        if isinstance(audio_data, PCMBuffer):
+            return audio_data.to_float32(), audio_data.sample_rate
+
         if not NUMPY_AVAILABLE or not SOUNDFILE_AVAILABLE:
             raise RuntimeError("Required audio libraries not available")
 
@@ -284,6 +287,12 @@ class AudioPipeline:
         if not NUMPY_AVAILABLE or not SOUNDFILE_AVAILABLE:
             raise RuntimeError("Required audio libraries not available")
 
+        if format.lower() in ("ogg", "opus") and codec.can_encode("ogg"):
+            try:
+                return self._encode_opus(audio, sample_rate)
+            except Exception as e:
+                logger.debug(f"Opus encoding failed, using default OGG codec: {e}")
+
         try:
             import soundfile as sf
 
@@ -303,11 +312,74 @@ class AudioPipeline:
             with open(tmp_file_path, "rb") as f:
                 return f.read()
 
+    def _encode_opus(self, audio: np.ndarray, sample_rate: int) -> bytes:
+        """Encode audio as OGG/Opus in-process.
+
+        Opus only runs at a few fixed rates, so other rates are resampled up to
+        the nearest one first (22050 Hz becomes 24000 Hz).
+
+        Args:
+            audio: Audio array
+            sample_rate: Sample rate
+
+        Returns:
+            OGG/Opus bytes
+        """
+        opus_sr = next(
+            (sr for sr in codec.OPUS_SAMPLE_RATES if sr >= sample_rate),
+            codec.OPUS_SAMPLE_RATES[-1],
+        )
+        if opus_sr != sample_rate:
+            audio = self._resample_audio(audio, sample_rate, opus_sr)
+        return codec.encode(audio, opus_sr, "ogg")
+
+    def _decode(
+        self, audio_data: bytes, format: str | None = None
+    ) -> tuple[np.ndarray, int]:
+        """Decode audio in-process, or through the ffmpeg pool if libsndfile can't.
+
+        Args:
+            audio_data: Encoded audio bytes
+            format: Input format; probed if None
+
+        Returns:
+            Tuple of (audio_array, sample_rate)
+        """
+        if format is None or codec.can_decode(format):
+            try:
+                return codec.decode(audio_data)
+            except RuntimeError:
+                if not get_ffmpeg_pool().available:
+                    raise
+        # AU declares an unknown length, so ffmpeg can stream it through a pipe
+        return codec.decode(get_ffmpeg_pool().convert(audio_data, "au", format))
+
+    def _encode(self, audio: np.ndarray, sample_rate: int, format: str) -> bytes:
+        """Encode audio in-process, or through the ffmpeg pool if libsndfile can't.
+
+        Args:
+            audio: Audio array
+            sample_rate: Sample rate
+            format: Output format
+
+        Returns:
+            Audio data bytes
+        """
+        if codec.can_encode(format):
+            return self._save_audio(audio, sample_rate, format)
+        wav = codec.encode(audio, sample_rate, "wav")
+        return get_ffmpeg_pool().convert(
+            wav, format, "wav", ENCODE_ARGS.get(format, ())
+        )
+
     def _resample_audio(
         self, audio: np.ndarray, orig_sr: int, target_sr: int
     ) -> np.ndarray:
         """Resample audio to target sample rate.
 
+        Uses the cached polyphase filter for the rate pair, applied with scipy's
+        upfirdn or, without scipy, a vectorized numpy kernel.
+
         Args:
             audio: Input audio array
             orig_sr: Original sample rate
@@ -319,39 +391,7 @@ class AudioPipeline:
         if orig_sr == target_sr:
             return audio
 
-        if SCIPY_AVAILABLE:
-            try:
-                from math import gcd
-
-                g = gcd(int(target_sr), int(orig_sr))
-                up = int(target_sr // g)
-                down = int(orig_sr // g)
-
-                return _scipy_signal.resample_poly(audio, up, down)
-            except Exception:
-                pass
-
-        if LIBROSA_AVAILABLE:
-            try:
-                import librosa
-
-                return librosa.resample(
-                    audio, orig_sr=orig_sr, target_sr=target_sr, res_type="linear"
-                )
-            except Exception:
-                pass
-
-        ratio = target_sr / orig_sr
-        new_length = int(len(audio) * ratio)
-
-        if ratio == 2.0:
-            return np.repeat(audio, 2)[:new_length]
-        elif ratio == 0.5:
-            return audio[::2]
-        else:
-            return np.interp(
-                np.linspace(0, len(audio) - 1, new_length), np.arange(len(audio)), audio
-            )
+        return resample(audio, orig_sr, target_sr, settings.resample_quality)
 
     def _normalize_audio(self, audio: np.ndarray) -> np.ndarray:
         """Normalize audio to prevent clipping.
@@ -554,6 +594,13 @@ class AudioPipeline:
         Returns:
             Converted audio data
         """
+        if self.is_available() and output_format in ("mp3", "wav", "ogg"):
+            try:
+                audio, sr = self._decode(audio_data, input_format)
+                return self._encode(audio, sr, output_format)
+            except Exception as e:
+                logger.debug(f"Conversion without pydub failed, using pydub: {e}")
+
         if not PYDUB_AVAILABLE:
             raise RuntimeError("pydub not available for format conversion")
 
@@ -599,6 +646,18 @@ class AudioPipeline:
         Returns:
             Audio information dictionary
         """
+        # WAV, OGG and MP3 headers carry everything needed; skip the decode
+        header = probe(audio_data)
+        if header is not None:
+            return {
+                "duration": header.duration,
+                "sample_rate": header.sample_rate,
+                "channels": header.channels,
+                "bit_depth": header.bit_depth,
+                "format": format,
+                "size_bytes": len(audio_data),
+            }
+
         if not PYDUB_AVAILABLE:
             raise RuntimeError("pydub not available for audio info")
 
@@ -628,6 +687,12 @@ class AudioPipeline:
         if not audio_files:
             raise ValueError("No audio files provided")
 
+        if self.is_available():
+            try:
+                return self._merge_decoded(audio_files, output_format)
+            except Exception as e:
+                logger.debug(f"Merge without pydub failed, using pydub: {e}")
+
         if PYDUB_AVAILABLE:
             merged = AudioSegment.from_file(io.BytesIO(audio_files[0]))
 
@@ -644,6 +709,29 @@ class AudioPipeline:
                     "pydub not available for audio merging with non-WAV formats"
                 )
 
+    def _merge_decoded(self, audio_files: list[bytes], output_format: str) -> bytes:
+        """Merge audio files by decoding, concatenating samples and re-encoding.
+
+        Parts are converted to the first part's sample rate and channel count.
+
+        Args:
+            audio_files: List of audio data
+            output_format: Output format
+
+        Returns:
+            Merged audio data
+        """
+        parts = [self._decode(audio_data) for audio_data in audio_files]
+        sr = parts[0][1]
+        channels = 1 if parts[0][0].ndim == 1 else parts[0][0].shape[1]
+        merged = []
+        for audio, part_sr in parts:
+            audio = codec.mix_channels(audio, channels)
+            if part_sr != sr:
+                audio = self._resample_audio(audio, part_sr, sr)
+            merged.append(audio)
+        return self._encode(np.concatenate(merged), sr, output_format)
+
     def _merge_wav_files(self, audio_files: list[bytes]) -> bytes:
         """Merge WAV files by concatenating audio data.
 
@@ -706,6 +794,17 @@ class AudioPipeline:
         Returns:
             List of audio segments
         """
+        if self.is_available():
+            try:
+                audio, sr = self._decode(audio_data, input_format)
+                step = max(1, int(segment_duration * sr))
+                return [
+                    self._encode(audio[i : i + step], sr, input_format)
+                    for i in range(0, len(audio), step)
+                ]
+            except Exception as e:
+                logger.debug(f"Split without pydub failed, using pydub: {e}")
+
         if not PYDUB_AVAILABLE:
             raise RuntimeError("pydub not available for audio splitting")
 
@@ -0,0 +1,237 @@
+"""Header-only audio metadata probing for TTSKit.
+
+Reads duration, sample rate and channel count from container headers without
+decoding any audio and without ffmpeg:
+
+- WAV: the RIFF ``fmt `` and ``data`` chunks.
+- OGG: the Opus or Vorbis identification header on the first page and the
+  granule position of the last page.
+- MP3: a Xing/Info or VBRI header when present, otherwise a scan over the
+  frame headers.
+
+probe() returns None for anything it does not recognise or that looks
+malformed, so callers can fall back to a full decode.
+"""
+
+import struct
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AudioHeader:
+    """Stream properties read from a container header.
+
+    Attributes:
+        format: Container ('wav', 'ogg' or 'mp3').
+        duration: Length in seconds.
+        sample_rate: Decoded sample rate in Hz.
+        channels: Number of channels.
+        bit_depth: Bits per sample as decoded (16 for compressed formats).
+    """
+
+    format: str
+    duration: float
+    sample_rate: int
+    channels: int
+    bit_depth: int = 16
+
+
+def probe(data: bytes) -> AudioHeader | None:
+    """Read stream properties from the headers of WAV, OGG or MP3 data.
+
+    Args:
+        data: Encoded audio bytes.
+
+    Returns:
+        AudioHeader, or None if the data is not a well-formed WAV, OGG (Opus or
+        Vorbis) or MP3 stream.
+    """
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    try:
+        if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+            return _probe_wav(data)
+        if data[:4] == b"OggS":
+            return _probe_ogg(data)
+        return _probe_mp3(data)
+    except (struct.error, IndexError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _probe_wav(data: bytes) -> AudioHeader | None:
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos : pos + 4]
+        (size,) = struct.unpack_from("<I", data, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            if size < 16 or body + 16 > len(data):
+                return None
+            fmt = struct.unpack_from("<HHIIHH", data, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            _, channels, sample_rate, byte_rate, _, bits = fmt
+            if not channels or not sample_rate or not byte_rate:
+                return None
+            # Streamed WAVs leave the size as 0 or 0xFFFFFFFF; use what is there
+            available = len(data) - body
+            if size in (0, 0xFFFFFFFF) or size > available:
+                size = available
+            return AudioHeader("wav", size / byte_rate, sample_rate, channels, bits)
+        pos = body + size + (size & 1)
+    return None
+
+
+def _ogg_pages(data: bytes, start: int = 0):
+    """Yield (offset, granule, payload) for consecutive OGG pages."""
+    pos = start
+    while pos + 27 <= len(data) and data[pos : pos + 4] == b"OggS":
+        if data[pos + 4] != 0:
+            return
+        (granule,) = struct.unpack_from("<q", data, pos + 6)
+        segments = data[pos + 26]
+        table = data[pos + 27 : pos + 27 + segments]
+        body = pos + 27 + segments
+        end = body + sum(table)
+        if len(table) < segments or end > len(data):
+            return
+        yield pos, granule, data[body:end]
+        pos = end
+
+
+def _probe_ogg(data: bytes) -> AudioHeader | None:
+    first = next(_ogg_pages(data), None)
+    if first is None:
+        return None
+    _, _, packet = first
+
+    if packet[:8] == b"OpusHead":
+        channels = packet[9]
+        (pre_skip,) = struct.unpack_from("<H", packet, 10)
+        # Opus granule positions always count 48 kHz samples
+        sample_rate, skip = 48000, pre_skip
+    elif packet[:7] == b"\x01vorbis":
+        channels = packet[11]
+        (sample_rate,) = struct.unpack_from("<I", packet, 12)
+        skip = 0
+    else:
+        return None
+    if not channels or not sample_rate:
+        return None
+
+    last = data.rfind(b"OggS", max(0, len(data) - 65307))
+    granule = -1
+    for _, page_granule, _ in _ogg_pages(data, last):
+        if page_granule >= 0:
+            granule = page_granule
+    if granule < 0:
+        return None
+    return AudioHeader(
+        "ogg", max(0, granule - skip) / sample_rate, sample_rate, channels
+    )
+
+
+# Bitrates in kbps by [MPEG-1][layer], index 1..14
+_MP3_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+# Trailing tags that may follow the last frame
+_MP3_TRAILERS = (b"TAG", b"APETAGEX", b"LYRICS")
+
+
+def _mp3_frame(data: bytes, pos: int) -> tuple[int, int, int, int] | None:
+    """Parse the frame header at pos.
+
+    Returns:
+        (frame length, samples per frame, sample rate, channels), or None.
+    """
+    if pos + 4 > len(data) or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index - 1] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    channels = 1 if b3 >> 6 == 3 else 2
+
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate, channels
+    samples = 576 if layer == 3 and not mpeg1 else 1152
+    return (
+        samples // 8 * bitrate // sample_rate + padding,
+        samples,
+        sample_rate,
+        channels,
+    )
+
+
+def _probe_mp3(data: bytes) -> AudioHeader | None:
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    frame = _mp3_frame(data, start)
+    if frame is None:
+        return None
+    length, samples, sample_rate, channels = frame
+
+    # Xing/Info sits after the side information; VBRI at a fixed offset
+    mpeg1 = (data[start + 1] >> 3) & 3 == 3
+    side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+    xing = start + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", data, xing + 4)
+        if flags & 1:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+            total = frames * samples
+            # The LAME extension records the encoder delay and padding in
+            # 12 bits each; drop them so the length matches the decoded audio
+            lame = xing + 8
+            for flag, size in ((1, 4), (2, 4), (4, 100), (8, 4)):
+                lame += size if flags & flag else 0
+            if data[lame : lame + 4] == b"LAME":
+                gap = int.from_bytes(data[lame + 21 : lame + 24], "big")
+                total = max(0, total - (gap >> 12) - (gap & 0xFFF))
+            return AudioHeader("mp3", total / sample_rate, sample_rate, channels)
+    vbri = start + 36
+    if data[vbri : vbri + 4] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", data, vbri + 14)
+        return AudioHeader("mp3", frames * samples / sample_rate, sample_rate, channels)
+
+    # No summary header: walk the frames; anything but a tag after them means
+    # this was not really MP3
+    frames = 0
+    pos = start
+    while pos < len(data):
+        frame = _mp3_frame(data, pos)
+        if frame is None or pos + frame[0] > len(data):
+            break
+        frames += 1
+        pos += frame[0]
+    rest = data[pos:]
+    if not frames or (
+        rest and not bytes(rest[:8]).startswith(_MP3_TRAILERS) and len(rest) >= length
+    ):
+        return None
+    return AudioHeader("mp3", frames * samples / sample_rate, sample_rate, channels)
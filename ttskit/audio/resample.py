@@ -0,0 +1,261 @@
+"""Polyphase resampling for TTSKit.
+
+Every offline request resamples at least once (Piper renders 22050 Hz, Opus
+wants 48000 Hz), so the anti-aliasing filter for a rate pair is designed once
+and cached rather than rebuilt on each call as scipy.signal.resample_poly does.
+Filters are Kaiser-windowed sincs keyed by the reduced up/down ratio and a
+quality level, so 22050->48000 and 44100->96000 share one filter.
+
+resample() applies the filter in one pass with scipy.signal.upfirdn when scipy
+is installed and with a vectorized numpy polyphase kernel otherwise. Resampler
+runs the same kernel block by block, carrying input history and phase between
+blocks, and produces exactly what resample() would for the whole signal.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+try:
+    from scipy.signal import upfirdn as _upfirdn
+except ImportError:
+    _upfirdn = None
+
+# Zero crossings of the sinc on each side of the centre, and Kaiser beta
+QUALITY: dict[str, tuple[int, float]] = {
+    "low": (4, 5.0),
+    "medium": (10, 5.0),
+    "high": (24, 8.6),
+}
+
+# Outputs computed per numpy kernel call, bounding the (outputs, taps) gather
+_CHUNK = 8192
+
+
+@dataclass(frozen=True)
+class PolyphaseFilter:
+    """Low-pass FIR filter for one up/down ratio, in polyphase form.
+
+    Attributes:
+        up: Upsampling factor.
+        down: Downsampling factor.
+        taps: Filter coefficients scaled by up, centred at index delay.
+        delay: Group delay in upsampled samples.
+        phases: taps rearranged as (up, taps_per_phase); row p holds the
+            coefficients applied to inputs for output phase p.
+    """
+
+    up: int
+    down: int
+    taps: np.ndarray
+    delay: int
+    phases: np.ndarray
+
+    @property
+    def taps_per_phase(self) -> int:
+        """Input samples contributing to each output sample."""
+        return self.phases.shape[1]
+
+    def output_length(self, frames: int) -> int:
+        """Number of output samples for frames input samples."""
+        return -(-frames * self.up // self.down)
+
+
+def design_filter(
+    orig_sr: int, target_sr: int, quality: str = "medium"
+) -> PolyphaseFilter:
+    """Get the cached resampling filter for a pair of sample rates.
+
+    Args:
+        orig_sr: Input sample rate in Hz.
+        target_sr: Output sample rate in Hz.
+        quality: 'low', 'medium' or 'high'; longer filters alias less.
+
+    Returns:
+        PolyphaseFilter shared by every caller with the same ratio and quality.
+
+    Raises:
+        ValueError: If a rate is not positive or quality is unknown.
+    """
+    orig_sr, target_sr = int(orig_sr), int(target_sr)
+    if orig_sr <= 0 or target_sr <= 0:
+        raise ValueError(f"Invalid sample rates: {orig_sr} -> {target_sr}")
+    if quality not in QUALITY:
+        raise ValueError(
+            f"Unknown resampling quality '{quality}'; use one of {', '.join(QUALITY)}"
+        )
+    g = gcd(orig_sr, target_sr)
+    return _design(target_sr // g, orig_sr // g, quality)
+
+
+@lru_cache(maxsize=32)
+def _design(up: int, down: int, quality: str) -> PolyphaseFilter:
+    zero_crossings, beta = QUALITY[quality]
+    ratio = max(up, down)
+    half = zero_crossings * ratio
+    n = np.arange(-half, half + 1)
+    taps = np.sinc(n / ratio) * np.kaiser(2 * half + 1, beta)
+    taps *= up / taps.sum()
+    taps.setflags(write=False)
+
+    per_phase = -(-taps.size // up)
+    phases = np.zeros(up * per_phase)
+    phases[: taps.size] = taps
+    phases = phases.reshape(per_phase, up).T.copy()
+    phases.setflags(write=False)
+    return PolyphaseFilter(up=up, down=down, taps=taps, delay=half, phases=phases)
+
+
+def filter_cache_info():
+    """Hit/miss statistics of the filter cache (functools.lru_cache info)."""
+    return _design.cache_info()
+
+
+def _apply(
+    filt: PolyphaseFilter, buffer: np.ndarray, base: int, start: int, stop: int
+) -> np.ndarray:
+    """Compute outputs start..stop-1 from buffer, whose first sample is input base.
+
+    The buffer must hold every input those outputs read: taps_per_phase - 1
+    samples before the first one and up to the last.
+    """
+    out = np.empty((stop - start,) + buffer.shape[1:], dtype=buffer.dtype)
+    phases = filt.phases.astype(buffer.dtype, copy=False)
+    lags = np.arange(filt.taps_per_phase)
+    for lo in range(start, stop, _CHUNK):
+        hi = min(lo + _CHUNK, stop)
+        positions = np.arange(lo, hi) * filt.down + filt.delay
+        newest = positions // filt.up - base
+        frames = buffer[newest[:, None] - lags]
+        out[lo - start : hi - start] = np.einsum(
+            "nk,nk...->n...", phases[positions % filt.up], frames
+        )
+    return out
+
+
+def _working_dtype(audio: np.ndarray) -> np.dtype:
+    return audio.dtype if audio.dtype.kind == "f" else np.dtype(np.float64)
+
+
+def resample(
+    audio: np.ndarray, orig_sr: int, target_sr: int, quality: str = "medium"
+) -> np.ndarray:
+    """Resample audio along its first axis.
+
+    Args:
+        audio: Samples, shape (frames,) or (frames, channels).
+        orig_sr: Input sample rate in Hz.
+        target_sr: Output sample rate in Hz.
+        quality: 'low', 'medium' or 'high'.
+
+    Returns:
+        ceil(frames * target_sr / orig_sr) samples; float32 input stays float32.
+    """
+    if orig_sr == target_sr:
+        return audio
+    filt = design_filter(orig_sr, target_sr, quality)
+    audio = np.asarray(audio)
+    audio = audio.astype(_working_dtype(audio), copy=False)
+    length = filt.output_length(len(audio))
+
+    if _upfirdn is not None:
+        # Pad the front so the filter centre lands on a decimated output
+        pad = filt.down - filt.delay % filt.down
+        taps = np.concatenate([np.zeros(pad), filt.taps]).astype(audio.dtype)
+        skip = (filt.delay + pad) // filt.down
+        out = _upfirdn(taps, audio, filt.up, filt.down, axis=0)[skip : skip + length]
+        if len(out) < length:
+            tail = np.zeros((length - len(out),) + out.shape[1:], dtype=out.dtype)
+            out = np.concatenate([out, tail])
+        return out
+
+    resampler = Resampler(orig_sr, target_sr, quality)
+    return np.concatenate([resampler.process(audio), resampler.flush()])
+
+
+class Resampler:
+    """Streaming resampler carrying filter state between blocks.
+
+    Feed blocks to process() and call flush() after the last one; the
+    concatenated outputs equal resample() of the whole signal. After flush()
+    the resampler is ready for a new stream.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int, quality: str = "medium"):
+        """Initialize the resampler.
+
+        Args:
+            orig_sr: Input sample rate in Hz.
+            target_sr: Output sample rate in Hz.
+            quality: 'low', 'medium' or 'high'.
+        """
+        self.orig_sr = int(orig_sr)
+        self.target_sr = int(target_sr)
+        self.filter = design_filter(self.orig_sr, self.target_sr, quality)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop buffered input and start a new stream."""
+        self._buffer: np.ndarray | None = None
+        self._base = 1 - self.filter.taps_per_phase
+        self._received = 0
+        self._produced = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Resample the next block.
+
+        Args:
+            block: Samples, shape (frames,) or (frames, channels), matching
+                earlier blocks.
+
+        Returns:
+            Every output sample whose inputs have all arrived; the rest follow
+            with later blocks or flush().
+        """
+        block = np.asarray(block)
+        if self._buffer is None:
+            history = self.filter.taps_per_phase - 1
+            self._buffer = np.zeros(
+                (history,) + block.shape[1:], dtype=_working_dtype(block)
+            )
+        self._buffer = np.concatenate([self._buffer, block.astype(self._buffer.dtype)])
+        self._received += len(block)
+
+        filt = self.filter
+        ready = max(0, (self._received * filt.up - 1 - filt.delay) // filt.down + 1)
+        return self._emit(ready)
+
+    def flush(self) -> np.ndarray:
+        """Finish the stream, treating the input after the last block as silence.
+
+        Returns:
+            The remaining output samples.
+        """
+        if self._buffer is None:
+            return np.zeros(0, dtype=np.float32)
+        filt = self.filter
+        total = filt.output_length(self._received)
+        last = ((total - 1) * filt.down + filt.delay) // filt.up if total else 0
+        missing = last - (self._base + len(self._buffer)) + 1
+        if missing > 0:
+            tail = np.zeros((missing,) + self._buffer.shape[1:], self._buffer.dtype)
+            self._buffer = np.concatenate([self._buffer, tail])
+        out = self._emit(total)
+        self.reset()
+        return out
+
+    def _emit(self, stop: int) -> np.ndarray:
+        start = self._produced
+        stop = max(start, stop)
+        out = _apply(self.filter, self._buffer, self._base, start, stop)
+        self._produced = stop
+
+        # Keep only the inputs the next output still reads
+        filt = self.filter
+        oldest = (stop * filt.down + filt.delay) // filt.up - filt.taps_per_phase + 1
+        drop = min(max(0, oldest - self._base), len(self._buffer))
+        self._buffer = self._buffer[drop:]
+        self._base += drop
+        return out
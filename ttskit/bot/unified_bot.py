@@ -8,6 +8,7 @@ and TTS engine, including smart routing, caching, and full message handling.
 import asyncio
 from typing import Any
 
+from ..audio.probe import probe
 from ..config import settings
 from ..engines import factory as engines_factory_module
 from ..engines import registry as engines_registry
@@ -128,7 +129,7 @@ class UnifiedTTSBot:
             if hasattr(engines_factory_module, "setup_registry"):
                 engines_factory_module.setup_registry(engines_registry.registry)
 
-            self.smart_router = SmartRouter(engines_registry.registry)
+            self.smart_router = SmartRouter.from_settings(engines_registry.registry)
 
             self._setup_engine_preferences()
 
@@ -420,6 +421,10 @@ class UnifiedTTSBot:
                     )
                     return
 
+            # Read the duration from the header so the adapter does not decode
+            header = (
+                probe(audio_data) if isinstance(audio_data, bytes | bytearray) else None
+            )
             await self.awaitable(self.adapter.send_voice)(
                 message.chat_id,
                 audio_data,
@@ -428,6 +433,7 @@ class UnifiedTTSBot:
                     text=text[:100] + ("..." if len(text) > 100 else ""),
                 ),
                 reply_to_message_id=message.id,
+                duration=int(header.duration) if header else None,
             )
 
             await self.awaitable(self.adapter.delete_message)(
@@ -1,35 +1,107 @@
 """Cache module for TTSKit.
 
-Provides cache backends (memory, Redis), key generation, and configuration
+Provides cache backends (memory, Redis, tiered audio), key generation, and configuration
 functions for managing caching in TTS synthesis workflows.
 """
 
 import hashlib
 import json
+import re
+import unicodedata
 from typing import Any
 
 from ..config import settings
+from .async_redis import (
+    AsyncRedisCache,
+    close_async_redis,
+    get_async_redis,
+    get_redis_pool_stats,
+)
 from .base import CacheInterface
 from .memory import MemoryCache, memory_cache
 from .redis import REDIS_AVAILABLE, RedisCache
+from .singleflight import SingleFlight
+from .tiered import TieredAudioCache, TieredCacheStats
 
+# Bump when the key payload changes so old entries are no longer addressed
+CACHE_KEY_VERSION = 2
 
-def cache_key(text: str, lang: str, engine: str) -> str:
-    """Create deterministic cache key using SHA256.
+# Engine names that all mean "let the router choose"
+_AUTO_ENGINES = frozenset({"", "auto", "smart"})
+_ZERO_WIDTH = re.compile("[\u200b-\u200d\u2060\ufeff]")
+
+# Connected RedisCache per URL, reused across get_cache() calls
+_redis_caches: dict[str, RedisCache] = {}
+_async_caches: dict[str, AsyncRedisCache] = {}
+# Shared SingleFlight per (Redis URL or None, lock TTL)
+_single_flights: dict[tuple[str | None, int], SingleFlight] = {}
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalize text for cache keys so equivalent inputs share an entry.
+
+    Applies Unicode NFC, strips zero-width characters and collapses whitespace.
 
     Args:
         text: Input text
+
+    Returns:
+        Normalized text
+    """
+    text = _ZERO_WIDTH.sub("", unicodedata.normalize("NFC", text or ""))
+    return " ".join(text.split())
+
+
+def cache_key(
+    text: str,
+    lang: str,
+    engine: str | None,
+    *,
+    voice: str | None = None,
+    rate: float = 1.0,
+    pitch: float = 0.0,
+    output_format: str | None = None,
+    effects: dict[str, Any] | None = None,
+) -> str:
+    """Create the canonical, versioned cache key for a synthesis request.
+
+    Used by TTS, AudioManager, the API and the bot so the same request maps to the
+    same entry whichever frontend made it.
+
+    Args:
+        text: Input text (normalized with normalize_cache_text)
         lang: Language code
-        engine: Engine name
+        engine: Engine name; None, 'auto' and 'smart' all mean router-selected
+        voice: Voice name
+        rate: Speech rate multiplier
+        pitch: Pitch shift in semitones
+        output_format: Output audio format
+        effects: Post-processing effects
 
     Returns:
         Hex digest cache key (64 chars)
 
     Notes:
-        Payload is JSON-serialized dict with keys 't', 'l', 'e' using compact separators.
+        Payload is a JSON-serialized dict with sorted keys and compact separators;
+        'v' holds CACHE_KEY_VERSION.
     """
+    engine = (engine or "").strip().lower()
     payload = json.dumps(
-        {"t": text, "l": lang, "e": engine}, ensure_ascii=False, separators=(",", ":")
+        {
+            "v": CACHE_KEY_VERSION,
+            "t": normalize_cache_text(text),
+            "l": (lang or "").strip().lower(),
+            "e": "auto" if engine in _AUTO_ENGINES else engine,
+            "vo": voice or None,
+            "r": round(float(rate), 3),
+            "p": round(float(pitch), 3),
+            "f": (output_format or "").lower() or None,
+            "fx": effects or None,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+        default=str,
     )
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
@@ -42,16 +114,76 @@ def get_cache() -> CacheInterface:
 
     Notes:
         Prefers Redis if settings.enable_caching, settings.redis_url, and REDIS_AVAILABLE.
+        The Redis cache is created once per URL and reused while connected, so
+        callers do not pay a new connection and ping on every call.
         Falls back to global memory_cache on exceptions.
     """
     if settings.enable_caching and settings.redis_url and REDIS_AVAILABLE:
+        cache = _redis_caches.get(settings.redis_url)
+        if cache is not None and cache._client is not None:
+            return cache
         try:
-            return RedisCache(settings.redis_url)
+            cache = RedisCache(settings.redis_url)
         except Exception:
             return memory_cache
+        _redis_caches[settings.redis_url] = cache
+        return cache
     return memory_cache
 
 
+def get_async_cache() -> AsyncRedisCache | None:
+    """Return the shared async Redis cache for use from coroutines.
+
+    Returns:
+        AsyncRedisCache on the process-wide connection pool, or None if caching
+        is disabled, no Redis URL is configured, redis is not installed or the
+        server did not answer a ping.
+
+    Notes:
+        Reachability is checked through get_cache(), so a missing server costs
+        one failed connection here instead of one on every cache lookup.
+    """
+    if not (settings.enable_caching and settings.redis_url and REDIS_AVAILABLE):
+        return None
+    cache = _async_caches.get(settings.redis_url)
+    if cache is None:
+        if getattr(get_cache(), "_client", None) is None:
+            return None
+        cache = AsyncRedisCache(settings.redis_url, default_ttl=settings.cache_ttl)
+        _async_caches[settings.redis_url] = cache
+    return cache
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the shared single-flight layer for coalescing identical synthesis.
+
+    Returns:
+        A SingleFlight instance, backed by Redis locks when enabled.
+
+    Notes:
+        Uses Redis if settings.singleflight_redis, settings.redis_url, and
+        REDIS_AVAILABLE; otherwise (or if Redis does not answer a ping) coalesces
+        within the process only. One instance is kept per configuration, so every
+        caller shares the same in-flight requests.
+    """
+    lock_ttl = settings.singleflight_lock_ttl
+    url = None
+    if settings.singleflight_redis and settings.redis_url and REDIS_AVAILABLE:
+        url = settings.redis_url
+    flight = _single_flights.get((url, lock_ttl))
+    if flight is None:
+        redis_url = url
+        if url is not None:
+            try:
+                if RedisCache(url)._client is None:
+                    redis_url = None
+            except Exception:
+                redis_url = None
+        flight = SingleFlight(redis_url, lock_ttl=lock_ttl)
+        _single_flights[(url, lock_ttl)] = flight
+    return flight
+
+
 def clear_cache() -> None:
     """Clear all cached data.
 
@@ -124,8 +256,19 @@ __all__ = [
     "MemoryCache",
     "memory_cache",
     "RedisCache",
+    "AsyncRedisCache",
+    "SingleFlight",
+    "TieredAudioCache",
+    "TieredCacheStats",
+    "CACHE_KEY_VERSION",
     "cache_key",
+    "normalize_cache_text",
     "get_cache",
+    "get_async_cache",
+    "get_async_redis",
+    "get_redis_pool_stats",
+    "close_async_redis",
+    "get_single_flight",
     "clear_cache",
     "get_cache_stats",
     "is_cache_enabled",
@@ -0,0 +1,330 @@
+"""Async Redis backend for TTSKit.
+
+Uses redis.asyncio so Redis round trips never block the event loop. Clients for a
+given URL share one connection pool per process, which the cache and the rate
+limiter both draw from; asyncio connections are bound to the loop that opened
+them, so each running event loop gets its own pool.
+
+Values use the same typed storage format as RedisCache, so the sync and async
+backends can read each other's entries.
+"""
+
+import asyncio
+import weakref
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from ..config import settings
+from ..utils.logging_config import get_logger
+from .base import CacheStatsMixin
+from .redis import (
+    _MISSING,
+    REDIS_AVAILABLE,
+    AudioBlob,
+    _encode_value,
+    _expiry_args,
+    _load_value,
+)
+
+logger = get_logger(__name__)
+
+if REDIS_AVAILABLE:
+    import redis.asyncio as aioredis
+
+# event loop -> {redis url: pool}; entries go away with their loop
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_redis(url: str | None = None) -> "aioredis.Redis":
+    """Get an async Redis client backed by the shared pool for url.
+
+    Must be called from a running event loop. Creating the client is cheap: no
+    connection is opened until a command needs one.
+
+    Args:
+        url: Redis connection URL (defaults to settings.redis_url)
+
+    Returns:
+        redis.asyncio.Redis client using the process-wide pool for url
+
+    Raises:
+        ImportError: If the redis package is not installed
+    """
+    if not REDIS_AVAILABLE:
+        raise ImportError(
+            "Redis package not installed. Install with: pip install redis"
+        )
+    url = url or settings.redis_url or "redis://localhost:6379/0"
+    pools = _pools.setdefault(asyncio.get_running_loop(), {})
+    pool = pools.get(url)
+    if pool is None:
+        pool = aioredis.ConnectionPool.from_url(
+            url,
+            max_connections=settings.redis_max_connections,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+        pools[url] = pool
+    return aioredis.Redis(connection_pool=pool)
+
+
+def _redact_url(url: str) -> str:
+    """Drop credentials from a Redis URL for display."""
+    parts = urlsplit(url)
+    if "@" not in parts.netloc:
+        return url
+    host = parts.netloc.rsplit("@", 1)[1]
+    return urlunsplit(parts._replace(netloc=f"***@{host}"))
+
+
+def get_redis_pool_stats() -> dict[str, dict[str, int]]:
+    """Get usage statistics for the shared async connection pools.
+
+    Returns:
+        Dictionary keyed by Redis URL (credentials removed) with 'pools' (one
+        per event loop), 'max_connections', 'in_use' and 'available' totals
+    """
+    stats: dict[str, dict[str, int]] = {}
+    for pools in list(_pools.values()):
+        for url, pool in pools.items():
+            entry = stats.setdefault(
+                _redact_url(url),
+                {"pools": 0, "max_connections": 0, "in_use": 0, "available": 0},
+            )
+            entry["pools"] += 1
+            entry["max_connections"] += pool.max_connections
+            entry["in_use"] += len(getattr(pool, "_in_use_connections", ()))
+            entry["available"] += len(getattr(pool, "_available_connections", ()))
+    return stats
+
+
+async def close_async_redis() -> None:
+    """Disconnect the current event loop's shared pools."""
+    loop = asyncio.get_running_loop()
+    for pool in _pools.pop(loop, {}).values():
+        await pool.disconnect()
+
+
+class AsyncRedisCache(CacheStatsMixin):
+    """Async Redis cache on the shared connection pool.
+
+    Mirrors the RedisCache API with coroutines, so it shares only the statistics
+    counters with the sync caches, not CacheInterface. Redis errors are logged and
+    counted; reads then return the default and writes are dropped, so a Redis
+    outage degrades to cache misses instead of failed requests.
+    """
+
+    def __init__(self, redis_url: str | None = None, default_ttl: int = 3600):
+        """Initialize the async Redis cache.
+
+        Args:
+            redis_url: Redis connection URL (defaults to settings.redis_url)
+            default_ttl: Default time-to-live in seconds
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "Redis package not installed. Install with: pip install redis"
+            )
+        self.default_ttl = default_ttl
+        self.reset_stats()
+        self.url = redis_url or settings.redis_url or "redis://localhost:6379/0"
+
+    def _client(self) -> "aioredis.Redis":
+        return get_async_redis(self.url)
+
+    def _failed(self, op: str, error: Exception) -> None:
+        logger.warning(f"Async Redis {op} failed: {error}")
+        self._record_error()
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Get value from Redis cache.
+
+        Args:
+            key: Cache key
+            default: Default value if key not found
+
+        Returns:
+            Cached value or default if not found; audio is returned as its bytes
+        """
+        try:
+            raw = await self._client().get(key)
+        except Exception as e:
+            self._failed("get", e)
+            self._record_miss()
+            return default
+        return _load_value(self, raw, default)
+
+    async def get_audio(self, key: str) -> AudioBlob | None:
+        """Get audio together with its stored metadata.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            AudioBlob, or None if not found; plain bytes values are wrapped with
+            unknown metadata
+        """
+        try:
+            raw = await self._client().get(key)
+        except Exception as e:
+            self._failed("get", e)
+            self._record_miss()
+            return None
+        value = _load_value(self, raw, None, keep_audio=True)
+        if isinstance(value, bytes | bytearray):
+            return AudioBlob(data=bytes(value))
+        return value if isinstance(value, AudioBlob) else None
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values in one round trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys that were found and their values
+        """
+        if not keys:
+            return {}
+        try:
+            raw_values = await self._client().mget(keys)
+        except Exception as e:
+            self._failed("mget", e)
+            for _ in keys:
+                self._record_miss()
+            return {}
+        found = {}
+        for key, raw in zip(keys, raw_values, strict=False):
+            value = _load_value(self, raw, _MISSING)
+            if value is not _MISSING:
+                found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> bool:
+        """Set value in Redis cache with a single SET ... EX.
+
+        Args:
+            key: Cache key
+            value: Value to cache; bytes and AudioBlob are stored verbatim
+            ttl: Time to live in seconds (optional)
+
+        Returns:
+            True if the value was written
+        """
+        ttl_to_use = ttl if ttl is not None else self.default_ttl
+        try:
+            await self._client().set(
+                key, _encode_value(value), **_expiry_args(ttl_to_use)
+            )
+        except Exception as e:
+            self._failed("set", e)
+            return False
+        self._record_set()
+        return True
+
+    async def set_audio(
+        self,
+        key: str,
+        data: bytes,
+        codec: str,
+        sample_rate: int = 0,
+        duration: float = 0.0,
+        ttl: float | None = None,
+    ) -> bool:
+        """Store audio bytes with codec, sample rate and duration.
+
+        Args:
+            key: Cache key
+            data: Encoded audio bytes
+            codec: Codec or container name (max 8 chars)
+            sample_rate: Hz (0 if unknown)
+            duration: Length in seconds (0.0 if unknown)
+            ttl: Time to live in seconds (optional)
+
+        Returns:
+            True if the value was written
+        """
+        return await self.set(
+            key, AudioBlob(data, codec, sample_rate, duration), ttl=ttl
+        )
+
+    async def set_many(self, mapping: dict[str, Any], ttl: float | None = None) -> bool:
+        """Set several values in one pipelined round trip.
+
+        Args:
+            mapping: Keys and values to cache
+            ttl: Time to live in seconds for every value (optional)
+
+        Returns:
+            True if the values were written
+        """
+        if not mapping:
+            return True
+        expiry = _expiry_args(ttl if ttl is not None else self.default_ttl)
+        try:
+            pipe = self._client().pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, _encode_value(value), **expiry)
+            await pipe.execute()
+        except Exception as e:
+            self._failed("pipeline set", e)
+            return False
+        for _ in mapping:
+            self._record_set()
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from Redis cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key was deleted, False if not found
+        """
+        try:
+            result = await self._client().delete(key)
+        except Exception as e:
+            self._failed("delete", e)
+            return False
+        if result > 0:
+            self._record_delete()
+        return result > 0
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in Redis cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key exists, False otherwise
+        """
+        try:
+            return await self._client().exists(key) > 0
+        except Exception as e:
+            self._failed("exists", e)
+            return False
+
+    async def clear(self) -> None:
+        """Clear all cache entries."""
+        try:
+            await self._client().flushdb()
+        except Exception as e:
+            self._failed("flushdb", e)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with base stats plus 'redis_keys' and the shared pool
+            usage under 'connection_pools'
+        """
+        stats = {**self._stats_summary(), "connection_pools": get_redis_pool_stats()}
+        try:
+            stats["redis_keys"] = await self._client().dbsize()
+        except Exception as e:
+            logger.error(f"Redis stats error: {e}")
+        return stats
@@ -1,6 +1,6 @@
 """Base classes for TTSKit's caching system.
 
-This module provides an abstract interface for synchronous cache operations and a base class with shared functionality, such as tracking cache hits, misses, and other statistics.
+This module provides an abstract interface for synchronous cache operations, a mixin tracking cache hits, misses, and other statistics, and a base class combining the two.
 """
 
 from abc import ABC, abstractmethod
@@ -72,23 +72,14 @@ class CacheInterface(ABC):
         raise NotImplementedError
 
 
-class BaseCache(CacheInterface):
-    """Base cache implementation with common functionality."""
+class CacheStatsMixin:
+    """Hit, miss, set, delete and error counters shared by sync and async caches.
 
-    def __init__(self, default_ttl: int = 3600):
-        """Initialize base cache.
+    Kept apart from CacheInterface so async backends can count the same statistics
+    without overriding the synchronous methods with coroutines.
+    """
 
-        Args:
-            default_ttl: Default time to live in seconds
-        """
-        self.default_ttl = default_ttl
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "sets": 0,
-            "deletes": 0,
-            "errors": 0,
-        }
+    _stats: dict[str, int]
 
     def _increment_stat(self, stat_name: str) -> None:
         """Increment a specific statistic counter.
@@ -119,8 +110,8 @@ class BaseCache(CacheInterface):
         """Record a cache error."""
         self._increment_stat("errors")
 
-    def get_stats(self) -> dict[str, int]:
-        """Get cache statistics.
+    def _stats_summary(self) -> dict[str, int]:
+        """Get the counters with the calculated hit rate.
 
         Returns:
             Dictionary with cache statistics
@@ -152,3 +143,27 @@ class BaseCache(CacheInterface):
             "deletes": 0,
             "errors": 0,
         }
+
+
+class BaseCache(CacheStatsMixin, CacheInterface):
+    """Base cache implementation with common functionality."""
+
+    def __init__(self, default_ttl: int = 3600):
+        """Initialize base cache.
+
+        Args:
+            default_ttl: Default time to live in seconds
+        """
+        self.default_ttl = default_ttl
+        self.reset_stats()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+
+        Notes:
+            Includes calculated hit rate as (hits / total_requests) * 100.
+        """
+        return self._stats_summary()
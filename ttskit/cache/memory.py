@@ -1,27 +1,59 @@
 """In-memory cache backend for TTSKit.
 
-Implements a simple, thread-unsafe dictionary-based cache with TTL support and
-automatic expiration on access.
+Implements a thread-safe LRU cache bounded by entry count and total bytes, with
+TTL support. Eviction is O(1) (an ordered dict in recency order) and expiry is
+lazy: a heap of expiry times is drained as entries come due, so reads and stats
+never scan the whole cache.
 """
 
+import heapq
+import sys
+import threading
+from collections import OrderedDict
 from time import monotonic as _monotonic
 from typing import Any
 
+from ..config import settings
 from .base import BaseCache
 
 
-class MemoryCache(BaseCache):
-    """In-memory cache implementation."""
+def _estimate_size(value: Any) -> int:
+    """Approximate the memory held by a cached value in bytes."""
+    if isinstance(value, bytes | bytearray | memoryview):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return sys.getsizeof(value)
+
 
-    def __init__(self, default_ttl: int = 3600):
+class MemoryCache(BaseCache):
+    """In-memory LRU cache implementation."""
+
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = 256 * 1024 * 1024,
+    ):
         """Initialize memory cache.
 
         Args:
             default_ttl: Default time to live in seconds
+            max_entries: Maximum number of entries (None for no limit)
+            max_bytes: Maximum total size of cached values in bytes (None for no
+                limit); a single value larger than this is not cached
         """
         super().__init__(default_ttl)
-        self._cache: dict[str, bytes] = {}
-        self._timestamps: dict[str, float] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._expires: dict[str, float] = {}
+        self._sizes: dict[str, int] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._total_bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.RLock()
 
     def _is_expired(self, key: str) -> bool:
         """Check if key is expired.
@@ -32,9 +64,47 @@ class MemoryCache(BaseCache):
         Returns:
             True if key is expired, False otherwise
         """
-        if key not in self._timestamps:
+        if key not in self._expires:
             return True
-        return _monotonic() > self._timestamps[key]
+        return _monotonic() > self._expires[key]
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its bookkeeping (caller holds the lock)."""
+        self._cache.pop(key, None)
+        self._expires.pop(key, None)
+        self._total_bytes -= self._sizes.pop(key, 0)
+
+    def _purge_expired(self) -> int:
+        """Remove entries whose TTL has passed (caller holds the lock).
+
+        Returns:
+            Number of entries removed
+        """
+        now = _monotonic()
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            # Skip heap records left behind by a later set() of the same key
+            if self._expires.get(key) == expires_at:
+                self._remove(key)
+                purged += 1
+        self._expirations += purged
+        # Rebuild when re-sets have left mostly stale records behind
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(exp, key) for key, exp in self._expires.items()]
+            heapq.heapify(self._expiry_heap)
+        return purged
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within budget (lock held)."""
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from cache.
@@ -46,18 +116,19 @@ class MemoryCache(BaseCache):
         Returns:
             Cached value or default if not found
         """
-        if key in self._cache:
-            if self._is_expired(key):
-                # Auto-evict expired entries on access
-                self._cache.pop(key, None)
-                self._timestamps.pop(key, None)
-                self._record_miss()
-            else:
-                self._record_hit()
-                return self._cache[key]
-
-        self._record_miss()
-        return default
+        with self._lock:
+            if key in self._cache:
+                if self._is_expired(key):
+                    # Auto-evict expired entries on access
+                    self._remove(key)
+                    self._expirations += 1
+                else:
+                    self._cache.move_to_end(key)
+                    self._record_hit()
+                    return self._cache[key]
+
+            self._record_miss()
+            return default
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set value in cache.
@@ -66,11 +137,27 @@ class MemoryCache(BaseCache):
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (optional)
+
+        Notes:
+            Evicts least recently used entries when over the entry or byte budget.
         """
         ttl = ttl if ttl is not None else self.default_ttl
-        self._cache[key] = value
-        self._timestamps[key] = _monotonic() + float(ttl)
-        self._record_set()
+        size = _estimate_size(value)
+        with self._lock:
+            self._remove(key)
+            self._record_set()
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            expires_at = _monotonic() + float(ttl)
+            self._cache[key] = value
+            self._expires[key] = expires_at
+            self._sizes[key] = size
+            self._total_bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+            self._purge_expired()
+            self._evict()
 
     def delete(self, key: str) -> bool:
         """Delete value from cache.
@@ -81,17 +168,21 @@ class MemoryCache(BaseCache):
         Returns:
             True if key was deleted, False if not found
         """
-        if key in self._cache:
-            del self._cache[key]
-            del self._timestamps[key]
-            self._record_delete()
-            return True
-        return False
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                self._record_delete()
+                return True
+            return False
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-        self._timestamps.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expires.clear()
+            self._sizes.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
 
     def exists(self, key: str) -> bool:
         """Check if key exists in cache.
@@ -102,26 +193,18 @@ class MemoryCache(BaseCache):
         Returns:
             True if key exists, False otherwise
         """
-        return key in self._cache and not self._is_expired(key)
+        with self._lock:
+            return key in self._cache and not self._is_expired(key)
 
     def keys(self) -> list[str]:
         """Get all cache keys.
 
         Returns:
-            List of cache keys
+            List of cache keys, least recently used first
         """
-        # Clean up expired keys first
-        current_time = _monotonic()
-        expired_keys = [
-            key
-            for key, timestamp in self._timestamps.items()
-            if current_time > timestamp
-        ]
-        for key in expired_keys:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
-
-        return list(self._cache.keys())
+        with self._lock:
+            self._purge_expired()
+            return list(self._cache.keys())
 
     def values(self) -> list[Any]:
         """Get all cache values.
@@ -129,18 +212,9 @@ class MemoryCache(BaseCache):
         Returns:
             List of cache values
         """
-        # Clean up expired keys first
-        current_time = _monotonic()
-        expired_keys = [
-            key
-            for key, timestamp in self._timestamps.items()
-            if current_time > timestamp
-        ]
-        for key in expired_keys:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
-
-        return list(self._cache.values())
+        with self._lock:
+            self._purge_expired()
+            return list(self._cache.values())
 
     def items(self) -> list[tuple[str, Any]]:
         """Get all cache items.
@@ -148,18 +222,9 @@ class MemoryCache(BaseCache):
         Returns:
             List of (key, value) tuples
         """
-        # Clean up expired keys first
-        current_time = _monotonic()
-        expired_keys = [
-            key
-            for key, timestamp in self._timestamps.items()
-            if current_time > timestamp
-        ]
-        for key in expired_keys:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
-
-        return list(self._cache.items())
+        with self._lock:
+            self._purge_expired()
+            return list(self._cache.items())
 
     def size(self) -> int:
         """Get number of cache entries.
@@ -168,20 +233,11 @@ class MemoryCache(BaseCache):
             Number of cache entries
 
         Notes:
-            Cleans up expired keys before counting to reflect only valid entries.
+            Drops entries that have expired before counting.
         """
-        # Clean up expired keys first
-        current_time = _monotonic()
-        expired_keys = [
-            key
-            for key, timestamp in self._timestamps.items()
-            if current_time > timestamp
-        ]
-        for key in expired_keys:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
-
-        return len(self._cache)
+        with self._lock:
+            self._purge_expired()
+            return len(self._cache)
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -190,39 +246,27 @@ class MemoryCache(BaseCache):
             Dictionary with cache statistics
 
         Notes:
-            Includes base stats plus memory-specific details like total keys, expired keys cleaned up during this call, and estimated memory usage in bytes.
+            Includes base stats plus memory-specific details: total keys, keys
+            expired during this call, total evictions and expirations, tracked
+            memory usage in bytes and the configured budgets.
         """
-        # Clean up expired entries
-        current_time = _monotonic()
-        expired_keys = [
-            key
-            for key, timestamp in self._timestamps.items()
-            if current_time > timestamp
-        ]
-
-        for key in expired_keys:
-            self._cache.pop(key, None)
-            self._timestamps.pop(key, None)
-
-        # Get base stats from parent class
-        base_stats = super().get_stats()
-
-        # Add memory-specific stats
-        memory_usage = sum(
-            (
-                len(value)
-                if isinstance(value, bytes | bytearray)
-                else len(str(value).encode("utf-8"))
-            )
-            for value in self._cache.values()
-        )
-
-        return {
-            **base_stats,
-            "total_keys": len(self._cache),
-            "expired_keys": len(expired_keys),
-            "memory_usage_bytes": memory_usage,
-            "memory_usage": memory_usage,
-        }
+        with self._lock:
+            expired = self._purge_expired()
+            return {
+                **super().get_stats(),
+                "total_keys": len(self._cache),
+                "expired_keys": expired,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "memory_usage_bytes": self._total_bytes,
+                "memory_usage": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
 # Default global in-memory cache instance for quick access without instantiation
-memory_cache = MemoryCache()
+memory_cache = MemoryCache(
+    max_entries=settings.memory_cache_max_entries,
+    max_bytes=settings.memory_cache_max_mb * 1024 * 1024,
+)
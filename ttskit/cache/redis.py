@@ -1,12 +1,20 @@
 """Redis-backed cache for TTSKit.
 
-This module offers a persistent caching solution using Redis, including automatic serialization of common types and built-in statistics. It handles connection issues gracefully by falling back when Redis isn't available.
+This module offers a persistent caching solution using Redis, with a typed, binary-safe value format and built-in statistics. It handles connection issues gracefully by falling back when Redis isn't available.
+
+Values are stored behind a small header (magic, version, kind, flags): bytes and
+audio are stored verbatim, audio with its codec, sample rate and duration; strings
+and JSON values may be zstd-compressed when the optional zstandard package is
+installed. Values written without the header by older versions are still read.
 """
 
+import json
+import struct
+from dataclasses import dataclass
 from typing import Any
 
 from ..utils.logging_config import get_logger
-from .base import BaseCache
+from .base import BaseCache, CacheStatsMixin
 
 logger = get_logger(__name__)
 
@@ -19,6 +27,155 @@ try:
 except ImportError:
     pass
 
+ZSTD_AVAILABLE = False
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+# Leading NUL keeps the header from colliding with legacy JSON/UTF-8 values
+_MAGIC = b"\x00TK"
+_VERSION = 1
+_HEADER = struct.Struct(">3sBBB")  # magic, version, kind, flags
+_AUDIO_HEADER = struct.Struct(">8sIf")  # codec, sample rate, duration
+
+_KIND_BYTES = 0
+_KIND_STR = 1
+_KIND_JSON = 2
+_KIND_AUDIO = 3
+
+_FLAG_ZSTD = 1
+
+# Text and JSON values at least this large are compressed when zstd is available
+_COMPRESS_MIN_SIZE = 1024
+
+_MISSING = object()
+
+
+@dataclass
+class AudioBlob:
+    """Audio bytes with the metadata stored alongside them in Redis.
+
+    Args:
+        data: Encoded audio bytes.
+        codec: Codec or container name, e.g. 'ogg' or 'mp3' (max 8 chars).
+        sample_rate: Hz (0 if unknown).
+        duration: Length in seconds (0.0 if unknown).
+    """
+
+    data: bytes
+    codec: str = ""
+    sample_rate: int = 0
+    duration: float = 0.0
+
+
+def _encode_value(value: Any) -> bytes:
+    """Serialize a value into the typed storage format."""
+    if isinstance(value, AudioBlob):
+        header = _HEADER.pack(_MAGIC, _VERSION, _KIND_AUDIO, 0)
+        audio_header = _AUDIO_HEADER.pack(
+            value.codec.encode("ascii")[:8], value.sample_rate, value.duration
+        )
+        return header + audio_header + bytes(value.data)
+    if isinstance(value, bytes | bytearray | memoryview):
+        return _HEADER.pack(_MAGIC, _VERSION, _KIND_BYTES, 0) + bytes(value)
+
+    if isinstance(value, str):
+        kind, payload = _KIND_STR, value.encode("utf-8")
+    else:
+        kind = _KIND_JSON
+        payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+    flags = 0
+    if ZSTD_AVAILABLE and len(payload) >= _COMPRESS_MIN_SIZE:
+        payload = zstandard.ZstdCompressor().compress(payload)
+        flags |= _FLAG_ZSTD
+    return _HEADER.pack(_MAGIC, _VERSION, kind, flags) + payload
+
+
+def _decode_value(raw: Any) -> Any:
+    """Deserialize a stored value; AudioBlob for audio, decoded value otherwise."""
+    if not (
+        isinstance(raw, bytes | bytearray)
+        and len(raw) >= _HEADER.size
+        and raw[:3] == _MAGIC
+    ):
+        return _decode_legacy(raw)
+
+    _, version, kind, flags = _HEADER.unpack_from(raw)
+    if version != _VERSION:
+        raise ValueError(f"Unsupported cache value version: {version}")
+    body = memoryview(raw)[_HEADER.size :]
+
+    if kind == _KIND_AUDIO:
+        codec, sample_rate, duration = _AUDIO_HEADER.unpack_from(body)
+        return AudioBlob(
+            data=bytes(body[_AUDIO_HEADER.size :]),
+            codec=codec.rstrip(b"\x00").decode("ascii"),
+            sample_rate=sample_rate,
+            duration=duration,
+        )
+    if kind == _KIND_BYTES:
+        return bytes(body)
+
+    payload = bytes(body)
+    if flags & _FLAG_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd-compressed cache value but zstandard not installed")
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+    text = payload.decode("utf-8")
+    return text if kind == _KIND_STR else json.loads(text)
+
+
+def _decode_legacy(value: Any) -> Any:
+    """Decode a value written before the typed format (JSON, UTF-8 or raw)."""
+    try:
+        if isinstance(value, bytes | bytearray):
+            try:
+                return json.loads(value.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return value.decode("utf-8")
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+    except Exception:
+        if isinstance(value, bytes | bytearray):
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                return value
+        return value
+
+
+def _expiry_args(ttl: float | None) -> dict[str, int]:
+    """Build SET expiry arguments (EX, or PX for fractional seconds)."""
+    if ttl is None:
+        return {}
+    if float(ttl).is_integer():
+        return {"ex": int(ttl)}
+    return {"px": max(1, int(ttl * 1000))}
+
+
+def _load_value(
+    cache: CacheStatsMixin, raw: Any, default: Any, keep_audio: bool = False
+) -> Any:
+    """Decode a raw Redis reply and record the hit or miss on cache."""
+    if raw is None:
+        cache._record_miss()
+        return default
+    try:
+        value = _decode_value(raw)
+    except Exception as e:
+        logger.warning(f"Undecodable cache value: {e}")
+        cache._record_error()
+        cache._record_miss()
+        return default
+    cache._record_hit()
+    if isinstance(value, AudioBlob) and not keep_audio:
+        return value.data
+    return value
+
 
 class RedisCache(BaseCache):
     """Redis-based cache implementation."""
@@ -81,72 +238,122 @@ class RedisCache(BaseCache):
             default: Default value if key not found
 
         Returns:
-            Cached value or default if not found
+            Cached value or default if not found; audio is returned as its bytes
 
         Notes:
-            Tries to deserialize the value as JSON if possible; falls back to UTF-8 decoding for strings/bytes, or returns raw if undecodable.
-            Records a hit only if a valid value is retrieved.
+            Typed values are returned as stored, without guessing at their type.
+            Values without the header (older versions) are decoded as JSON, then
+            UTF-8, then returned raw.
         """
         if self._client is None:
             self._record_miss()
             return default
         client = self._get_client()
-        value = client.get(key)
-        if value is not None:
-            self._record_hit()
-            try:
-                import json
-
-                if isinstance(value, bytes | bytearray):
-                    try:
-                        return json.loads(value.decode("utf-8"))
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        return value.decode("utf-8")
-                if isinstance(value, str):
-                    return json.loads(value)
-                return value
-            except Exception:
-                if isinstance(value, bytes | bytearray):
-                    try:
-                        return value.decode("utf-8")
-                    except UnicodeDecodeError:
-                        return value
-                return value
-        else:
+        return _load_value(self, client.get(key), default)
+
+    def get_audio(self, key: str) -> AudioBlob | None:
+        """Get audio together with its stored metadata.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            AudioBlob, or None if not found; plain bytes values are wrapped with
+            unknown metadata
+        """
+        if self._client is None:
             self._record_miss()
-            return default
+            return None
+        value = _load_value(self, self._get_client().get(key), None, keep_audio=True)
+        if isinstance(value, bytes | bytearray):
+            return AudioBlob(data=bytes(value))
+        return value if isinstance(value, AudioBlob) else None
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values in one round trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys that were found and their values
+        """
+        if not keys:
+            return {}
+        if self._client is None:
+            for _ in keys:
+                self._record_miss()
+            return {}
+        raw_values = self._get_client().mget(keys)
+        found = {}
+        for key, raw in zip(keys, raw_values, strict=False):
+            value = _load_value(self, raw, _MISSING)
+            if value is not _MISSING:
+                found[key] = value
+        return found
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set value in Redis cache.
 
         Args:
             key: Cache key
-            value: Value to cache
+            value: Value to cache; bytes and AudioBlob are stored verbatim
             ttl: Time to live in seconds (optional)
 
         Notes:
-            Automatically serializes dictionaries and lists to JSON strings.
-            Sets expiration separately from the initial set operation for better testability.
+            Value and expiry are written atomically with a single SET ... EX.
             Records an error if no client is available.
         """
         if self._client is None:
             self._record_error()
             return
         client = self._get_client()
-        if isinstance(value, (dict, list)):
-            import json
-
-            value_to_store = json.dumps(value)
-        else:
-            value_to_store = value
-
         ttl_to_use = ttl if ttl is not None else self.default_ttl
-        result = client.set(key, value_to_store)
-        if ttl_to_use is not None:
-            client.expire(key, ttl_to_use)
+        result = client.set(key, _encode_value(value), **_expiry_args(ttl_to_use))
         self._record_set()
         return result
 
+    def set_audio(
+        self,
+        key: str,
+        data: bytes,
+        codec: str,
+        sample_rate: int = 0,
+        duration: float = 0.0,
+        ttl: int | None = None,
+    ) -> None:
+        """Store audio bytes with codec, sample rate and duration.
+
+        Args:
+            key: Cache key
+            data: Encoded audio bytes
+            codec: Codec or container name (max 8 chars)
+            sample_rate: Hz (0 if unknown)
+            duration: Length in seconds (0.0 if unknown)
+            ttl: Time to live in seconds (optional)
+        """
+        self.set(key, AudioBlob(data, codec, sample_rate, duration), ttl=ttl)
+
+    def set_many(self, mapping: dict[str, Any], ttl: int | None = None) -> None:
+        """Set several values in one pipelined round trip.
+
+        Args:
+            mapping: Keys and values to cache
+            ttl: Time to live in seconds for every value (optional)
+        """
+        if not mapping:
+            return
+        if self._client is None:
+            self._record_error()
+            return
+        expiry = _expiry_args(ttl if ttl is not None else self.default_ttl)
+        pipe = self._get_client().pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(key, _encode_value(value), **expiry)
+        pipe.execute()
+        for _ in mapping:
+            self._record_set()
+
     def delete(self, key: str) -> bool:
         """Delete value from Redis cache.
 
@@ -0,0 +1,212 @@
+"""Single-flight request coalescing for TTSKit.
+
+When many callers ask for the same synthesis at once (a popular greeting right after
+the cache was cleared), only the first one runs it; the others await the same
+in-flight result. Given a Redis URL, a short-lived Redis lock extends this across
+processes: one node synthesizes and publishes the audio bytes, nodes waiting
+on the lock pick them up instead of calling the engine again.
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from ..utils.logging_config import get_logger
+from .async_redis import get_async_redis
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Deletes the lock only if it still holds our token
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+
+    Callers of do() with the same key while a call is in flight share its result or
+    exception. The shared work runs in its own task, so a cancelled caller does not
+    cancel it for the others.
+
+    Across processes only bytes are shared: a bytes result is published as is,
+    any other result only if do() is given an encode callable. Without one,
+    other nodes still wait for the lock holder but then run fn themselves.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        lock_ttl: float = 30.0,
+        poll_interval: float = 0.05,
+        key_prefix: str = "ttskit:singleflight",
+    ):
+        """Initialize the coalescing layer.
+
+        Args:
+            redis_url: Redis URL used to coalesce across processes; commands go
+                through the shared async connection pool
+            lock_ttl: Seconds a Redis lock (and a published result) lives; should
+                exceed the slowest expected synthesis
+            poll_interval: Seconds between checks while another node holds the lock
+            key_prefix: Prefix for the Redis lock and result keys
+        """
+        self.redis_url = redis_url
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.key_prefix = key_prefix
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.stats: dict[str, int] = {
+            "calls": 0,
+            "coalesced": 0,
+            "remote_hits": 0,
+            "remote_errors": 0,
+        }
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], bytes] | None = None,
+    ) -> T | bytes:
+        """Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Coalescing key, normally the full synthesis cache key
+            fn: Zero-argument coroutine function producing the result
+            encode: Turns a non-bytes result into the bytes published to other
+                nodes; without it only bytes results are shared across processes
+
+        Returns:
+            The result of the shared call, or the bytes another node published
+        """
+        self.stats["calls"] += 1
+        task = self._in_flight.get(key)
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            self.stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._run(key, fn, encode))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of keys currently being produced."""
+        return sum(1 for task in self._in_flight.values() if not task.done())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with total calls, calls that joined an in-flight request,
+            results taken from another node, Redis errors and current in-flight keys
+        """
+        return {
+            **self.stats,
+            "in_flight": self.in_flight(),
+            "distributed": self.redis_url is not None,
+        }
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _run(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], bytes] | None,
+    ) -> T | bytes:
+        if self.redis_url is None:
+            return await fn()
+        return await self._run_distributed(
+            get_async_redis(self.redis_url), key, fn, encode
+        )
+
+    async def _run_distributed(
+        self,
+        client: Any,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        encode: Callable[[T], bytes] | None = None,
+    ) -> T | bytes:
+        """Run fn under a Redis lock, or reuse the result published by its holder."""
+        lock_key = f"{self.key_prefix}:lock:{key}"
+        result_key = f"{self.key_prefix}:result:{key}"
+        token = uuid.uuid4().hex
+        ttl_ms = max(1, int(self.lock_ttl * 1000))
+        deadline = time.monotonic() + self.lock_ttl
+
+        while True:
+            try:
+                # Check for a published result first, so a waiter that wakes up
+                # after the holder released the lock does not synthesize again
+                published = await client.get(result_key)
+                acquired = published is None and await client.set(
+                    lock_key, token, nx=True, px=ttl_ms
+                )
+            except Exception as e:
+                logger.warning(f"Single-flight lock unavailable, running locally: {e}")
+                self.stats["remote_errors"] += 1
+                return await fn()
+
+            if published is not None:
+                self.stats["remote_hits"] += 1
+                return published
+            if acquired:
+                # The previous holder may have published and released between
+                # our get and set; reuse its result instead of running fn again
+                try:
+                    published = await client.get(result_key)
+                except Exception as e:
+                    logger.warning(f"Single-flight result check failed: {e}")
+                    self.stats["remote_errors"] += 1
+                    published = None
+                if published is None:
+                    break
+                await self._release(client, lock_key, token)
+                self.stats["remote_hits"] += 1
+                return published
+            if time.monotonic() >= deadline:
+                # The holder is stuck or died without releasing; stop waiting
+                return await fn()
+            await asyncio.sleep(self.poll_interval)
+
+        try:
+            result = await fn()
+            if isinstance(result, bytes | bytearray):
+                payload = bytes(result)
+            elif encode is not None:
+                payload = encode(result)
+            else:
+                payload = None
+            if payload is not None:
+                try:
+                    await client.set(result_key, payload, px=ttl_ms)
+                except Exception as e:
+                    logger.warning(f"Failed to publish single-flight result: {e}")
+                    self.stats["remote_errors"] += 1
+            return result
+        finally:
+            await self._release(client, lock_key, token)
+
+    async def _release(self, client: Any, lock_key: str, token: str) -> None:
+        try:
+            await client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"Failed to release single-flight lock: {e}")
+            self.stats["remote_errors"] += 1
@@ -0,0 +1,193 @@
+"""Tiered audio cache for TTSKit.
+
+Looks audio up in an in-process LRU (L1), then the local disk cache (L2, an
+AudioManager), then shared Redis (L3). A hit in a slower tier is promoted into the
+faster ones. Writes go to L1 immediately; the disk and Redis writes run in the
+background, so a request never waits on the slower tiers. Any tier may be left
+out.
+"""
+
+import asyncio
+from typing import Any
+
+from ..utils.logging_config import get_logger
+from ..utils.performance import get_executor
+from .async_redis import AsyncRedisCache
+from .memory import MemoryCache
+
+logger = get_logger(__name__)
+
+TIERS = ("l1", "l2", "l3")
+
+
+class TieredCacheStats:
+    """Per-tier hit and miss counters, shareable between TieredAudioCache instances."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.tiers = {tier: {"hits": 0, "misses": 0} for tier in TIERS}
+        self.write_behind = {"writes": 0, "failures": 0}
+
+    def record(self, tier: str, hit: bool) -> None:
+        """Count one lookup at a tier."""
+        self.tiers[tier]["hits" if hit else "misses"] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get counters with hit ratios.
+
+        Returns:
+            Dictionary with 'l1', 'l2' and 'l3' (hits, misses, hit_ratio of the
+            lookups that reached that tier), overall 'hit_ratio' and
+            'write_behind' counts
+        """
+        stats: dict[str, Any] = {}
+        for tier, counts in self.tiers.items():
+            lookups = counts["hits"] + counts["misses"]
+            stats[tier] = {
+                **counts,
+                "hit_ratio": counts["hits"] / lookups if lookups else 0.0,
+            }
+        requests = self.tiers["l1"]["hits"] + self.tiers["l1"]["misses"]
+        hits = sum(counts["hits"] for counts in self.tiers.values())
+        stats["hit_ratio"] = hits / requests if requests else 0.0
+        stats["write_behind"] = dict(self.write_behind)
+        return stats
+
+
+async def _maybe_await(value: Any) -> Any:
+    return await value if hasattr(value, "__await__") else value
+
+
+class TieredAudioCache:
+    """Read-through, write-behind audio cache over memory, disk and Redis.
+
+    Args:
+        memory: L1 in-process cache.
+        disk: L2 disk cache; any object with AudioManager's get_from_cache and
+            save_to_cache methods.
+        redis: L3 shared async Redis cache.
+        ttl: Time to live in seconds for L1 and L3 entries (backend default if None).
+        stats: Counters to record into; pass a shared instance to aggregate
+            across caches.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCache | None = None,
+        disk: Any = None,
+        redis: AsyncRedisCache | None = None,
+        ttl: int | None = None,
+        stats: TieredCacheStats | None = None,
+    ):
+        self.memory = memory
+        self.disk = disk
+        self.redis = redis
+        self.ttl = ttl
+        self.stats = stats if stats is not None else TieredCacheStats()
+        self._pending: set[asyncio.Future] = set()
+
+    async def get(self, key: str) -> bytes | None:
+        """Look audio up tier by tier, promoting hits into faster tiers.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Audio bytes, or None if no tier has the key
+        """
+        if self.memory is not None:
+            data = self.memory.get(key)
+            self.stats.record("l1", bool(data))
+            if data:
+                return data
+
+        if self.disk is not None:
+            data = await self._disk_get(key)
+            self.stats.record("l2", bool(data))
+            if data:
+                self._set_memory(key, data)
+                return data
+
+        if self.redis is not None:
+            blob = await self.redis.get_audio(key)
+            self.stats.record("l3", bool(blob and blob.data))
+            if blob and blob.data:
+                self._set_memory(key, blob.data)
+                if self.disk is not None:
+                    # Keep the codec Redis recorded so the disk file gets the
+                    # right extension
+                    self._write_behind(
+                        self._disk_set(key, blob.data, blob.codec or "ogg")
+                    )
+                return blob.data
+
+        return None
+
+    async def set(self, key: str, data: bytes, format: str = "ogg") -> None:
+        """Store audio in L1 now and in L2 and L3 in the background.
+
+        Args:
+            key: Cache key
+            data: Audio bytes
+            format: Audio format, used as the disk file extension and Redis codec
+        """
+        self._set_memory(key, data)
+        if self.disk is not None:
+            self._write_behind(self._disk_set(key, data, format))
+        if self.redis is not None:
+            self._write_behind(self.redis.set_audio(key, data, format, ttl=self.ttl))
+
+    async def flush(self) -> None:
+        """Wait for pending background writes."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-tier statistics.
+
+        Returns:
+            Dictionary from TieredCacheStats.as_dict plus 'pending_writes'
+        """
+        return {**self.stats.as_dict(), "pending_writes": len(self._pending)}
+
+    def _set_memory(self, key: str, data: bytes) -> None:
+        if self.memory is not None:
+            self.memory.set(key, data, ttl=self.ttl)
+
+    async def _disk_get(self, key: str) -> bytes | None:
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
+                get_executor("audio"), self.disk.get_from_cache, key
+            )
+            return await _maybe_await(result)
+        except Exception as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+
+    async def _disk_set(self, key: str, data: bytes, format: str) -> None:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            get_executor("audio"), self.disk.save_to_cache, key, data, format
+        )
+        await _maybe_await(result)
+
+    def _write_behind(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._write_done)
+
+    def _write_done(self, task: asyncio.Future) -> None:
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None or task.result() is False:
+            self.stats.write_behind["failures"] += 1
+            if error is not None:
+                logger.warning(f"Write-behind cache write failed: {error}")
+        else:
+            self.stats.write_behind["writes"] += 1
@@ -78,6 +78,21 @@ class Settings(BaseSettings):
     enable_auth: bool = Field(default=False, description="Enable API authentication")
     default_engine: str = Field(default="edge", description="Default TTS engine")
     fallback_enabled: bool = Field(default=True, description="Enable engine fallback")
+    router_hedging: bool = Field(
+        default=False,
+        description="Start a backup engine when the primary exceeds its recent p95 latency",
+    )
+    router_hedge_max_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Maximum fraction of requests that may fire a hedge",
+    )
+    router_hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Latency samples per engine and language needed before hedging",
+    )
 
     default_format: str = Field(default="ogg", description="Default audio format")
     default_bitrate: str = Field(default="48k", description="Default audio bitrate")
@@ -124,6 +139,35 @@ class Settings(BaseSettings):
     piper_use_mps: bool = Field(
         default=False, description="Use MPS for Piper TTS Apple Silicon acceleration"
     )
+    piper_max_loaded_voices: int = Field(
+        default=4,
+        ge=0,
+        description="Maximum Piper voices kept loaded in memory (0 = unlimited)",
+    )
+    piper_max_loaded_mb: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum total size of loaded Piper models in MB (0 = unlimited)",
+    )
+    piper_preload_voices: str = Field(
+        default="", description="Comma-separated Piper voices to load at startup"
+    )
+    piper_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Piper synthesis worker processes (0 = synthesize in-process)",
+    )
+    piper_intra_op_threads: int = Field(
+        default=1,
+        ge=0,
+        description="ONNX intra-op threads per Piper worker (0 = onnxruntime default)",
+    )
+    piper_sentence_silence: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=5.0,
+        description="Silence inserted between Piper sentences in seconds",
+    )
 
     audio_bitrate: str = Field(
         default="48k",
@@ -136,6 +180,23 @@ class Settings(BaseSettings):
     audio_channels: int = Field(
         default=1, ge=1, le=2, description="Audio channels (1=mono, 2=stereo)"
     )
+    ffmpeg_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum ffmpeg worker processes, running or kept warm",
+    )
+    ffmpeg_timeout: float = Field(
+        default=30.0,
+        gt=0.0,
+        le=600.0,
+        description="Seconds an ffmpeg worker may take for one conversion",
+    )
+    resample_quality: str = Field(
+        default="medium",
+        pattern="^(low|medium|high)$",
+        description="Resampling filter length (low, medium, high)",
+    )
     temp_dir_prefix: str = Field(
         default="ttskit_",
         min_length=1,
@@ -153,6 +214,12 @@ class Settings(BaseSettings):
     cache_ttl: int = Field(
         default=3600, ge=60, le=86400, description="Cache TTL in seconds"
     )
+    memory_cache_max_entries: int = Field(
+        default=10000, ge=1, description="Max entries in the in-memory cache"
+    )
+    memory_cache_max_mb: int = Field(
+        default=256, ge=1, description="Max total size of the in-memory cache in MB"
+    )
 
     enable_rate_limiting: bool = Field(default=True, description="Enable rate limiting")
     rate_limit_rpm: int = Field(
@@ -172,6 +239,28 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis URL for caching/rate limiting",
     )
+    redis_max_connections: int = Field(
+        default=50,
+        ge=1,
+        le=10000,
+        description="Max connections in the shared async Redis pool per process",
+    )
+    redis_socket_timeout: float = Field(
+        default=2.0,
+        gt=0,
+        le=60,
+        description="Seconds before a Redis command or connect attempt times out",
+    )
+    singleflight_redis: bool = Field(
+        default=False,
+        description="Coalesce identical concurrent synthesis across processes via Redis locks",
+    )
+    singleflight_lock_ttl: int = Field(
+        default=30,
+        ge=1,
+        le=600,
+        description="Seconds a single-flight Redis lock and its published result live",
+    )
 
     database_url: str | None = Field(
         default=None, description="Database URL (overrides DATABASE_PATH)"
@@ -9,6 +9,7 @@ and shared capabilities.
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -203,6 +204,35 @@ class TTSEngine(ABC):
         """
         raise NotImplementedError
 
+    async def synth_stream_async(
+        self,
+        text: str,
+        lang: str | None = None,
+        voice: str | None = None,
+        rate: float = 1.0,
+        pitch: float = 0.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize text to audio, yielding chunks as soon as they are available.
+
+        Engines that can produce audio incrementally override this to cut
+        time-to-first-byte; the default yields the whole ``synth_async``
+        result as a single chunk.
+
+        Args:
+            text: The text to synthesize.
+            lang: Language code (e.g., 'en', 'fa', 'ar').
+            voice: Voice name (engine-specific).
+            rate: Speech rate multiplier (1.0 = normal).
+            pitch: Pitch adjustment in semitones (0.0 = normal).
+
+        Yields:
+            Audio byte chunks whose concatenation equals the full audio.
+        """
+        audio_data = await self.synth_async(text, lang, voice, rate, pitch)
+        if audio_data:
+            yield audio_data
+
     def capabilities(self) -> dict:
         """
         Get engine capabilities as dictionary.
@@ -0,0 +1,191 @@
+"""Per-engine circuit breakers for TTSKit.
+
+A breaker stops routing traffic to an engine that keeps failing, so requests fall
+through to the next engine in the language policy instead of waiting on a broken
+upstream. After a cool-down it lets a limited number of probe requests through and
+closes again once a probe succeeds.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-tracking breaker guarding a single engine.
+
+    The breaker opens when either ``failure_threshold`` consecutive requests fail,
+    or the error rate over the last ``window_size`` requests reaches
+    ``error_rate_threshold`` (once at least ``min_requests`` were seen). While open
+    it rejects requests; after ``recovery_timeout`` seconds it becomes half-open and
+    admits up to ``half_open_max_calls`` concurrent probes. A successful probe
+    closes the breaker, a failed one reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_requests: int = 10,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Name of the guarded engine
+            failure_threshold: Consecutive failures that open the breaker
+            error_rate_threshold: Error rate (0-1) over the window that opens the breaker
+            window_size: Number of recent outcomes used for the error rate
+            min_requests: Outcomes required before the error rate is considered
+            recovery_timeout: Seconds to stay open before admitting probes
+            half_open_max_calls: Concurrent probe requests allowed while half-open
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.error_rate_threshold = error_rate_threshold
+        self.min_requests = max(1, min_requests)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[bool] = deque(maxlen=max(1, window_size))
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.last_error: str | None = None
+        self.last_failure_time: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout elapsed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the engine.
+
+        A True result while half-open reserves a probe slot, which is released by
+        the following record_success or record_failure call.
+
+        Returns:
+            True if the request may proceed
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                self._close()
+                return
+            self._consecutive_failures = 0
+            self._outcomes.append(True)
+
+    def record_failure(self, error: BaseException | str | None = None) -> None:
+        """Record a failed request.
+
+        Args:
+            error: The error raised by the engine
+        """
+        with self._lock:
+            self.last_error = str(error) if error is not None else None
+            self.last_failure_time = time.time()
+            self._consecutive_failures += 1
+            self._outcomes.append(False)
+
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._open()
+            elif state == CLOSED and (
+                self._consecutive_failures >= self.failure_threshold
+                or (
+                    len(self._outcomes) >= self.min_requests
+                    and self._error_rate() >= self.error_rate_threshold
+                )
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """Give back a probe slot reserved by allow_request without an outcome.
+
+        Used when a request is cancelled before the engine answered, e.g. the
+        losing side of a hedged request.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded outcomes."""
+        with self._lock:
+            self._close()
+            self.last_error = None
+            self.last_failure_time = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get breaker state for monitoring.
+
+        Returns:
+            Dictionary with state, consecutive failures, error rate, last error and
+            seconds until probes are admitted (0 unless open)
+        """
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(
+                    0.0, self.recovery_timeout - (self._clock() - self._opened_at)
+                )
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "error_rate": self._error_rate(),
+                "last_error": self.last_error,
+                "last_failure_time": self.last_failure_time,
+                "retry_in": retry_in,
+            }
+
+    def _error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._probes_in_flight = 0
+        self._outcomes.clear()
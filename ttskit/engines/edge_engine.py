@@ -2,15 +2,17 @@
 
 This optional engine provides a synchronous interface compatible with TTSEngine,
 mapping language codes to default voices with fallbacks and supporting explicit overrides.
-It requires the edge-tts package and handles synthesis to MP3 files.
+It requires the edge-tts package and handles synthesis to MP3 files, or directly to
+in-memory MP3 chunks via the async streaming API.
 """
 
 import asyncio
 import os
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncIterator
 
 from ..exceptions import TTSKitEngineError, TTSKitFileError, TTSKitNetworkError
 from ..utils.logging_config import get_logger
+from ..utils.performance import get_executor
 from ..utils.temp_manager import TempFileManager
 from .base import EngineCapabilities, TTSEngine
 
@@ -105,11 +107,10 @@ class EdgeEngine(TTSEngine):
 
         try:
             asyncio.get_running_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(
-                    lambda: asyncio.run(self._async_synth_to_mp3(text, lang))
-                )
-                return future.result()
+            future = get_executor("edge").submit(
+                lambda: asyncio.run(self._async_synth_to_mp3(text, lang))
+            )
+            return future.result()
         except RuntimeError:
             return asyncio.run(self._async_synth_to_mp3(text, lang))
         except Exception as e:
@@ -143,35 +144,118 @@ class EdgeEngine(TTSEngine):
             Raw audio data as bytes (MP3 format).
 
         Raises:
+            TTSKitNetworkError: If Edge takes longer than ``save_timeout_seconds``.
             TTSKitEngineError: If synthesis or file handling fails.
 
         Note:
             Rate and pitch parameters are kept for API compatibility but require SSML for actual support.
             Returns empty bytes if engine is unavailable (e.g., for testing).
-            Temporary files are auto-cleaned up after reading.
+            Audio is collected in memory from the Edge stream; no temporary files are written.
         """
         lang = lang or self.default_lang
         self.validate_input(text, lang)
 
-        _voice_name = voice or self._pick_voice(lang)
-
         if not EDGE_AVAILABLE or not self._available:
             return b""
 
+        voice_name = voice or self._pick_voice(lang)
+        try:
+            chunks = [chunk async for chunk in self._stream_audio(text, voice_name)]
+            return b"".join(chunks)
+        except TimeoutError as e:
+            raise TTSKitNetworkError(
+                f"Edge TTS timed out after {self.save_timeout_seconds}s"
+            ) from e
+        except Exception as e:
+            raise TTSKitEngineError(f"Edge TTS synthesis failed: {e}", "edge") from e
+
+    async def synth_stream_async(
+        self,
+        text: str,
+        lang: str | None = None,
+        voice: str | None = None,
+        rate: float = 1.0,
+        pitch: float = 0.0,
+    ) -> AsyncIterator[bytes]:
+        """Stream synthesized MP3 chunks as they arrive from Edge TTS.
+
+        Args:
+            text: The text to synthesize into speech.
+            lang: Language code (e.g., 'en'). Uses default if None.
+            voice: Specific voice name to use. Falls back to language-based selection if None.
+            rate: Speech rate multiplier (kept for API compatibility).
+            pitch: Pitch adjustment (kept for API compatibility).
+
+        Yields:
+            Consecutive MP3 byte chunks; their concatenation is a complete MP3 stream.
+
+        Raises:
+            TTSKitNetworkError: On connection problems or when Edge has kept the
+                stream waiting for longer than ``save_timeout_seconds`` in total.
+            TTSKitEngineError: For other synthesis failures.
+
+        Note:
+            Yields nothing if the engine is unavailable (e.g., for testing).
+        """
+        lang = lang or self.default_lang
+        self.validate_input(text, lang)
+
+        if not EDGE_AVAILABLE or not self._available:
+            return
+
+        voice_name = voice or self._pick_voice(lang)
         try:
-            mp3_path = self.synth_to_mp3(text, lang)
-
-            with open(mp3_path, "rb") as f:
-                data = f.read()
-            try:
-                os.unlink(mp3_path)
-                os.rmdir(os.path.dirname(mp3_path))
-            except Exception as cleanup_error:
-                logger.debug(f"Failed to cleanup temp file: {cleanup_error}")
-            return data
+            async for chunk in self._stream_audio(text, voice_name):
+                yield chunk
+        except TimeoutError as e:
+            raise TTSKitNetworkError(
+                f"Edge TTS timed out after {self.save_timeout_seconds}s"
+            ) from e
         except Exception as e:
+            if "network" in str(e).lower() or "connection" in str(e).lower():
+                raise TTSKitNetworkError(f"Edge TTS network error: {e}") from e
             raise TTSKitEngineError(f"Edge TTS synthesis failed: {e}", "edge") from e
 
+    async def _stream_audio(self, text: str, voice_name: str) -> AsyncIterator[bytes]:
+        """Yield raw audio payloads from ``edge_tts.Communicate.stream()``.
+
+        Args:
+            text: The text to synthesize.
+            voice_name: Edge voice to synthesize with.
+
+        Yields:
+            MP3 byte chunks; metadata events such as word boundaries are skipped.
+
+        Raises:
+            TimeoutError: If waiting for Edge adds up to more than
+                ``save_timeout_seconds``.
+
+        Note:
+            Only time spent awaiting the next message counts towards the timeout;
+            time the consumer spends between chunks (e.g. a slow HTTP client) does
+            not.
+        """
+        communicate = edge_tts.Communicate(text, voice_name)
+        stream = communicate.stream()
+        loop = asyncio.get_running_loop()
+        remaining = self.save_timeout_seconds
+        try:
+            while True:
+                if remaining <= 0:
+                    raise TimeoutError()
+                started = loop.time()
+                try:
+                    message = await asyncio.wait_for(anext(stream), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                remaining -= loop.time() - started
+                if message.get("type") == "audio" and message.get("data"):
+                    yield message["data"]
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     def _pick_voice(self, lang: str | None) -> str:
         """Select the best voice for the given language code.
 
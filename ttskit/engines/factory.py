@@ -19,6 +19,19 @@ from .registry import EngineRegistry
 
 logger = get_logger(__name__)
 
+# Constructor arguments understood only by PiperEngine
+PIPER_ENGINE_KWARGS = (
+    "model_path",
+    "use_cuda",
+    "use_mps",
+    "max_loaded_voices",
+    "max_loaded_bytes",
+    "preload_voices",
+    "workers",
+    "intra_op_threads",
+    "sentence_silence",
+)
+
 
 class EngineFactory:
     """
@@ -231,12 +244,12 @@ class EngineFactory:
             try:
                 engine_kwargs = {}
                 if name == "piper":
-                    for key in ["model_path", "use_cuda", "use_mps"]:
+                    for key in PIPER_ENGINE_KWARGS:
                         if key in kwargs:
                             engine_kwargs[key] = kwargs[key]
                 elif name in ["gtts", "edge"]:
                     for key, value in kwargs.items():
-                        if key not in ["model_path", "use_cuda", "use_mps"]:
+                        if key not in PIPER_ENGINE_KWARGS:
                             engine_kwargs[key] = value
                 else:
                     engine_kwargs = kwargs
@@ -264,6 +277,12 @@ class EngineFactory:
                 {
                     "model_path": settings.piper_model_path,
                     "use_cuda": settings.piper_use_cuda,
+                    "max_loaded_voices": settings.piper_max_loaded_voices,
+                    "max_loaded_bytes": settings.piper_max_loaded_mb * 1024 * 1024,
+                    "preload_voices": settings.piper_preload_voices,
+                    "workers": settings.piper_workers,
+                    "intra_op_threads": settings.piper_intra_op_threads,
+                    "sentence_silence": settings.piper_sentence_silence,
                 }
             )
 
@@ -340,12 +359,12 @@ class EngineFactory:
         try:
             engine_kwargs = {}
             if name == "piper":
-                for key in ["model_path", "use_cuda", "use_mps"]:
+                for key in PIPER_ENGINE_KWARGS:
                     if key in kwargs:
                         engine_kwargs[key] = kwargs[key]
             elif name in ["gtts", "edge"]:
                 for key, value in kwargs.items():
-                    if key not in ["model_path", "use_cuda", "use_mps"]:
+                    if key not in PIPER_ENGINE_KWARGS:
                         engine_kwargs[key] = value
             else:
                 engine_kwargs = kwargs
@@ -2,19 +2,34 @@
 
 This is a standalone engine that can be used independently.
 Just import and use: from ttskit.engines.gtts_engine import GTTSEngine
+
+gTTS splits text into ~100 character segments and requests each one in turn.
+The async path here builds the same requests but sends them concurrently through
+the shared HTTP connection pool and joins the returned MP3 segments in order,
+without touching the filesystem.
 """
 
 import asyncio
+import base64
+import io
 import os
-from concurrent.futures import ThreadPoolExecutor
+import re
 
+import httpx
 from gtts import gTTS
 
-from ..exceptions import TTSKitEngineError
+from ..exceptions import TTSKitEngineError, TTSKitNetworkError
+from ..utils.logging_config import get_logger
+from ..utils.performance import get_connection_pool, get_executor
 from ..utils.temp_manager import TempFileManager
 from ..utils.text import clean_text, normalize_text
 from .base import EngineCapabilities, TTSEngine
 
+logger = get_logger(__name__)
+
+# Audio payload inside a batchexecute response line (same pattern gTTS uses)
+_AUDIO_PAYLOAD = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
 
 class GTTSEngine(TTSEngine):
     """TTS engine using Google Text-to-Speech (gTTS)."""
@@ -35,14 +50,19 @@ class GTTSEngine(TTSEngine):
         "zh": "zh",  # Chinese is supported
     }
 
-    def __init__(self, default_lang: str | None = None) -> None:
+    def __init__(
+        self, default_lang: str | None = None, endpoint: str | None = None
+    ) -> None:
         """Initialize the engine.
 
         Args:
             default_lang: Default language code. Defaults to 'en' if None.
+            endpoint: Override for the Google Translate batchexecute URL
+                (e.g. a local stand-in server). Defaults to the URL gTTS builds.
         """
         super().__init__(default_lang)
         self._available = True
+        self.endpoint = endpoint
 
     def synth_to_mp3(self, text: str, lang: str | None = None) -> str:
         """Synthesize text to MP3 using gTTS.
@@ -113,39 +133,101 @@ class GTTSEngine(TTSEngine):
         # Map language to gTTS supported language
         gtts_lang = self.LANGUAGE_MAP.get(lang, "en")
 
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor() as executor:
-            mp3_path = await loop.run_in_executor(
-                executor, self._synth_sync, text, gtts_lang
-            )
+        segments = await self._fetch_segments(text, gtts_lang)
+        return b"".join(segments)
 
-        # Read audio data
-        with open(mp3_path, "rb") as f:
-            audio_data = f.read()
+    async def _fetch_segments(self, text: str, lang: str) -> list[bytes]:
+        """Fetch the MP3 audio of every gTTS text segment concurrently.
 
-        # Cleanup
-        try:
-            os.unlink(mp3_path)
-            os.rmdir(os.path.dirname(mp3_path))
-        except Exception as e:
-            # Log the exception for debugging
-            import logging
+        Concurrency is bounded by the shared connection pool's request limit.
 
-            logging.getLogger(__name__).debug(f"Failed to cleanup temp files: {e}")
+        Args:
+            text: The text to synthesize.
+            lang: gTTS language code.
 
-        return audio_data
+        Returns:
+            MP3 data per segment, in text order.
 
-    def _synth_sync(self, text: str, lang: str) -> str:
-        """Synchronous synthesis helper."""
-        temp_manager = TempFileManager(prefix="tts_")
-        td = temp_manager.create_temp_dir()
-        mp3_path = os.path.join(td, "synth.mp3")
+        Raises:
+            TTSKitNetworkError: If a segment request fails.
+            TTSKitEngineError: If a response carries no audio.
 
+        Note:
+            The requests are built with gTTS's private ``_prepare_requests``. If a
+            gTTS release drops or changes it, the whole text is fetched through
+            the public ``gTTS.write_to_fp`` instead, sequentially and ignoring
+            ``endpoint``.
+        """
         tts = gTTS(text=text, lang=lang)
-        tts.save(mp3_path)
+        try:
+            prepared = tts._prepare_requests()
+        except (AttributeError, TypeError) as e:
+            logger.warning(f"gTTS request API unavailable, using write_to_fp: {e}")
+            return [await self._write_to_bytes(tts)]
+        pool = get_connection_pool()
+
+        async def _fetch(request) -> bytes:
+            url = self.endpoint or request.url
+            try:
+                response = await pool.request(
+                    "POST", url, content=request.body, headers=dict(request.headers)
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise TTSKitNetworkError(f"gTTS request failed: {e}", url) from e
+            return self._decode_segment(response.text)
+
+        return list(await asyncio.gather(*(_fetch(pr) for pr in prepared)))
+
+    @staticmethod
+    async def _write_to_bytes(tts: gTTS) -> bytes:
+        """Fetch all of tts's audio with gTTS's own blocking client.
+
+        Args:
+            tts: Configured gTTS instance.
+
+        Returns:
+            MP3 data for the whole text.
+
+        Raises:
+            TTSKitNetworkError: If gTTS fails to fetch the audio.
+        """
+
+        def _write() -> bytes:
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            return buffer.getvalue()
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(get_executor("gtts"), _write)
+        except Exception as e:
+            raise TTSKitNetworkError(f"gTTS request failed: {e}") from e
+
+    @staticmethod
+    def _decode_segment(body: str) -> bytes:
+        """Extract the MP3 data from a batchexecute response body.
+
+        Args:
+            body: Response text.
 
-        return mp3_path
+        Returns:
+            Decoded MP3 bytes.
+
+        Raises:
+            TTSKitEngineError: If the response contains no audio.
+        """
+        audio = b""
+        for line in body.splitlines():
+            if "jQ1olc" not in line:
+                continue
+            match = _AUDIO_PAYLOAD.search(line)
+            if not match:
+                raise TTSKitEngineError("gTTS response contained no audio", "gtts")
+            audio += base64.b64decode(match.group(1).encode("ascii"))
+        if not audio:
+            raise TTSKitEngineError("gTTS response contained no audio", "gtts")
+        return audio
 
     def get_capabilities(self) -> EngineCapabilities:
         """Get engine capabilities and limitations.
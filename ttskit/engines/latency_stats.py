@@ -0,0 +1,146 @@
+"""Streaming latency statistics for engine routing.
+
+Each (engine, language) pair gets a LatencyStats object that is updated in O(1)
+per request: an exponentially weighted moving average of latency, a fixed-size
+ring buffer of recent samples for percentiles, and success/failure counters.
+Percentiles and the routing score are computed lazily and cached until the next
+update, so selecting an engine does not rescan its history on every request.
+"""
+
+from typing import Any
+
+
+class LatencyStats:
+    """Latency and outcome statistics for one engine and language."""
+
+    __slots__ = (
+        "alpha",
+        "ewma",
+        "successes",
+        "failures",
+        "min_latency",
+        "max_latency",
+        "_samples",
+        "_pos",
+        "_size",
+        "_sorted",
+        "_score",
+    )
+
+    def __init__(self, window: int = 100, alpha: float = 0.2):
+        """Initialize empty statistics.
+
+        Args:
+            window: Number of recent latency samples kept for percentiles
+            alpha: EWMA smoothing factor (0-1); higher reacts faster to change
+        """
+        self.alpha = alpha
+        self.ewma: float | None = None
+        self.successes = 0
+        self.failures = 0
+        self.min_latency: float | None = None
+        self.max_latency: float | None = None
+        self._samples: list[float] = [0.0] * max(1, window)
+        self._pos = 0
+        self._size = 0
+        self._sorted: list[float] | None = None
+        self._score: float | None = None
+
+    @property
+    def total(self) -> int:
+        """Number of recorded requests (successes and failures)."""
+        return self.successes + self.failures
+
+    @property
+    def sample_count(self) -> int:
+        """Number of latency samples currently in the window."""
+        return self._size
+
+    @property
+    def success_rate(self) -> float:
+        """Share of successful requests, 0.0 when nothing was recorded."""
+        total = self.total
+        return self.successes / total if total else 0.0
+
+    def record_success(self, duration: float) -> None:
+        """Record a successful request and its latency.
+
+        Args:
+            duration: Latency in seconds
+        """
+        self.successes += 1
+        self.record_latency(duration)
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.failures += 1
+        self._score = None
+
+    def record_latency(self, duration: float) -> None:
+        """Record a latency sample without counting a request outcome.
+
+        Used for attempts that were cancelled, whose elapsed time is still a lower
+        bound on the engine's latency.
+
+        Args:
+            duration: Latency in seconds
+        """
+        if self.ewma is None:
+            self.ewma = duration
+        else:
+            self.ewma += self.alpha * (duration - self.ewma)
+        if self.min_latency is None or duration < self.min_latency:
+            self.min_latency = duration
+        if self.max_latency is None or duration > self.max_latency:
+            self.max_latency = duration
+
+        self._samples[self._pos] = duration
+        self._pos = (self._pos + 1) % len(self._samples)
+        if self._size < len(self._samples):
+            self._size += 1
+        self._sorted = None
+        self._score = None
+
+    def percentile(self, percentile: float) -> float | None:
+        """Get a latency percentile over the recent window.
+
+        Args:
+            percentile: Percentile to compute (0-100)
+
+        Returns:
+            Latency in seconds, or None if no samples were recorded
+        """
+        if not self._size:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples[: self._size])
+        rank = -(-percentile * self._size // 100)  # ceil without float drift
+        index = min(self._size - 1, max(0, int(rank) - 1))
+        return self._sorted[index]
+
+    @property
+    def score(self) -> float:
+        """Routing score: success rate divided by smoothed latency (cached)."""
+        if self._score is None:
+            latency = self.ewma if self.ewma is not None else 1.0
+            self._score = self.success_rate / (latency + 0.1)
+        return self._score
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a snapshot of the statistics.
+
+        Returns:
+            Dictionary with request counts, success rate, EWMA, min/max and p50/p95
+            latency in seconds
+        """
+        return {
+            "total_requests": self.total,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": self.success_rate,
+            "ewma_latency": self.ewma or 0.0,
+            "min_latency": self.min_latency or 0.0,
+            "max_latency": self.max_latency or 0.0,
+            "p50_latency": self.percentile(50) or 0.0,
+            "p95_latency": self.percentile(95) or 0.0,
+        }
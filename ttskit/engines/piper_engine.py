@@ -5,14 +5,22 @@ It's fast, lightweight, and supports multiple languages with local models.
 """
 
 import asyncio
+import json
 import os
-from concurrent.futures import ThreadPoolExecutor
+import struct
+import threading
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any
 
+from ..audio.pcm import PCMBuffer
+from ..exceptions import TTSKitEngineError
 from ..utils.logging_config import get_logger
+from ..utils.performance import get_executor
 from ..utils.temp_manager import TempFileManager
+from ..utils.text import split_sentences
 from .base import EngineCapabilities, TTSEngine
+from .piper_pool import SYNTHESIS_DEFAULTS, PiperProcessPool
 
 # Setup logging
 logger = get_logger(__name__)
@@ -24,15 +32,46 @@ try:
 except ImportError:
     PIPER_AVAILABLE = False
 
+# onnxruntime errors raised for a model file that is not a valid ONNX graph
+_CORRUPT_MODEL_ERRORS = frozenset({"InvalidProtobuf", "InvalidGraph"})
+
+
+def _is_unrecoverable_load_error(voice_file: Path, error: Exception) -> bool:
+    """Whether a failed voice load would fail again: its files are missing or corrupt.
+
+    Args:
+        voice_file: Path to the voice's ``.onnx`` model
+        error: Exception raised while loading
+
+    Returns:
+        True if retrying the load cannot succeed
+    """
+    return (
+        not Path(voice_file).is_file()
+        or isinstance(error, FileNotFoundError | json.JSONDecodeError)
+        or type(error).__name__ in _CORRUPT_MODEL_ERRORS
+    )
+
 
 class PiperEngine(TTSEngine):
-    """TTS engine using the new Piper TTS library (offline, fast)."""
+    """TTS engine using the new Piper TTS library (offline, fast).
+
+    Voices are discovered from ``*.onnx`` files and their JSON configs at startup,
+    but ONNX sessions are only created on first use and kept in a bounded LRU
+    (``self.voices``) so that large voice collections do not exhaust memory.
+    """
 
     def __init__(
         self,
         model_path: str = "./models/piper/",
         default_lang: str | None = None,
         use_cuda: bool = False,
+        max_loaded_voices: int = 0,
+        max_loaded_bytes: int = 0,
+        preload_voices: list[str] | str | None = None,
+        workers: int = 0,
+        intra_op_threads: int = 1,
+        sentence_silence: float = 0.0,
     ):
         """Initialize the Piper engine.
 
@@ -40,6 +79,12 @@ class PiperEngine(TTSEngine):
             model_path: Path to Piper voices directory
             default_lang: Default language code
             use_cuda: Whether to use CUDA for GPU acceleration
+            max_loaded_voices: Maximum number of voices kept loaded (0 = unlimited)
+            max_loaded_bytes: Maximum total model size kept loaded, in bytes (0 = unlimited)
+            preload_voices: Voice names (list or comma-separated string) to load at startup
+            workers: Number of synthesis worker processes (0 = synthesize in-process)
+            intra_op_threads: ONNX intra-op threads per worker process (0 = onnxruntime default)
+            sentence_silence: Seconds of silence inserted between sentences
         """
         if not PIPER_AVAILABLE:
             raise ImportError(
@@ -49,48 +94,247 @@ class PiperEngine(TTSEngine):
         super().__init__(default_lang)
         self.model_path = Path(model_path)
         self.use_cuda = use_cuda
+        self.max_loaded_voices = max(0, int(max_loaded_voices or 0))
+        self.max_loaded_bytes = max(0, int(max_loaded_bytes or 0))
         self.voices: dict[str, PiperVoice] = {}
         self.available_voices: list[str] = []
         self.configs: dict[str, dict] = {}
+        self.voice_files: dict[str, Path] = {}
+        self.config_files: dict[str, Path | None] = {}
+        self._voice_sizes: dict[str, int] = {}
+        self._voices_lock = threading.RLock()
+        # One lock per voice so a slow model load only blocks callers of that voice
+        self._voice_load_locks: dict[str, threading.Lock] = {}
+        self.workers = max(0, int(workers or 0))
+        self.intra_op_threads = max(0, int(intra_op_threads or 0))
+        self.sentence_silence = max(0.0, float(sentence_silence or 0.0))
+        self._process_pool: PiperProcessPool | None = None
         self._available = True
 
-        # Load available voices
+        # Discover available voices (models are loaded lazily)
         self.load_voices()
 
+        if isinstance(preload_voices, str):
+            preload_voices = [v.strip() for v in preload_voices.split(",")]
+        self.preload_voices = [v for v in preload_voices or [] if v]
+
+        if self.workers and self.voice_files:
+            # Workers load the preloaded voices themselves; the parent stays light
+            voice_files = {}
+            for name, path in self.voice_files.items():
+                config_file = self.config_files.get(name)
+                voice_files[name] = (
+                    str(path),
+                    str(config_file) if config_file else None,
+                )
+            self._process_pool = PiperProcessPool(
+                voice_files,
+                workers=self.workers,
+                intra_op_threads=self.intra_op_threads,
+                use_cuda=self.use_cuda,
+                preload_voices=self.preload_voices,
+                max_loaded_voices=self.max_loaded_voices,
+                max_loaded_bytes=self.max_loaded_bytes,
+            )
+            logger.info(f"Started Piper process pool with {self.workers} workers")
+        else:
+            for voice_name in self.preload_voices:
+                try:
+                    self._get_voice(voice_name)
+                except Exception as e:
+                    logger.warning(f"Failed to preload Piper voice {voice_name}: {e}")
+
     def load_voices(self) -> None:
-        """Load all available Piper voices."""
+        """Discover available Piper voices without loading their models.
+
+        Each ``<name>.onnx`` file is registered under ``<name>``; its config is read
+        from ``<name>.onnx.json`` (or ``<name>.json``) when present.
+        """
         if not self.model_path.exists():
             logger.warning(f"Piper voices path does not exist: {self.model_path}")
             self._available = False
             return
 
         # Look for .onnx files in the voices directory
-        voice_files = list(self.model_path.glob("*.onnx"))
+        voice_files = sorted(self.model_path.glob("*.onnx"))
         if not voice_files:
             logger.warning(f"No Piper voice models found in {self.model_path}")
             self._available = False
             return
 
         for voice_file in voice_files:
+            # Extract voice name from filename (e.g., "fa_IR-amir-medium.onnx")
+            voice_name = voice_file.stem
             try:
-                # Extract voice name from filename (e.g., "fa_IR-amir-medium.onnx")
-                voice_name = voice_file.stem
-
-                # Load voice model
-                voice = PiperVoice.load(str(voice_file), use_cuda=self.use_cuda)
-                self.voices[voice_name] = voice
+                self._voice_sizes[voice_name] = voice_file.stat().st_size
+            except OSError as e:
+                logger.warning(f"Failed to stat Piper voice {voice_file}: {e}")
+                continue
+
+            self.voice_files[voice_name] = voice_file
+            self.config_files[voice_name] = self._find_voice_config(voice_file)
+            self.configs[voice_name] = self._read_voice_config(
+                self.config_files[voice_name]
+            )
+            if voice_name not in self.available_voices:
                 self.available_voices.append(voice_name)
 
-                logger.info(f"Loaded Piper voice: {voice_name}")
+        if not self.available_voices:
+            logger.warning("No Piper voices found")
+            self._available = False
+        else:
+            logger.info(f"Discovered {len(self.available_voices)} Piper voices")
+
+    @staticmethod
+    def _find_voice_config(voice_file: Path) -> Path | None:
+        """Locate the JSON config that accompanies a voice model.
+
+        Args:
+            voice_file: Path to the ``.onnx`` model
+
+        Returns:
+            Path to ``<name>.onnx.json`` or ``<name>.json``, or None if neither exists
+        """
+        for config_path in (
+            voice_file.with_name(f"{voice_file.name}.json"),
+            voice_file.with_suffix(".json"),
+        ):
+            if config_path.exists():
+                return config_path
+        return None
+
+    @staticmethod
+    def _read_voice_config(config_path: Path | None) -> dict:
+        """Read a voice JSON config.
 
+        Args:
+            config_path: Path to the config, or None
+
+        Returns:
+            Parsed config, or an empty dict if missing or invalid
+        """
+        if config_path is None:
+            return {}
+        try:
+            with open(config_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read Piper config {config_path}: {e}")
+            return {}
+
+    def _get_voice(self, voice_name: str) -> "PiperVoice":
+        """Return a loaded voice, loading it and evicting older ones as needed.
+
+        The model is loaded outside the engine-wide lock, so requests for voices
+        that are already loaded are not held up. Concurrent requests for the same
+        voice wait on its load lock and share one load.
+
+        Args:
+            voice_name: Voice name
+
+        Returns:
+            Loaded PiperVoice
+
+        Raises:
+            ValueError: If the voice is unknown
+            TTSKitEngineError: If the model fails to load; the voice is only
+                dropped from available_voices if its files are missing or corrupt
+        """
+        with self._voices_lock:
+            voice = self._touch_voice(voice_name)
+            if voice is not None:
+                return voice
+            load_lock = self._voice_load_locks.setdefault(voice_name, threading.Lock())
+
+        with load_lock:
+            with self._voices_lock:
+                # Another caller may have loaded it while we waited
+                voice = self._touch_voice(voice_name)
+                if voice is not None:
+                    return voice
+                voice_file = self.voice_files.get(voice_name)
+                config_file = self.config_files.get(voice_name)
+            if voice_file is None:
+                raise ValueError(f"No Piper voice found: {voice_name}")
+
+            try:
+                voice = PiperVoice.load(
+                    str(voice_file),
+                    config_path=str(config_file) if config_file else None,
+                    use_cuda=self.use_cuda,
+                )
             except Exception as e:
                 logger.warning(f"Failed to load Piper voice {voice_file}: {e}")
+                if _is_unrecoverable_load_error(voice_file, e):
+                    with self._voices_lock:
+                        # Stop routing to a voice whose model is missing or corrupt;
+                        # other failures (e.g. out of memory) may pass, so keep it
+                        self.voice_files.pop(voice_name, None)
+                        if voice_name in self.available_voices:
+                            self.available_voices.remove(voice_name)
+                raise TTSKitEngineError(
+                    f"Failed to load Piper voice {voice_name}: {e}", "piper"
+                ) from e
+
+            with self._voices_lock:
+                self.voices[voice_name] = voice
+                logger.info(f"Loaded Piper voice: {voice_name}")
+                self._evict_voices()
+            return voice
 
-        if not self.voices:
-            logger.warning("No Piper voices loaded successfully")
-            self._available = False
-        else:
-            logger.info(f"Loaded {len(self.voices)} Piper voices")
+    def _touch_voice(self, voice_name: str) -> "PiperVoice | None":
+        """Mark a loaded voice most recently used; caller holds _voices_lock.
+
+        Args:
+            voice_name: Voice name
+
+        Returns:
+            The loaded PiperVoice, or None if it is not loaded
+        """
+        voice = self.voices.pop(voice_name, None)
+        if voice is not None:
+            # Re-insert to mark as most recently used
+            self.voices[voice_name] = voice
+        return voice
+
+    def _evict_voices(self) -> None:
+        """Unload least recently used voices until the configured limits hold.
+
+        The most recently used voice is never evicted.
+        """
+        while len(self.voices) > 1:
+            over_count = (
+                self.max_loaded_voices and len(self.voices) > self.max_loaded_voices
+            )
+            over_bytes = (
+                self.max_loaded_bytes and self.loaded_bytes() > self.max_loaded_bytes
+            )
+            if not (over_count or over_bytes):
+                break
+            oldest = next(iter(self.voices))
+            del self.voices[oldest]
+            logger.info(f"Unloaded Piper voice: {oldest}")
+
+    def loaded_bytes(self) -> int:
+        """Total on-disk size of currently loaded voice models.
+
+        Returns:
+            Size in bytes
+        """
+        return sum(self._voice_sizes.get(name, 0) for name in self.voices)
+
+    def _has_voice(self, voice_name: str | None) -> bool:
+        """Check whether a voice is loaded or can be loaded on demand.
+
+        Args:
+            voice_name: Voice name
+
+        Returns:
+            True if the voice is known
+        """
+        return bool(voice_name) and (
+            voice_name in self.voices or voice_name in self.voice_files
+        )
 
     def synth_to_mp3(self, text: str, lang: str | None = None) -> str:
         """Synthesize text to MP3 using Piper.
@@ -113,10 +357,11 @@ class PiperEngine(TTSEngine):
         # Run synthesis in thread pool
         try:
             asyncio.get_running_loop()
-            # If we're already in an event loop, run in thread
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._synth_sync_to_mp3, text, voice_name)
-                return future.result()
+            # If we're already in an event loop, run in the shared Piper pool
+            future = get_executor("piper").submit(
+                self._synth_sync_to_mp3, text, voice_name
+            )
+            return future.result()
         except RuntimeError:
             # No running loop, safe to use asyncio.run
             return asyncio.run(self._synth_async_to_mp3(text, voice_name))
@@ -141,7 +386,30 @@ class PiperEngine(TTSEngine):
             output_format: Output format (wav, mp3, ogg)
 
         Returns:
-            Audio data as bytes
+            Audio data as bytes (WAV; other formats are produced by the audio pipeline)
+        """
+        pcm = await self.synth_pcm_async(text, lang, voice, rate, pitch)
+        return pcm.to_wav_bytes()
+
+    async def synth_pcm_async(
+        self,
+        text: str,
+        lang: str | None = None,
+        voice: str | None = None,
+        rate: float = 1.0,
+        pitch: float = 0.0,
+    ) -> PCMBuffer:
+        """Synthesize text to raw PCM samples at the voice's native sample rate.
+
+        Args:
+            text: Text to synthesize
+            lang: Language code
+            voice: Voice name
+            rate: Speech rate multiplier
+            pitch: Pitch adjustment (not supported by Piper)
+
+        Returns:
+            PCMBuffer with 16-bit mono samples
         """
         lang = lang or self.default_lang
         self.validate_input(text, lang)
@@ -152,23 +420,149 @@ class PiperEngine(TTSEngine):
         else:
             voice_name = self._find_best_voice(lang)
 
-        if not voice_name or voice_name not in self.voices:
+        if not self._has_voice(voice_name):
             raise ValueError(f"No Piper voice found: {voice_name}")
 
-        # Run synthesis in thread pool
+        if self._process_pool is not None:
+            sample_rate = self._voice_sample_rate(voice_name)
+            pcm_chunks = []
+            async for _sample_rate, pcm in self._synth_sentences_parallel(
+                text, voice_name, rate
+            ):
+                pcm_chunks.append(pcm)
+            return PCMBuffer.from_int16_bytes(b"".join(pcm_chunks), sample_rate)
+
+        # Run synthesis in the shared Piper thread pool
         loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            audio_data = await loop.run_in_executor(
-                executor, self._synth_sync_to_bytes, text, voice_name, rate, pitch
-            )
+        return await loop.run_in_executor(
+            get_executor("piper"), self._synth_sync_to_pcm, text, voice_name, rate
+        )
 
-        # If output format is WAV, return as-is (already has WAV header)
-        if output_format.lower() == "wav":
-            return audio_data
+    async def synth_stream_async(
+        self,
+        text: str,
+        lang: str | None = None,
+        voice: str | None = None,
+        rate: float = 1.0,
+        pitch: float = 0.0,
+    ) -> AsyncIterator[bytes]:
+        """Stream WAV audio sentence by sentence as Piper produces it.
 
-        # For other formats, we need to convert
-        # This will be handled by the audio processing pipeline
-        return audio_data
+        The first chunk is a streaming WAV header (unknown length), followed by
+        raw 16-bit PCM for each sentence as soon as it is synthesized.
+
+        Args:
+            text: Text to synthesize
+            lang: Language code
+            voice: Voice name
+            rate: Speech rate multiplier
+            pitch: Pitch adjustment (not supported by Piper)
+
+        Yields:
+            WAV header bytes, then PCM chunks
+        """
+        lang = lang or self.default_lang
+        self.validate_input(text, lang)
+
+        voice_name = voice or self._find_best_voice(lang)
+        if not self._has_voice(voice_name):
+            raise ValueError(f"No Piper voice found: {voice_name}")
+
+        if self._process_pool is not None:
+            header_sent = False
+            async for sample_rate, pcm in self._synth_sentences_parallel(
+                text, voice_name, rate
+            ):
+                if not header_sent:
+                    yield self._wav_stream_header(sample_rate)
+                    header_sent = True
+                yield pcm
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        stop = threading.Event()
+
+        def _emit(item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # Event loop already closed; nobody is listening any more
+                stop.set()
+
+        def _produce() -> None:
+            try:
+                for item in self._iter_pcm_chunks(text, voice_name, rate):
+                    if stop.is_set():
+                        break
+                    _emit(item)
+            except Exception as e:
+                _emit(e)
+            finally:
+                _emit(finished)
+
+        loop.run_in_executor(get_executor("piper"), _produce)
+
+        header_sent = False
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                sample_rate, pcm = item
+                if not header_sent:
+                    yield self._wav_stream_header(sample_rate)
+                    header_sent = True
+                yield pcm
+        finally:
+            stop.set()
+
+    async def _synth_sentences_parallel(
+        self, text: str, voice_name: str, rate: float = 1.0
+    ) -> AsyncIterator[tuple[int, bytes]]:
+        """Synthesize sentences concurrently on the process pool, in order.
+
+        All sentences are submitted up front so the workers run them in
+        parallel; results are yielded in sentence order as soon as each
+        next sentence is ready, with configured silence between them.
+
+        Args:
+            text: Text to synthesize
+            voice_name: Voice name
+            rate: Speech rate multiplier
+
+        Yields:
+            Tuples of (sample_rate, 16-bit mono PCM bytes)
+        """
+        sentences = split_sentences(text)
+        futures = [
+            self._process_pool.submit(sentence, voice_name, rate)
+            for sentence in sentences or [text]
+        ]
+        try:
+            for index, future in enumerate(futures):
+                sample_rate, pcm = await asyncio.wrap_future(future)
+                if index and self.sentence_silence:
+                    yield sample_rate, self._silence(sample_rate)
+                yield sample_rate, pcm
+        finally:
+            # Drop queued sentences if the caller stops early or fails
+            for future in futures:
+                future.cancel()
+
+    def _silence(self, sample_rate: int) -> bytes:
+        """Build inter-sentence silence as 16-bit mono PCM.
+
+        Args:
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Zeroed PCM lasting ``sentence_silence`` seconds
+        """
+        return b"\x00\x00" * int(sample_rate * self.sentence_silence)
 
     def _find_best_voice(self, lang: str) -> str | None:
         """Find the best voice for a language.
@@ -206,8 +600,7 @@ class PiperEngine(TTSEngine):
         Returns:
             Path to WAV file
         """
-        # Generate audio data (now returns WAV format)
-        audio_data = self._synth_sync_to_bytes(text, voice_name)
+        pcm = self._synth_sync_to_pcm(text, voice_name)
 
         # Save to temporary WAV file
         temp_manager = TempFileManager(prefix="piper_")
@@ -215,7 +608,7 @@ class PiperEngine(TTSEngine):
         wav_path = os.path.join(td, "synth.wav")
 
         with open(wav_path, "wb") as f:
-            f.write(audio_data)
+            f.write(pcm.to_wav_bytes())
 
         return wav_path
 
@@ -229,19 +622,41 @@ class PiperEngine(TTSEngine):
         Returns:
             Path to MP3 file
         """
-        # Generate audio data (now returns WAV format)
-        audio_data = self._synth_sync_to_bytes(text, voice_name)
+        pcm = self._synth_sync_to_pcm(text, voice_name)
 
         # Save to temporary MP3 file
         temp_manager = TempFileManager(prefix="piper_")
         td = temp_manager.create_temp_dir()
         mp3_path = os.path.join(td, "synth.mp3")
 
-        with open(mp3_path, "wb") as f:
-            f.write(audio_data)
+        self._write_mp3(pcm, mp3_path)
 
         return mp3_path
 
+    def _write_mp3(self, pcm: PCMBuffer, mp3_path: str) -> None:
+        """Encode PCM straight to an MP3 file.
+
+        Args:
+            pcm: Samples to encode
+            mp3_path: Destination path
+
+        Note:
+            Falls back to writing WAV data when no MP3 encoder (ffmpeg) is available.
+        """
+        try:
+            from pydub import AudioSegment
+
+            AudioSegment(
+                data=pcm.to_int16_bytes(),
+                sample_width=2,
+                frame_rate=pcm.sample_rate,
+                channels=pcm.channels,
+            ).export(mp3_path, format="mp3")
+        except Exception as e:
+            logger.warning(f"MP3 encoding failed, writing WAV data instead: {e}")
+            with open(mp3_path, "wb") as f:
+                f.write(pcm.to_wav_bytes())
+
     def _synth_sync_to_bytes(
         self, text: str, voice_name: str, rate: float = 1.0, pitch: float = 0.0
     ) -> bytes:
@@ -256,57 +671,113 @@ class PiperEngine(TTSEngine):
         Returns:
             Audio data as bytes (WAV format with proper header)
         """
-        voice = self.voices[voice_name]
+        return self._synth_sync_to_pcm(text, voice_name, rate).to_wav_bytes()
 
-        # Create synthesis config
-        syn_config = SynthesisConfig(
-            volume=0.8,
-            length_scale=rate,
-            noise_scale=0.8,
-            noise_w_scale=0.9,
-            normalize_audio=True,
+    def _synth_sync_to_pcm(
+        self, text: str, voice_name: str, rate: float = 1.0
+    ) -> PCMBuffer:
+        """Synchronous synthesis to raw PCM samples.
+
+        Args:
+            text: Text to synthesize
+            voice_name: Voice name
+            rate: Speech rate multiplier
+
+        Returns:
+            PCMBuffer at the sample rate reported by the voice
+        """
+        sample_rate = None
+        pcm_chunks = []
+        for chunk_rate, pcm in self._iter_pcm_chunks(text, voice_name, rate):
+            sample_rate = chunk_rate
+            pcm_chunks.append(pcm)
+
+        return PCMBuffer.from_int16_bytes(
+            b"".join(pcm_chunks), sample_rate or self._voice_sample_rate(voice_name)
         )
 
-        # Generate audio using streaming synthesis
-        audio_chunks = []
-        for chunk in voice.synthesize(text, syn_config=syn_config):
-            audio_chunks.append(chunk.audio_int16_bytes)
+    def _voice_sample_rate(self, voice_name: str) -> int:
+        """Look up a voice's native sample rate.
+
+        Args:
+            voice_name: Voice name
 
-        # Combine all chunks
-        raw_audio_data = b"".join(audio_chunks)
+        Returns:
+            Sample rate from the loaded voice or its JSON config (22050 if unknown)
+        """
+        voice = self.voices.get(voice_name)
+        sample_rate = getattr(getattr(voice, "config", None), "sample_rate", None)
+        if isinstance(sample_rate, int) and sample_rate > 0:
+            return sample_rate
+        audio_config = self.configs.get(voice_name, {}).get("audio", {})
+        return int(audio_config.get("sample_rate", 22050))
+
+    def _iter_pcm_chunks(
+        self, text: str, voice_name: str, rate: float = 1.0
+    ) -> Iterator[tuple[int, bytes]]:
+        """Synchronously synthesize text, yielding one PCM chunk per sentence.
 
-        # Convert to WAV format with proper header
-        return self._raw_audio_to_wav(raw_audio_data)
+        Args:
+            text: Text to synthesize
+            voice_name: Voice name
+            rate: Speech rate multiplier
 
-    def _raw_audio_to_wav(self, raw_audio_data: bytes) -> bytes:
-        """Convert raw audio data to WAV format with proper header.
+        Yields:
+            Tuples of (sample_rate, 16-bit mono PCM bytes)
+        """
+        voice = self._get_voice(voice_name)
+
+        # Create synthesis config
+        syn_config = SynthesisConfig(length_scale=rate, **SYNTHESIS_DEFAULTS)
+
+        for index, chunk in enumerate(voice.synthesize(text, syn_config=syn_config)):
+            if index and self.sentence_silence:
+                yield chunk.sample_rate, self._silence(chunk.sample_rate)
+            yield chunk.sample_rate, chunk.audio_int16_bytes
+
+    @staticmethod
+    def _wav_stream_header(sample_rate: int, channels: int = 1) -> bytes:
+        """Build a 16-bit PCM WAV header for a stream of unknown length.
 
         Args:
-            raw_audio_data: Raw 16-bit PCM audio data
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
 
         Returns:
-            WAV file data with header
+            44-byte WAV header with RIFF and data sizes set to 0xFFFFFFFF
         """
-        import io
-        import wave
-
-        # WAV parameters (Piper default)
-        sample_rate = 22050
-        channels = 1
-        bits_per_sample = 16
+        block_align = channels * 2
+        return (
+            b"RIFF"
+            + struct.pack("<I", 0xFFFFFFFF)
+            + b"WAVEfmt "
+            + struct.pack(
+                "<IHHIIHH",
+                16,
+                1,
+                channels,
+                sample_rate,
+                sample_rate * block_align,
+                block_align,
+                16,
+            )
+            + b"data"
+            + struct.pack("<I", 0xFFFFFFFF)
+        )
 
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
+    def _raw_audio_to_wav(
+        self, raw_audio_data: bytes, sample_rate: int = 22050
+    ) -> bytes:
+        """Convert raw audio data to WAV format with proper header.
 
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(bits_per_sample // 8)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(raw_audio_data)
+        Args:
+            raw_audio_data: Raw 16-bit mono PCM audio data
+            sample_rate: Sample rate of the PCM data in Hz
 
-        # Get the complete WAV file data
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        Returns:
+            WAV file data with header
+        """
+        return PCMBuffer.from_int16_bytes(raw_audio_data, sample_rate).to_wav_bytes()
 
     async def _synth_async_to_wav(self, text: str, voice_name: str) -> str:
         """Asynchronous synthesis to WAV file.
@@ -318,18 +789,7 @@ class PiperEngine(TTSEngine):
         Returns:
             Path to WAV file
         """
-        # Generate audio data (now returns WAV format)
-        audio_data = self._synth_sync_to_bytes(text, voice_name)
-
-        # Save to temporary WAV file
-        temp_manager = TempFileManager(prefix="piper_")
-        td = temp_manager.create_temp_dir()
-        wav_path = os.path.join(td, "synth.wav")
-
-        with open(wav_path, "wb") as f:
-            f.write(audio_data)
-
-        return wav_path
+        return self._synth_sync(text, voice_name)
 
     async def _synth_async_to_mp3(self, text: str, voice_name: str) -> str:
         """Asynchronous synthesis to MP3 file.
@@ -341,18 +801,7 @@ class PiperEngine(TTSEngine):
         Returns:
             Path to MP3 file
         """
-        # Generate audio data (now returns WAV format)
-        audio_data = self._synth_sync_to_bytes(text, voice_name)
-
-        # Save to temporary MP3 file
-        temp_manager = TempFileManager(prefix="piper_")
-        td = temp_manager.create_temp_dir()
-        mp3_path = os.path.join(td, "synth.mp3")
-
-        with open(mp3_path, "wb") as f:
-            f.write(audio_data)
-
-        return mp3_path
+        return self._synth_sync_to_mp3(text, voice_name)
 
     def get_capabilities(self) -> EngineCapabilities:
         """Get engine capabilities and limitations.
@@ -403,7 +852,17 @@ class PiperEngine(TTSEngine):
         Returns:
             True if engine is available
         """
-        return PIPER_AVAILABLE and self._available and len(self.voices) > 0
+        return (
+            PIPER_AVAILABLE
+            and self._available
+            and (len(self.voice_files) > 0 or len(self.voices) > 0)
+        )
+
+    def close(self) -> None:
+        """Shut down the synthesis process pool, if one was started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     def set_available(self, available: bool) -> None:
         """Set engine availability (for testing).
@@ -422,7 +881,7 @@ class PiperEngine(TTSEngine):
         Returns:
             Model information or None if not found
         """
-        if model_key not in self.voices:
+        if not self._has_voice(model_key):
             return None
 
         config = self.configs.get(model_key, {})
@@ -432,15 +891,16 @@ class PiperEngine(TTSEngine):
             "voice": model_key.split("_")[1],
             "config": config,
             "available": True,
+            "loaded": model_key in self.voices,
+            "size_bytes": self._voice_sizes.get(model_key, 0),
         }
 
     def get_all_models_info(self) -> dict[str, dict[str, Any]]:
-        """Get information about all loaded models.
+        """Get information about all discovered models.
 
         Returns:
             Dictionary with model information
         """
-        return {
-            model_key: self.get_model_info(model_key)
-            for model_key in self.voices.keys()
-        }
+        model_keys = list(self.available_voices)
+        model_keys += [key for key in self.voices if key not in model_keys]
+        return {model_key: self.get_model_info(model_key) for model_key in model_keys}
@@ -0,0 +1,346 @@
+"""Process pool backend for Piper synthesis.
+
+ONNX inference for Piper voices is CPU bound, so running it on threads inside a
+single interpreter serializes requests on the GIL and on shared sessions. This
+module runs synthesis in worker processes instead: every worker loads its voices
+once (in the pool initializer or on first use) and keeps them in a bounded LRU,
+returning raw 16-bit PCM to the parent through the executor's result pipe.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import onnxruntime
+    from piper import PiperConfig, PiperVoice, SynthesisConfig
+
+    PIPER_POOL_AVAILABLE = True
+except ImportError:
+    PIPER_POOL_AVAILABLE = False
+
+# Synthesis parameters shared by in-process and pooled Piper synthesis
+SYNTHESIS_DEFAULTS: dict[str, Any] = {
+    "volume": 0.8,
+    "noise_scale": 0.8,
+    "noise_w_scale": 0.9,
+    "normalize_audio": True,
+}
+
+# Per-process state, populated by _init_worker inside each worker
+_worker_voice_files: dict[str, tuple[str, str | None]] = {}
+_worker_voices: dict[str, Any] = {}
+_worker_voice_sizes: dict[str, int] = {}
+_worker_options: dict[str, Any] = {}
+
+
+def load_voice_with_threads(
+    model_path: str,
+    config_path: str | None = None,
+    use_cuda: bool = False,
+    intra_op_threads: int = 0,
+) -> "PiperVoice":
+    """Load a Piper voice with explicit ONNX Runtime threading options.
+
+    Mirrors ``PiperVoice.load`` but lets the caller size the session's
+    intra-op thread pool, which matters when several processes share the cores.
+
+    Args:
+        model_path: Path to the ``.onnx`` model.
+        config_path: Path to the JSON config (defaults to ``<model>.json``).
+        use_cuda: Whether to use the CUDA execution provider.
+        intra_op_threads: ONNX intra-op threads (0 = onnxruntime default).
+
+    Returns:
+        Loaded PiperVoice.
+    """
+    with open(config_path or f"{model_path}.json", encoding="utf-8") as f:
+        config = PiperConfig.from_dict(json.load(f))
+
+    options = onnxruntime.SessionOptions()
+    if intra_op_threads > 0:
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+
+    providers: list[Any] = (
+        [("CUDAExecutionProvider", {"cudnn_conv_algo_search": "HEURISTIC"})]
+        if use_cuda
+        else ["CPUExecutionProvider"]
+    )
+    session = onnxruntime.InferenceSession(
+        str(model_path), sess_options=options, providers=providers
+    )
+    return PiperVoice(session=session, config=config)
+
+
+def _init_worker(
+    voice_files: dict[str, tuple[str, str | None]],
+    preload: list[str],
+    use_cuda: bool,
+    intra_op_threads: int,
+    max_loaded_voices: int = 0,
+    max_loaded_bytes: int = 0,
+) -> None:
+    """Pool initializer: remember voice locations and preload selected voices.
+
+    Args:
+        voice_files: Mapping of voice name to (model path, config path).
+        preload: Voice names to load immediately.
+        use_cuda: Whether to use the CUDA execution provider.
+        intra_op_threads: ONNX intra-op threads per session.
+        max_loaded_voices: Maximum voices each worker keeps loaded (0 = unlimited).
+        max_loaded_bytes: Maximum total model size each worker keeps loaded, in
+            bytes (0 = unlimited).
+    """
+    _worker_voice_files.clear()
+    _worker_voice_files.update(voice_files)
+    _worker_voices.clear()
+    _worker_voice_sizes.clear()
+    _worker_options.update(
+        use_cuda=use_cuda,
+        intra_op_threads=intra_op_threads,
+        max_loaded_voices=max_loaded_voices,
+        max_loaded_bytes=max_loaded_bytes,
+    )
+
+    for voice_name in preload:
+        try:
+            _get_worker_voice(voice_name)
+        except Exception as e:
+            logger.warning(f"Piper worker failed to preload {voice_name}: {e}")
+
+
+def _get_worker_voice(voice_name: str) -> "PiperVoice":
+    """Return a voice loaded in the current worker, loading it on first use.
+
+    Loading a voice evicts the worker's least recently used ones once the
+    configured count or size limit is exceeded, as PiperEngine does in-process.
+
+    Args:
+        voice_name: Voice name.
+
+    Returns:
+        Loaded PiperVoice.
+
+    Raises:
+        ValueError: If the voice is unknown to the pool.
+    """
+    voice = _worker_voices.pop(voice_name, None)
+    if voice is not None:
+        # Re-insert to mark as most recently used
+        _worker_voices[voice_name] = voice
+        return voice
+
+    if voice_name not in _worker_voice_files:
+        raise ValueError(f"No Piper voice found: {voice_name}")
+    model_path, config_path = _worker_voice_files[voice_name]
+    voice = load_voice_with_threads(
+        model_path,
+        config_path,
+        use_cuda=_worker_options.get("use_cuda", False),
+        intra_op_threads=_worker_options.get("intra_op_threads", 0),
+    )
+    try:
+        _worker_voice_sizes[voice_name] = os.path.getsize(model_path)
+    except OSError:
+        _worker_voice_sizes[voice_name] = 0
+    _worker_voices[voice_name] = voice
+    _evict_worker_voices()
+    return voice
+
+
+def _evict_worker_voices() -> None:
+    """Unload the worker's least recently used voices until its limits hold.
+
+    The most recently used voice is never evicted.
+    """
+    max_voices = _worker_options.get("max_loaded_voices", 0)
+    max_bytes = _worker_options.get("max_loaded_bytes", 0)
+    while len(_worker_voices) > 1:
+        over_count = max_voices and len(_worker_voices) > max_voices
+        over_bytes = max_bytes and (
+            sum(_worker_voice_sizes.get(name, 0) for name in _worker_voices) > max_bytes
+        )
+        if not (over_count or over_bytes):
+            break
+        oldest = next(iter(_worker_voices))
+        del _worker_voices[oldest]
+        _worker_voice_sizes.pop(oldest, None)
+
+
+def _synthesize_in_worker(
+    text: str, voice_name: str, rate: float = 1.0
+) -> tuple[int, bytes]:
+    """Synthesize text inside a worker process.
+
+    Args:
+        text: Text to synthesize.
+        voice_name: Voice name.
+        rate: Speech rate multiplier (Piper ``length_scale``).
+
+    Returns:
+        Tuple of (sample_rate, 16-bit mono PCM bytes).
+    """
+    voice = _get_worker_voice(voice_name)
+    syn_config = SynthesisConfig(length_scale=rate, **SYNTHESIS_DEFAULTS)
+
+    sample_rate = voice.config.sample_rate
+    pcm_chunks = []
+    for chunk in voice.synthesize(text, syn_config=syn_config):
+        sample_rate = chunk.sample_rate
+        pcm_chunks.append(chunk.audio_int16_bytes)
+    return sample_rate, b"".join(pcm_chunks)
+
+
+class PiperProcessPool:
+    """Pool of worker processes that each hold preloaded Piper voices.
+
+    Workers are started lazily on the first submitted job and use the ``spawn``
+    start method, so they never inherit event loops or ONNX thread pools from
+    the parent process. A worker that dies (e.g. killed by the OOM killer) breaks
+    the whole executor; the pool then starts a fresh one and retries the job once.
+    """
+
+    def __init__(
+        self,
+        voice_files: dict[str, tuple[str, str | None]],
+        workers: int | None = None,
+        intra_op_threads: int = 1,
+        use_cuda: bool = False,
+        preload_voices: list[str] | None = None,
+        max_loaded_voices: int = 0,
+        max_loaded_bytes: int = 0,
+    ):
+        """Initialize the pool.
+
+        Args:
+            voice_files: Mapping of voice name to (model path, config path).
+            workers: Number of worker processes (defaults to the CPU count).
+            intra_op_threads: ONNX intra-op threads per worker session (0 = onnxruntime default).
+            use_cuda: Whether workers use the CUDA execution provider.
+            preload_voices: Voices each worker loads at startup.
+            max_loaded_voices: Maximum voices each worker keeps loaded (0 = unlimited).
+            max_loaded_bytes: Maximum total model size each worker keeps loaded,
+                in bytes (0 = unlimited).
+        """
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.intra_op_threads = max(0, int(intra_op_threads))
+        self.voice_files = dict(voice_files)
+        self.preload_voices = [
+            name for name in (preload_voices or []) if name in self.voice_files
+        ]
+        self._initargs = (
+            self.voice_files,
+            self.preload_voices,
+            bool(use_cuda),
+            self.intra_op_threads,
+            max(0, int(max_loaded_voices or 0)),
+            max(0, int(max_loaded_bytes or 0)),
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self.restarts = 0
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken executor, unless another caller already did."""
+        with self._lock:
+            if self._closed or self._executor is not broken:
+                return
+            logger.warning("Piper worker process died; restarting the pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+            self.restarts += 1
+
+    def submit(self, text: str, voice_name: str, rate: float = 1.0) -> Future:
+        """Schedule synthesis on a worker.
+
+        Args:
+            text: Text to synthesize.
+            voice_name: Voice name.
+            rate: Speech rate multiplier.
+
+        Returns:
+            Future resolving to (sample_rate, PCM bytes).
+        """
+        result: Future = Future()
+        self._submit(result, (text, voice_name, rate), retries=1)
+        return result
+
+    def _submit(self, result: Future, args: tuple, retries: int) -> None:
+        """Run a job for result, retrying on a fresh executor if the pool breaks."""
+        executor = self._executor
+        try:
+            future = executor.submit(_synthesize_in_worker, *args)
+        except BrokenProcessPool as e:
+            if retries <= 0:
+                result.set_exception(e)
+                return
+            self._restart(executor)
+            self._submit(result, args, retries - 1)
+            return
+        except Exception as e:
+            result.set_exception(e)
+            return
+
+        def _done(done: Future) -> None:
+            if result.done():
+                return
+            if done.cancelled():
+                result.cancel()
+                return
+            error = done.exception()
+            if isinstance(error, BrokenProcessPool) and retries > 0:
+                self._restart(executor)
+                self._submit(result, args, retries - 1)
+            elif error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(done.result())
+
+        # Cancelling the caller's future drops the job if it has not started
+        result.add_done_callback(lambda r: r.cancelled() and future.cancel())
+        future.add_done_callback(_done)
+
+    async def synthesize_async(
+        self, text: str, voice_name: str, rate: float = 1.0
+    ) -> tuple[int, bytes]:
+        """Synthesize text on a worker without blocking the event loop.
+
+        Args:
+            text: Text to synthesize.
+            voice_name: Voice name.
+            rate: Speech rate multiplier.
+
+        Returns:
+            Tuple of (sample_rate, 16-bit mono PCM bytes).
+        """
+        return await asyncio.wrap_future(self.submit(text, voice_name, rate))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all worker processes.
+
+        Args:
+            wait: Whether to wait for running jobs to finish.
+        """
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+        executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -4,6 +4,7 @@ This module manages a centralized registry for TTS engines, their capabilities,
 It enables dynamic engine selection based on requirements and tracks usage statistics.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -12,6 +13,9 @@ from .base import EngineCapabilities, TTSEngine
 
 logger = get_logger(__name__)
 
+# Recent durations kept per engine for stats
+_METRICS_WINDOW = 100
+
 
 @dataclass
 class LanguagePolicy:
@@ -45,7 +49,7 @@ class EngineRegistry:
         self.engines: dict[str, TTSEngine] = {}
         self.capabilities: dict[str, EngineCapabilities] = {}
         self._policies: dict[str, list[str]] = {}
-        self.performance_metrics: dict[str, list[float]] = {}
+        self.performance_metrics: dict[str, deque[float]] = {}
         self._failure_count: dict[str, int] = {}
 
     def register_engine(
@@ -69,7 +73,7 @@ class EngineRegistry:
         self._engines[name] = engine
         if capabilities is not None:
             self.capabilities[name] = capabilities
-        self.performance_metrics[name] = []
+        self.performance_metrics[name] = deque(maxlen=_METRICS_WINDOW)
         if not hasattr(self, "failure_counts"):
             self.failure_counts = {}
         self.failure_counts[name] = 0
@@ -256,7 +260,7 @@ class EngineRegistry:
         """Log a successful synthesis operation for metrics tracking.
 
         Increments success count and appends duration if provided.
-        Keeps only the last 100 durations for efficiency.
+        Keeps only the last 100 durations in a bounded deque.
 
         Args:
             engine_name: The engine that succeeded.
@@ -267,16 +271,11 @@ class EngineRegistry:
         self._success_count[engine_name] = self._success_count.get(engine_name, 0) + 1
 
         if engine_name not in self.performance_metrics:
-            self.performance_metrics[engine_name] = []
+            self.performance_metrics[engine_name] = deque(maxlen=_METRICS_WINDOW)
 
         if duration is not None:
             self.performance_metrics[engine_name].append(duration)
 
-        if len(self.performance_metrics[engine_name]) > 100:
-            self.performance_metrics[engine_name] = self.performance_metrics[
-                engine_name
-            ][-100:]
-
     def record_failure(self, engine_name: str) -> None:
         """Increment failure count for an engine.
 
@@ -356,8 +355,8 @@ class EngineRegistry:
 
     def reset_stats(self) -> None:
         """Clear all performance metrics, failures, and success counts."""
-        for engine_name in list(self.performance_metrics.keys()):
-            self.performance_metrics[engine_name] = []
+        for durations in self.performance_metrics.values():
+            durations.clear()
         self._failure_count = {}
         if hasattr(self, "_success_count"):
             self._success_count = {}
@@ -6,29 +6,68 @@ based on language, requirements, and performance metrics.
 
 import asyncio
 import time
+from collections import deque
 from typing import Any
 
+from ..config import settings
 from ..exceptions import AllEnginesFailedError, EngineNotFoundError
 from ..utils.logging_config import get_logger
+from .circuit_breaker import CircuitBreaker
+from .latency_stats import LatencyStats
 from .registry import EngineRegistry
 
 # Setup logging
 logger = get_logger(__name__)
 
+# Durations kept per engine for record_success
+_METRICS_WINDOW = 100
+
 
 class SmartRouter:
     """Intelligent engine selection and routing system."""
 
-    def __init__(self, registry: EngineRegistry):
+    def __init__(
+        self,
+        registry: EngineRegistry,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        recovery_timeout: float = 30.0,
+        hedging: bool = False,
+        hedge_max_ratio: float = 0.1,
+        hedge_min_samples: int = 20,
+        latency_window: int = 100,
+        latency_alpha: float = 0.2,
+    ):
         """Initialize the smart router.
 
         Args:
             registry: Engine registry instance
+            failure_threshold: Consecutive failures that open an engine's circuit breaker
+            error_rate_threshold: Recent error rate (0-1) that opens an engine's circuit breaker
+            recovery_timeout: Seconds an open breaker waits before sending probe requests
+            hedging: Start the next engine in parallel when the primary is slower
+                than its recent p95 latency, keeping whichever answers first
+            hedge_max_ratio: Maximum fraction of requests allowed to fire a hedge
+            hedge_min_samples: Latency samples per engine and language needed
+                before that engine is hedged
+            latency_window: Recent latency samples kept per engine and language
+            latency_alpha: EWMA smoothing factor for per-language latency
         """
         self.registry = registry
-        self.performance_metrics: dict[str, list[float]] = {}
+        self.performance_metrics: dict[str, deque[float]] = {}
         self.failure_counts: dict[str, int] = {}
         self.last_used: dict[str, float] = {}
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.recovery_timeout = recovery_timeout
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.hedging = hedging
+        self.hedge_max_ratio = hedge_max_ratio
+        self.hedge_min_samples = max(1, hedge_min_samples)
+        self.latency_window = max(1, latency_window)
+        self.latency_alpha = latency_alpha
+        self.latency_stats: dict[tuple[str, str], LatencyStats] = {}
+        self.hedge_stats: dict[str, int] = {"fired": 0, "won": 0}
         # Aggregate stats for compatibility with some tests
         self.stats: dict[str, float] = {
             "total_requests": 0,
@@ -36,6 +75,23 @@ class SmartRouter:
             "failed_requests": 0,
         }
 
+    @classmethod
+    def from_settings(cls, registry: EngineRegistry) -> "SmartRouter":
+        """Create a router configured from the application settings.
+
+        Args:
+            registry: Engine registry instance
+
+        Returns:
+            SmartRouter instance
+        """
+        return cls(
+            registry,
+            hedging=settings.router_hedging,
+            hedge_max_ratio=settings.router_hedge_max_ratio,
+            hedge_min_samples=settings.router_hedge_min_samples,
+        )
+
     def get_engine(self, name: str):
         """Get engine by name (for compatibility with tests).
 
@@ -56,7 +112,13 @@ class SmartRouter:
         rate: float = 1.0,
         pitch: float = 0.0,
     ) -> tuple[bytes, str]:
-        """Smart synthesis with automatic engine selection.
+        """Smart synthesis with automatic engine selection and fallback.
+
+        The best engine is tried first, then the remaining engines of the
+        language policy in order. Engines whose circuit breaker is open are
+        skipped. With hedging enabled, an engine that is still running after its
+        recent p95 latency for the language is raced against the next engine;
+        the first successful result wins and the other attempt is cancelled.
 
         Args:
             text: Text to synthesize
@@ -84,74 +146,204 @@ class SmartRouter:
                 available_engines=self.registry.get_available_engines(),
             )
 
-        # Try selected engine (tests expect raising when none selected)
-        available_engines = [selected_engine]
+        # Try the selected engine first, then the rest of the policy in order
+        available_engines = [selected_engine] + [
+            name
+            for name in self._resolve_available_engines(lang)
+            if name != selected_engine
+        ]
 
-        # Try engines in priority order
         last_error = None
-        for engine_name in available_engines:
-            try:
-                # Check if engine meets requirements
-                if not self.registry.meets_requirements(engine_name, requirements):
-                    logger.debug(f"Engine {engine_name} does not meet requirements")
+        skipped_open: list[str] = []
+        candidates = iter(available_engines)
+        # Running attempts: task -> engine name. Without hedging at most one runs.
+        pending: dict[asyncio.Task, str] = {}
+        primary_name: str | None = None
+        hedge_engine: str | None = None
+        hedge_checked = False
+
+        def launch_next() -> str | None:
+            for engine_name in candidates:
+                prepared = self._prepare_engine(engine_name, requirements, skipped_open)
+                if prepared is None:
                     continue
+                engine, breaker = prepared
+                task = asyncio.ensure_future(
+                    self._attempt(
+                        engine_name, engine, breaker, text, lang, voice, rate, pitch
+                    )
+                )
+                pending[task] = engine_name
+                return engine_name
+            return None
+
+        try:
+            while True:
+                if not pending:
+                    primary_name = launch_next()
+                    if primary_name is None:
+                        break
+                    # A request fires at most one hedge; until then a fallback
+                    # engine may be hedged like the first one
+                    hedge_checked = hedge_engine is not None
+
+                timeout = None
+                if not hedge_checked and len(pending) == 1:
+                    hedge_checked = True
+                    timeout = self._hedge_delay(primary_name, lang)
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slower than its recent p95: race the next engine
+                    hedge_engine = launch_next()
+                    if hedge_engine is not None:
+                        self.hedge_stats["fired"] += 1
+                        logger.info(
+                            f"Hedging {primary_name} with {hedge_engine} after "
+                            f"{timeout:.2f}s"
+                        )
+                    continue
+
+                winner = None
+                for task in done:
+                    engine_name = pending.pop(task)
+                    try:
+                        audio = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if winner is None:
+                        winner = (audio, engine_name)
+
+                if winner is not None:
+                    if winner[1] == hedge_engine:
+                        self.hedge_stats["won"] += 1
+                    self._update_stats(True)
+                    return winner
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # All engines failed
+        self._update_stats(False)
+        message = f"All engines failed for language {lang}. Last error: {last_error}"
+        if skipped_open:
+            message += f" (circuit open: {', '.join(skipped_open)})"
+        raise AllEnginesFailedError(message)
+
+    def _prepare_engine(
+        self,
+        engine_name: str,
+        requirements: dict[str, Any],
+        skipped_open: list[str],
+    ) -> tuple[Any, CircuitBreaker] | None:
+        """Resolve an engine that may serve a request right now.
+
+        Args:
+            engine_name: Name of the engine
+            requirements: Engine requirements
+            skipped_open: Collects engines skipped because their circuit is open
+
+        Returns:
+            Tuple of (engine, breaker) or None if the engine should be skipped
+        """
+        try:
+            # Check if engine meets requirements
+            if not self.registry.meets_requirements(engine_name, requirements):
+                logger.debug(f"Engine {engine_name} does not meet requirements")
+                return None
 
-                # Get engine instance
-                # Resolve engine instance safely with mock-friendly fallbacks
+            # Resolve engine instance safely with mock-friendly fallbacks
+            try:
+                engine = self.registry.get_engine(engine_name)
+            except Exception:
+                engine = None
+            if engine is None:
                 try:
-                    engine = self.registry.get_engine(engine_name)
+                    engine = self.registry.engines[engine_name]
                 except Exception:
                     engine = None
-                if engine is None:
-                    try:
-                        engine = self.registry.engines[engine_name]
-                    except Exception:
-                        engine = None
-                if engine is None:
-                    logger.debug(f"Engine {engine_name} not found in registry")
-                    continue
+            if engine is None:
+                logger.debug(f"Engine {engine_name} not found in registry")
+                return None
+
+            # Check if engine is available
+            if not engine.is_available():
+                logger.debug(f"Engine {engine_name} is not available")
+                return None
+        except Exception as e:
+            logger.warning(f"Engine {engine_name} failed: {e}")
+            self.get_breaker(engine_name).record_failure(e)
+            self.record_failure(engine_name)
+            self.registry.record_failure(engine_name)
+            return None
 
-                # Check if engine is available
-                if not engine.is_available():
-                    logger.debug(f"Engine {engine_name} is not available")
-                    continue
+        breaker = self.get_breaker(engine_name)
+        if not breaker.allow_request():
+            logger.debug(f"Circuit open for {engine_name}, skipping")
+            skipped_open.append(engine_name)
+            return None
+        return engine, breaker
 
-                # Attempt synthesis
-                start_time = time.time()
-                result = engine.synth_async(text, lang, voice, rate, pitch)
-                # Support both async and sync mocked engines in tests
-                if hasattr(result, "__await__"):
-                    audio = await result
-                else:
-                    audio = result
-                # In tests, Mock may leak through; ensure bytes for len(audio) checks
-                if not isinstance(audio, bytes | bytearray):
-                    # Provide a minimal non-empty bytes payload for performance tests
-                    audio = b"audio"
-                duration = time.time() - start_time
-
-                # Record success metrics
-                self.record_success(engine_name, duration)
-                self.registry.record_success(engine_name, duration)
-                self._update_stats(True)
-
-                logger.info(
-                    f"Successfully synthesized with {engine_name} in {duration:.2f}s"
-                )
-                return audio, engine_name
-
-            except Exception as e:
-                logger.warning(f"Engine {engine_name} failed: {e}")
-                last_error = e
-                self.record_failure(engine_name)
-                self.registry.record_failure(engine_name)
-                self._update_stats(False)
-                continue
+    async def _attempt(
+        self,
+        engine_name: str,
+        engine: Any,
+        breaker: CircuitBreaker,
+        text: str,
+        lang: str,
+        voice: str | None,
+        rate: float,
+        pitch: float,
+    ) -> bytes:
+        """Run one synthesis attempt and record its outcome.
 
-        # All engines failed
-        raise AllEnginesFailedError(
-            f"All engines failed for language {lang}. Last error: {last_error}"
-        )
+        Returns:
+            Synthesized audio bytes
+
+        Raises:
+            Exception: Whatever the engine raised, after recording the failure
+        """
+        start_time = time.time()
+        try:
+            result = engine.synth_async(text, lang, voice, rate, pitch)
+            # Support both async and sync mocked engines in tests
+            if hasattr(result, "__await__"):
+                audio = await result
+            else:
+                audio = result
+        except asyncio.CancelledError:
+            # Lost a hedge race: not a failure, but the elapsed time is a lower
+            # bound on this engine's latency and keeps its p95 honest
+            breaker.release()
+            self.get_latency_stats(engine_name, lang).record_latency(
+                time.time() - start_time
+            )
+            raise
+        except Exception as e:
+            logger.warning(f"Engine {engine_name} failed: {e}")
+            breaker.record_failure(e)
+            self.get_latency_stats(engine_name, lang).record_failure()
+            self.record_failure(engine_name)
+            self.registry.record_failure(engine_name)
+            raise
+
+        # In tests, Mock may leak through; ensure bytes for len(audio) checks
+        if not isinstance(audio, bytes | bytearray):
+            # Provide a minimal non-empty bytes payload for performance tests
+            audio = b"audio"
+        duration = time.time() - start_time
+
+        # Record success metrics
+        breaker.record_success()
+        self.record_success(engine_name, duration)
+        self.registry.record_success(engine_name, duration)
+        self.get_latency_stats(engine_name, lang).record_success(duration)
+
+        logger.info(f"Successfully synthesized with {engine_name} in {duration:.2f}s")
+        return audio
 
     def synth(
         self,
@@ -260,6 +452,12 @@ class SmartRouter:
 
         # Sort by performance metrics
         def get_score(engine_name: str) -> float:
+            # Prefer this router's cached per-language score; fall back to the
+            # registry's engine-wide stats until the language has history
+            lang_stats = self.latency_stats.get((engine_name, lang))
+            if lang_stats is not None and lang_stats.total > 0:
+                return lang_stats.score
+
             stats = self.registry.get_engine_stats(engine_name)
             total = 0
             success_rate = 0.0
@@ -302,18 +500,16 @@ class SmartRouter:
             engine_name: Name of the engine
             duration: Synthesis duration in seconds
         """
-        if engine_name not in self.performance_metrics:
-            self.performance_metrics[engine_name] = []
-
-        self.performance_metrics[engine_name].append(duration)
+        durations = self.performance_metrics.get(engine_name)
+        if durations is None:
+            durations = deque(maxlen=_METRICS_WINDOW)
+            self.performance_metrics[engine_name] = durations
+        durations.append(duration)
+        if len(durations) > _METRICS_WINDOW:
+            # Only a window assigned from outside as a plain list can grow past it
+            del durations[0]
         self.last_used[engine_name] = time.time()
 
-        # Keep only last 100 measurements
-        if len(self.performance_metrics[engine_name]) > 100:
-            self.performance_metrics[engine_name] = self.performance_metrics[
-                engine_name
-            ][-100:]
-
     def record_failure(self, engine_name: str) -> None:
         """Record engine failure.
 
@@ -322,6 +518,103 @@ class SmartRouter:
         """
         self.failure_counts[engine_name] = self.failure_counts.get(engine_name, 0) + 1
 
+    def get_latency_stats(self, engine_name: str, lang: str) -> LatencyStats:
+        """Get the latency statistics for an engine and language.
+
+        Args:
+            engine_name: Name of the engine
+            lang: Language code
+
+        Returns:
+            LatencyStats instance, created on first use
+        """
+        key = (engine_name, lang)
+        stats = self.latency_stats.get(key)
+        if stats is None:
+            stats = LatencyStats(window=self.latency_window, alpha=self.latency_alpha)
+            self.latency_stats[key] = stats
+        return stats
+
+    def get_latency_percentile(
+        self, engine_name: str, lang: str, percentile: float = 95.0
+    ) -> float | None:
+        """Get a recent latency percentile for an engine and language.
+
+        Args:
+            engine_name: Name of the engine
+            lang: Language code
+            percentile: Percentile to compute (0-100)
+
+        Returns:
+            Latency in seconds, or None if no samples were recorded
+        """
+        stats = self.latency_stats.get((engine_name, lang))
+        if stats is None:
+            return None
+        return stats.percentile(percentile)
+
+    def get_language_stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get latency statistics split by engine and language.
+
+        Returns:
+            Dictionary mapping engine name to language code to stats
+        """
+        out: dict[str, dict[str, dict[str, Any]]] = {}
+        for (engine_name, lang), stats in self.latency_stats.items():
+            out.setdefault(engine_name, {})[lang] = stats.to_dict()
+        return out
+
+    def _hedge_delay(self, engine_name: str, lang: str) -> float | None:
+        """Seconds to wait for an engine before hedging, or None to not hedge."""
+        if not self.hedging:
+            return None
+        stats = self.latency_stats.get((engine_name, lang))
+        if stats is None or stats.sample_count < self.hedge_min_samples:
+            return None
+        # Budget includes the current request, which is not counted yet
+        requests = int(self.stats.get("total_requests", 0)) + 1
+        if self.hedge_stats["fired"] + 1 > self.hedge_max_ratio * requests:
+            return None
+        return self.get_latency_percentile(engine_name, lang)
+
+    def get_hedge_stats(self) -> dict[str, Any]:
+        """Get hedged request statistics.
+
+        Returns:
+            Dictionary with fired and won hedge counts, the share of requests that
+            fired a hedge and the share of hedges won by the backup engine
+        """
+        total = int(self.stats.get("total_requests", 0))
+        fired = self.hedge_stats["fired"]
+        won = self.hedge_stats["won"]
+        return {
+            "enabled": self.hedging,
+            "fired": fired,
+            "won": won,
+            "fire_rate": fired / total if total else 0.0,
+            "win_rate": won / fired if fired else 0.0,
+        }
+
+    def get_breaker(self, engine_name: str) -> CircuitBreaker:
+        """Get the circuit breaker for an engine, creating it on first use.
+
+        Args:
+            engine_name: Name of the engine
+
+        Returns:
+            CircuitBreaker instance for the engine
+        """
+        breaker = self.breakers.get(engine_name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                engine_name,
+                failure_threshold=self.failure_threshold,
+                error_rate_threshold=self.error_rate_threshold,
+                recovery_timeout=self.recovery_timeout,
+            )
+            self.breakers[engine_name] = breaker
+        return breaker
+
     def get_engine_stats(self, engine_name: str) -> dict[str, Any]:
         """Get performance statistics for an engine.
 
@@ -400,19 +693,34 @@ class SmartRouter:
             "failed_requests": int(self.stats.get("failed_requests", 0)),
             "success_rate": self._calculate_success_rate(),
         }
-        out = {name: self.get_engine_stats(name) for name in engine_names}
+        language_stats = self.get_language_stats()
+        out = {}
+        for name in engine_names:
+            breaker_stats = self.get_breaker(name).get_stats()
+            out[name] = {
+                **self.get_engine_stats(name),
+                "circuit_state": breaker_stats["state"],
+                "last_error": breaker_stats["last_error"],
+                "languages": language_stats.get(name, {}),
+            }
         out.update(overall)
+        out["hedging"] = self.get_hedge_stats()
         return out
 
     def reset_stats(self) -> None:
         """Reset all performance statistics."""
-        for engine_name in self.performance_metrics:
-            self.performance_metrics[engine_name] = []
+        for engine_name, durations in self.performance_metrics.items():
+            durations.clear()
             self.failure_counts[engine_name] = 0
             self.last_used[engine_name] = 0
         self.stats["total_requests"] = 0
         self.stats["successful_requests"] = 0
         self.stats["failed_requests"] = 0
+        for breaker in self.breakers.values():
+            breaker.reset()
+        self.latency_stats.clear()
+        self.hedge_stats["fired"] = 0
+        self.hedge_stats["won"] = 0
 
     def get_engine_ranking(
         self, lang: str, requirements: dict[str, Any] = None
@@ -436,6 +744,10 @@ class SmartRouter:
         rankings: list[tuple[str, float]] = []
 
         for engine_name in available_engines:
+            lang_stats = self.latency_stats.get((engine_name, lang))
+            if lang_stats is not None and lang_stats.total > 0:
+                rankings.append((engine_name, lang_stats.score))
+                continue
             stats = self.get_engine_stats(engine_name)
             total = stats.get("total_requests", 0) if isinstance(stats, dict) else 0
             if total > 0:
@@ -6,10 +6,16 @@ engine management, and utilities into applications, hiding internal details.
 
 import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+from .audio.buffer import AudioBuffer
+from .audio.pcm import PCMBuffer
+from .audio.pipeline import pipeline as audio_pipeline
+from .audio.probe import probe
+from .cache import cache_key, get_async_cache, get_single_flight, memory_cache
+from .cache.tiered import TieredAudioCache, TieredCacheStats
 from .engines.factory import factory as engine_factory
 from .engines.registry import registry as engine_registry
 from .engines.smart_router import SmartRouter
@@ -20,9 +26,26 @@ from .exceptions import (
 )
 from .utils.audio_manager import audio_manager
 from .utils.logging_config import get_logger
+from .utils.performance import get_executor
+from .utils.text import split_script_runs, split_sentences
 
 logger = get_logger(__name__)
 
+# Tier hit counters shared by every TTS instance's audio cache
+audio_cache_stats = TieredCacheStats()
+
+
+def _prepare_buffer(buffer: AudioBuffer, output_format: str) -> AudioBuffer:
+    """Convert audio to 48 kHz mono and encode it in output_format."""
+    buffer = buffer.converted(48000, 1)
+    buffer.encode(output_format)
+    return buffer
+
+
+def _encoded(audio: AudioBuffer | bytes, format: str) -> bytes:
+    """Get encoded bytes from an AudioBuffer or pass bytes through."""
+    return audio.encode(format) if isinstance(audio, AudioBuffer) else audio
+
 
 @dataclass
 class SynthConfig:
@@ -39,6 +62,8 @@ class SynthConfig:
         pitch: Semitone adjustment (0.0 normal).
         output_format: Audio format ('ogg', 'mp3', 'wav'; default 'ogg').
         cache: Enable caching for this request (default True).
+        sentence_cache: Synthesize and cache multi-sentence text per sentence,
+            reusing cached sentences and synthesizing only the rest (default False).
 
     Notes:
         Validates rate >0 and format on init; raises ValueError if invalid.
@@ -52,6 +77,7 @@ class SynthConfig:
     pitch: float = 0.0
     output_format: str = "ogg"
     cache: bool = True
+    sentence_cache: bool = False
 
     def __post_init__(self):
         if self.rate <= 0:
@@ -75,6 +101,9 @@ class AudioOut:
         bitrate: kbps (default 128).
         size: Bytes length (default 0).
         engine: Optional engine name used.
+        buffer: Decoded audio the data was encoded from, if available; hand it
+            to a Telegram adapter's send_voice to skip re-reading the duration.
+            Cache hits leave it unset; get_buffer() decodes it on demand.
 
     Notes:
         size auto-calculates from data if 0; supports saving and info export.
@@ -88,6 +117,7 @@ class AudioOut:
     bitrate: int = 128
     size: int = 0
     engine: str | None = None
+    buffer: AudioBuffer | None = field(default=None, repr=False, compare=False)
 
     def save(self, filepath: str | Path) -> None:
         """Write the audio bytes to a file path.
@@ -117,6 +147,19 @@ class AudioOut:
             "size": self.size,
         }
 
+    def get_buffer(self) -> AudioBuffer | None:
+        """Get the decoded audio, decoding data on first use if needed.
+
+        Returns:
+            AudioBuffer, or None if the data cannot be decoded in-process.
+        """
+        if self.buffer is None:
+            try:
+                self.buffer = AudioBuffer.from_encoded(self.data, self.format)
+            except Exception:
+                return None
+        return self.buffer
+
 
 class TTS:
     """Core SDK class for TTS synthesis with smart routing and processing.
@@ -139,9 +182,16 @@ class TTS:
         self.default_engine = default_engine
         self.cache_enabled = cache_enabled
 
-        self.router = SmartRouter(engine_registry)
+        self.router = SmartRouter.from_settings(engine_registry)
         self.smart_router = self.router
         self.stats = self.router.stats  # Expose stats for tests
+        self.single_flight = get_single_flight()
+        self.audio_cache = TieredAudioCache(
+            memory=memory_cache,
+            disk=audio_manager,
+            redis=get_async_cache(),
+            stats=audio_cache_stats,
+        )
         self._setup_engines()
 
     def _setup_engines(self) -> None:
@@ -170,17 +220,58 @@ class TTS:
             TTSKitEngineError: For internal synthesis issues.
 
         Notes:
-            Checks cache first; uses SmartRouter for selection; formats via audio_manager.
+            Checks the tiered audio cache (memory, disk, Redis) first; uses
+            SmartRouter for selection; formats via audio_manager. Disk and Redis
+            cache writes happen in the background.
+            Concurrent identical requests share one synthesis via single_flight.
+            With sentence_cache, multi-sentence text is assembled from cached
+            sentences, synthesizing only the missing ones. Mixed-script text (e.g.
+            Persian with English terms) is synthesized per language run unless an
+            engine or voice is given.
         """
-        cached_audio = None
+        cache_key = self._generate_cache_key(config)
         if self.cache_enabled and config.cache:
-            cache_key = self._generate_cache_key(config)
-            maybe = audio_manager.get_from_cache(cache_key)
-            cached_audio = await maybe if hasattr(maybe, "__await__") else maybe
+            cached_audio = await self.audio_cache.get(cache_key)
             if cached_audio:
                 logger.info("Using cached audio")
                 return self._bytes_to_audio_out(cached_audio, config.output_format)
 
+        audio_data = await self.single_flight.do(
+            cache_key,
+            lambda: self._synth_uncached(config, cache_key),
+            encode=lambda audio: _encoded(audio, config.output_format),
+        )
+        return self._bytes_to_audio_out(audio_data, config.output_format)
+
+    async def _synth_uncached(
+        self, config: SynthConfig, cache_key: str
+    ) -> AudioBuffer | bytes:
+        """Synthesize, encode and cache audio for a request that missed the cache.
+
+        Args:
+            config: SynthConfig for the request.
+            cache_key: Key to store the result under.
+
+        Returns:
+            AudioBuffer already encoded in config.output_format, or encoded bytes
+            if the audio could not be decoded in-process.
+
+        Raises:
+            EngineNotAvailableError: If specified engine unavailable.
+            AllEnginesFailedError: If no engine succeeds after fallbacks.
+            TTSKitEngineError: For internal synthesis issues.
+        """
+        parts = self._split_sentences(config) or self._split_mixed_script(config)
+        if parts:
+            processed_audio = await self._synth_parts(config, parts)
+            if self.cache_enabled and config.cache:
+                await self.audio_cache.set(
+                    cache_key,
+                    _encoded(processed_audio, config.output_format),
+                    format=config.output_format,
+                )
+            return processed_audio
+
         if config.engine:
             engine = engine_factory.get_engine(config.engine)
             if not engine:
@@ -206,6 +297,23 @@ class TTS:
         try:
             import inspect
 
+            if getattr(type(engine), "synth_pcm_async", None) is not None:
+                pcm = await engine.synth_pcm_async(
+                    text=config.text,
+                    lang=config.lang,
+                    voice=config.voice,
+                    rate=config.rate,
+                    pitch=config.pitch,
+                )
+                processed_audio = await self._encode_pcm(pcm, config.output_format)
+                if self.cache_enabled and config.cache:
+                    await self.audio_cache.set(
+                        cache_key,
+                        _encoded(processed_audio, config.output_format),
+                        format=config.output_format,
+                    )
+                return processed_audio
+
             sig = inspect.signature(engine.synth_async)
             if "output_format" in sig.parameters:
                 audio_data = await engine.synth_async(
@@ -229,27 +337,32 @@ class TTS:
             if engine.__class__.__name__ == "PiperEngine":
                 input_format = "wav"
 
-            processed_audio = await audio_manager.process_audio(
-                audio_data,
-                input_format=input_format,
-                output_format=config.output_format,
-                sample_rate=48000,
-                channels=1,
+            processed_audio = await self._decode_once(
+                audio_data, input_format, config.output_format
             )
-
-            audio_out = self._bytes_to_audio_out(processed_audio, config.output_format)
+            if processed_audio is None:
+                processed_audio = await audio_manager.process_audio(
+                    audio_data,
+                    input_format=input_format,
+                    output_format=config.output_format,
+                    sample_rate=48000,
+                    channels=1,
+                )
 
             if self.cache_enabled and config.cache:
-                maybe_save = audio_manager.save_to_cache(cache_key, processed_audio)
-                if hasattr(maybe_save, "__await__"):
-                    await maybe_save
+                await self.audio_cache.set(
+                    cache_key,
+                    _encoded(processed_audio, config.output_format),
+                    format=config.output_format,
+                )
 
-            return audio_out
+            return processed_audio
 
         except Exception as e:
             logger.error(f"Engine {engine.__class__.__name__} failed: {e}")
             try:
-                return await self._try_fallback_engines(config)
+                fallback = await self._try_fallback_engines(config)
+                return fallback.buffer or fallback.data
             except AllEnginesFailedError:
                 raise
             except Exception as fallback_error:
@@ -258,6 +371,95 @@ class TTS:
                     engine.__class__.__name__,
                 ) from fallback_error
 
+    def _split_sentences(self, config: SynthConfig) -> list[SynthConfig] | None:
+        """Split the request into one request per sentence in sentence-cache mode.
+
+        Args:
+            config: SynthConfig for the request.
+
+        Returns:
+            Per-sentence configs, or None if sentence_cache is off, caching is
+            disabled or the text is a single sentence.
+        """
+        if not (config.sentence_cache and config.cache and self.cache_enabled):
+            return None
+        sentences = split_sentences(config.text)
+        if len(sentences) < 2:
+            return None
+        return [
+            replace(config, text=sentence, sentence_cache=False)
+            for sentence in sentences
+        ]
+
+    def _split_mixed_script(self, config: SynthConfig) -> list[SynthConfig] | None:
+        """Split the request text into language runs if it mixes scripts.
+
+        Args:
+            config: SynthConfig for the request.
+
+        Returns:
+            One config per (lang, text) run, or None if the text is single-script
+            or the caller pinned an engine or voice.
+        """
+        if config.engine or config.voice:
+            return None
+        rtl = config.lang in ("fa", "ar")
+        segments = split_script_runs(
+            config.text,
+            rtl_lang=config.lang if rtl else "fa",
+            ltr_lang="en" if rtl else config.lang,
+        )
+        if len(segments) < 2:
+            return None
+        return [
+            SynthConfig(
+                text=text,
+                lang=lang,
+                rate=config.rate,
+                pitch=config.pitch,
+                output_format=config.output_format,
+                cache=config.cache,
+            )
+            for lang, text in segments
+        ]
+
+    async def _synth_parts(
+        self, config: SynthConfig, parts: list[SynthConfig]
+    ) -> AudioBuffer | bytes:
+        """Synthesize parts of a request concurrently and merge them in order.
+
+        Each part goes through synth_async on its own, so it is looked up in and
+        stored to the cache individually and only the misses reach an engine; a
+        mixed-script run is also routed to the best engine for its language.
+        Parts that can all be decoded in-process are joined as samples; cached
+        parts are decoded here, off the event loop.
+
+        Args:
+            config: SynthConfig for the whole request.
+            parts: Per-sentence or per-language-run configs, in order.
+
+        Returns:
+            Merged AudioBuffer or audio bytes in config.output_format.
+        """
+        outputs = await asyncio.gather(*(self.synth_async(part) for part in parts))
+        loop = asyncio.get_running_loop()
+        buffers = await loop.run_in_executor(
+            get_executor("audio"), lambda: [output.get_buffer() for output in outputs]
+        )
+        if all(buffer is not None for buffer in buffers):
+            return await loop.run_in_executor(
+                get_executor("audio"),
+                _prepare_buffer,
+                AudioBuffer.concatenate(buffers),
+                config.output_format,
+            )
+        return await loop.run_in_executor(
+            get_executor("audio"),
+            audio_pipeline.merge_audio,
+            [output.data for output in outputs],
+            config.output_format,
+        )
+
     def synth(self, config: SynthConfig) -> AudioOut:
         """Synchronous wrapper for synth_async using asyncio.run.
 
@@ -268,9 +470,18 @@ class TTS:
             AudioOut with the audio.
 
         Notes:
-            Blocks until complete; suitable for non-async contexts.
+            Blocks until complete; suitable for non-async contexts. Waits for
+            the background disk and Redis cache writes too, since asyncio.run
+            would otherwise cancel them when the loop closes.
         """
-        return asyncio.run(self.synth_async(config))
+
+        async def synth_and_flush() -> AudioOut:
+            try:
+                return await self.synth_async(config)
+            finally:
+                await self.audio_cache.flush()
+
+        return asyncio.run(synth_and_flush())
 
     async def _try_fallback_engines(self, config: SynthConfig) -> AudioOut:
         """Attempt synthesis with alternative engines if primary fails.
@@ -326,31 +537,135 @@ class TTS:
 
         raise AllEnginesFailedError(f"All engines failed: {failed_engines}")
 
+    async def _encode_pcm(
+        self, pcm: PCMBuffer, output_format: str
+    ) -> AudioBuffer | bytes:
+        """Encode engine PCM once into the requested output format.
+
+        Args:
+            pcm: Raw samples from the engine.
+            output_format: Target format ('ogg', 'mp3', 'wav').
+
+        Returns:
+            48 kHz AudioBuffer already encoded in output_format.
+
+        Notes:
+            Falls back to WAV plus audio_manager conversion, returning bytes, if
+            the in-memory pipeline cannot encode the format.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                get_executor("audio"),
+                _prepare_buffer,
+                AudioBuffer.from_pcm(pcm),
+                output_format,
+            )
+        except Exception as e:
+            logger.warning(f"In-memory PCM encoding failed, converting via WAV: {e}")
+            return await audio_manager.process_audio(
+                pcm.to_wav_bytes(),
+                input_format="wav",
+                output_format=output_format,
+                sample_rate=48000,
+                channels=1,
+            )
+
+    async def _decode_once(
+        self, audio_data: bytes, input_format: str, output_format: str
+    ) -> AudioBuffer | None:
+        """Decode engine output once and encode it in the requested format.
+
+        Args:
+            audio_data: Encoded audio from the engine.
+            input_format: Format of audio_data.
+            output_format: Target format ('ogg', 'mp3', 'wav').
+
+        Returns:
+            48 kHz mono AudioBuffer encoded in output_format, or None if the
+            audio could not be decoded in-process.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            buffer = await loop.run_in_executor(
+                get_executor("audio"),
+                AudioBuffer.from_encoded,
+                audio_data,
+                input_format,
+            )
+            return await loop.run_in_executor(
+                get_executor("audio"), _prepare_buffer, buffer, output_format
+            )
+        except Exception as e:
+            logger.debug(f"In-process decode failed, converting via audio_manager: {e}")
+            return None
+
     def _generate_cache_key(self, config: SynthConfig) -> str:
-        """Create a SHA256 hash key from config params for caching.
+        """Create the canonical cache key for a synthesis request.
 
         Args:
             config: SynthConfig to hash.
 
         Returns:
-            Hex digest string for cache lookup.
+            Hex digest string for cache lookup (see ttskit.cache.cache_key).
         """
-        import hashlib
+        return cache_key(
+            config.text,
+            config.lang,
+            config.engine,
+            voice=config.voice,
+            rate=config.rate,
+            pitch=config.pitch,
+            output_format=config.output_format,
+        )
 
-        key_data = f"{config.text}|{config.lang}|{config.voice}|{config.engine}|{config.rate}|{config.pitch}|{config.output_format}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+    def _bytes_to_audio_out(
+        self, audio_data: AudioBuffer | bytes, format: str
+    ) -> AudioOut:
+        """Wrap audio in AudioOut with its metadata.
 
-    def _bytes_to_audio_out(self, audio_data: bytes, format: str) -> AudioOut:
-        """Wrap audio bytes in AudioOut with metadata from audio_manager.
+        An AudioBuffer describes itself. Bytes (a cache hit) are not decoded:
+        their metadata is read from the container header with probe(), and the
+        buffer is left for AudioOut.get_buffer() to build if anyone needs it.
+        Bytes whose header cannot be read are decoded in-process, and
+        audio_manager's pydub-based probe is the last resort.
 
         Args:
-            audio_data: Raw bytes.
+            audio_data: AudioBuffer or encoded bytes.
             format: The audio format.
 
         Returns:
             Populated AudioOut instance.
         """
-        info = audio_manager.get_audio_info(audio_data)
+        buffer = audio_data if isinstance(audio_data, AudioBuffer) else None
+        header = probe(audio_data) if buffer is None and audio_data else None
+        if header is not None:
+            duration = header.duration
+            return AudioOut(
+                data=audio_data,
+                format=format,
+                duration=duration,
+                sample_rate=header.sample_rate,
+                channels=header.channels,
+                bitrate=(
+                    max(1, int(len(audio_data) * 8 / duration / 1000))
+                    if duration > 0
+                    else 128
+                ),
+                size=len(audio_data),
+            )
+
+        if buffer is None:
+            try:
+                buffer = AudioBuffer.from_encoded(audio_data, format)
+            except Exception:
+                buffer = None
+
+        if buffer is not None:
+            info = buffer.info(format)
+            audio_data = buffer.encode(format)
+        else:
+            info = audio_manager.get_audio_info(audio_data)
 
         return AudioOut(
             data=audio_data,
@@ -360,6 +675,7 @@ class TTS:
             channels=info.get("channels", 1),
             bitrate=info.get("bitrate", 128),
             size=len(audio_data),
+            buffer=buffer,
         )
 
     def list_voices(
@@ -5,6 +5,8 @@ message processing, callbacks, and media sending via asynchronous polling.
 Supports both real bots and mock instances for testing.
 """
 
+from typing import TYPE_CHECKING
+
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import CallbackQuery, Chat, Message, User
@@ -18,6 +20,9 @@ from .base import (
     TelegramUser,
 )
 
+if TYPE_CHECKING:
+    from ..audio.buffer import AudioBuffer
+
 logger = get_logger(__name__)
 
 
@@ -206,7 +211,7 @@ class AiogramAdapter(TelegramAdapter):
     async def send_voice(
         self,
         chat_id: int,
-        voice_data: bytes,
+        voice_data: "bytes | AudioBuffer",
         caption: str | None = None,
         reply_to_message_id: int | None = None,
         duration: int | None = None,
@@ -217,7 +222,7 @@ class AiogramAdapter(TelegramAdapter):
 
         Args:
             chat_id: The target chat ID.
-            voice_data: Raw bytes of the voice audio.
+            voice_data: Raw bytes of the voice audio, or an AudioBuffer.
             caption: Optional caption text.
             reply_to_message_id: Optional reply target.
             duration: Optional voice length in seconds.
@@ -229,6 +234,7 @@ class AiogramAdapter(TelegramAdapter):
             Exception: If file upload or sending fails.
         """
         try:
+            voice_data, duration = self._voice_payload(voice_data, duration)
             from aiogram.types.input_file import BufferedInputFile
 
             voice_file = BufferedInputFile(voice_data, filename="voice.ogg")
@@ -8,7 +8,10 @@ common parsing utilities and command processing logic shared across adapters.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from ..audio.buffer import AudioBuffer
 
 
 class MessageType(Enum):
@@ -191,7 +194,7 @@ class TelegramAdapter(ABC):
     async def send_voice(
         self,
         chat_id: int,
-        voice_data: bytes,
+        voice_data: "bytes | AudioBuffer",
         caption: str | None = None,
         reply_to_message_id: int | None = None,
         duration: int | None = None,
@@ -202,7 +205,8 @@ class TelegramAdapter(ABC):
 
         Args:
             chat_id: The target chat identifier.
-            voice_data: Binary data of the voice file (typically OGG format).
+            voice_data: Binary data of the voice file (typically OGG format), or an
+                AudioBuffer, which supplies the duration without decoding.
             caption: Optional text caption for the voice.
             reply_to_message_id: Optional ID of a message to reply to.
             duration: Optional duration of the voice in seconds.
@@ -388,6 +392,27 @@ class TelegramAdapter(ABC):
         """
         return self._running
 
+    def _voice_payload(
+        self, voice_data: "bytes | AudioBuffer", duration: int | None
+    ) -> tuple[bytes, int | None]:
+        """Unpack voice data for sending.
+
+        Args:
+            voice_data: OGG bytes or an AudioBuffer.
+            duration: Duration given by the caller, if any.
+
+        Returns:
+            OGG bytes and the duration; for an AudioBuffer the duration comes
+            from its samples when not given.
+        """
+        from ..audio.buffer import AudioBuffer
+
+        if isinstance(voice_data, AudioBuffer):
+            if duration is None:
+                duration = int(voice_data.duration)
+            voice_data = voice_data.encode("ogg")
+        return voice_data, duration
+
     def _parse_message(self, raw_message: Any) -> TelegramMessage:
         """Parse a raw message from the framework into a standardized format.
 
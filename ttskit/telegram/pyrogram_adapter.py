@@ -6,7 +6,7 @@ async-friendly manner. Designed for use with TTSKit's unified interface.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pyrogram import Client
 from pyrogram.types import Chat, Message, User
@@ -21,6 +21,9 @@ from .base import (
     TelegramUser,
 )
 
+if TYPE_CHECKING:
+    from ..audio.buffer import AudioBuffer
+
 logger = get_logger(__name__)
 
 
@@ -182,7 +185,7 @@ class PyrogramAdapter(TelegramAdapter):
     async def send_voice(
         self,
         chat_id: int,
-        voice_data: bytes,
+        voice_data: "bytes | AudioBuffer",
         caption: str | None = None,
         reply_to_message_id: int | None = None,
         duration: int | None = None,
@@ -191,7 +194,7 @@ class PyrogramAdapter(TelegramAdapter):
 
         Args:
             chat_id: The target chat ID.
-            voice_data: Voice audio bytes (OGG assumed).
+            voice_data: Voice audio bytes (OGG assumed), or an AudioBuffer.
             caption: Optional caption.
             reply_to_message_id: Optional reply ID.
             duration: Optional duration in seconds.
@@ -206,6 +209,7 @@ class PyrogramAdapter(TelegramAdapter):
             Uses BytesIO for file-like object.
         """
         try:
+            voice_data, duration = self._voice_payload(voice_data, duration)
             self._ensure_client()
             from io import BytesIO
 
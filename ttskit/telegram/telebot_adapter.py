@@ -6,6 +6,7 @@ Supports message and callback handling with error logging.
 """
 
 import asyncio
+from typing import TYPE_CHECKING
 
 from telebot import TeleBot
 from telebot.types import CallbackQuery, Chat, Message, User
@@ -19,6 +20,9 @@ from .base import (
     TelegramUser,
 )
 
+if TYPE_CHECKING:
+    from ..audio.buffer import AudioBuffer
+
 logger = get_logger(__name__)
 
 
@@ -229,7 +233,7 @@ class TelebotAdapter(TelegramAdapter):
     async def send_voice(
         self,
         chat_id: int,
-        voice_data: bytes,
+        voice_data: "bytes | AudioBuffer",
         caption: str | None = None,
         reply_to_message_id: int | None = None,
         duration: int | None = None,
@@ -238,7 +242,7 @@ class TelebotAdapter(TelegramAdapter):
 
         Args:
             chat_id: The target chat ID.
-            voice_data: Voice bytes (OGG assumed).
+            voice_data: Voice bytes (OGG assumed), or an AudioBuffer.
             caption: Optional caption.
             reply_to_message_id: Optional reply ID.
             duration: Optional duration.
@@ -253,6 +257,7 @@ class TelebotAdapter(TelegramAdapter):
             Sets OGG filename for voice note.
         """
         try:
+            voice_data, duration = self._voice_payload(voice_data, duration)
             from io import BytesIO
 
             voice_file = BytesIO(voice_data)
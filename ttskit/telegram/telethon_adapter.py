@@ -6,6 +6,7 @@ Compatible with TTSKit's async interface.
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from telethon import TelegramClient
 from telethon.tl.types import Chat
@@ -20,6 +21,9 @@ from .base import (
     TelegramUser,
 )
 
+if TYPE_CHECKING:
+    from ..audio.buffer import AudioBuffer
+
 logger = get_logger(__name__)
 
 
@@ -150,7 +154,7 @@ class TelethonAdapter(TelegramAdapter):
     async def send_voice(
         self,
         chat_id: int,
-        voice_data: bytes,
+        voice_data: "bytes | AudioBuffer",
         caption: str | None = None,
         reply_to_message_id: int | None = None,
         duration: int | None = None,
@@ -159,7 +163,7 @@ class TelethonAdapter(TelegramAdapter):
 
         Args:
             chat_id: Target entity.
-            voice_data: Voice bytes (OGG).
+            voice_data: Voice bytes (OGG), or an AudioBuffer.
             caption: Optional caption.
             reply_to_message_id: Optional reply.
             duration: Optional duration.
@@ -174,6 +178,7 @@ class TelethonAdapter(TelegramAdapter):
             Uses send_file with voice_note=True.
         """
         try:
+            voice_data, duration = self._voice_payload(voice_data, duration)
             self._ensure_client()
             from io import BytesIO
 
@@ -1,4 +1,4 @@
-"""Audio conversion utilities for TTSKit using pydub and FFmpeg.
+"""Audio conversion utilities for TTSKit using libsndfile, pydub and FFmpeg.
 
 This module provides functions for checking FFmpeg availability, converting audio to OGG/Opus,
 extracting audio information, and analyzing audio quality metrics.
@@ -53,10 +53,13 @@ def to_opus_ogg(
     sample_rate: int = None,
     channels: int = None,
 ) -> None:
-    """Convert an audio file to OGG/Opus format using pydub and FFmpeg.
+    """Convert an audio file to OGG/Opus format.
 
-    This function loads the source audio, applies specified sample rate and channels,
-    and exports it to the destination path. It falls back to default codec if libopus is unavailable.
+    Encodes in-process through libsndfile when the source is readable by it and the
+    build has Opus support; otherwise loads the source with pydub, applies the sample
+    rate and channels, and exports it through FFmpeg, falling back to the default
+    codec if libopus is unavailable. The in-process encoder picks its own bitrate, and
+    a sample rate Opus does not run at is raised to the next one it does.
 
     Args:
         src: Path to the source audio file (supports formats like MP3).
@@ -78,6 +81,15 @@ def to_opus_ogg(
         Logs a warning and uses default OGG codec if libopus fails.
         Logs success on completion (debug level).
     """
+    if os.path.exists(src) and _to_opus_ogg_in_process(
+        src,
+        dst,
+        sample_rate or settings.audio_sample_rate,
+        channels or settings.audio_channels,
+    ):
+        logger.debug(f"Successfully converted {src} to {dst} in-process")
+        return
+
     if not check_ffmpeg_available():
         raise FFmpegNotFoundError(
             "FFmpeg is required for audio conversion. Please install FFmpeg:\n"
@@ -125,6 +137,35 @@ def to_opus_ogg(
         raise AudioConversionError(f"Failed to convert audio: {e}") from e
 
 
+def _to_opus_ogg_in_process(
+    src: str, dst: str, sample_rate: int, channels: int
+) -> bool:
+    """Encode src to OGG/Opus with libsndfile, without FFmpeg.
+
+    Returns:
+        bool: True if dst was written, False if FFmpeg has to do the conversion.
+    """
+    from ..audio import codec
+    from ..audio.pipeline import pipeline
+
+    if not codec.can_encode("ogg"):
+        return False
+    try:
+        audio, sr = codec.decode(src)
+        audio = codec.mix_channels(audio, channels)
+        if sr != sample_rate:
+            audio = pipeline._resample_audio(audio, sr, sample_rate)
+        data = pipeline._encode_opus(audio, sample_rate)
+    except Exception as e:
+        logger.debug(f"In-process Opus encoding failed for {src}, using FFmpeg: {e}")
+        return False
+
+    dst_path = Path(dst)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    dst_path.write_bytes(data)
+    return True
+
+
 def get_audio_info(file_path: str) -> dict:
     """Extract basic information from an audio file.
 
@@ -5,15 +5,21 @@ and cleanup. It includes the AudioManager class for persistent cache management
 and top-level functions for easy access.
 """
 
-import hashlib
+import json
+import os
 import tempfile
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from ..audio.buffer import AudioBuffer
 from ..cache import cache_key as global_cache_key
+from ..cache import get_single_flight
 from ..engines.registry import registry as engine_registry
 from ..engines.smart_router import SmartRouter
+from .cache_index import CacheIndexStore
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -29,8 +35,11 @@ class AudioManager:
         cache_dir: Path to the cache directory (str).
         max_cache_size: Maximum number of files in cache (int).
         max_file_age: Maximum age of files in seconds (int).
-        cache_index: Dictionary of cache entries {key: metadata} (dict).
+        cache_index: Cache entries {key: metadata}, least recently used first (OrderedDict).
+            Guarded by an internal lock, since cache reads and writes run on
+            executor threads.
         cache_stats: Statistics like hits/misses (dict).
+        single_flight: Coalesces concurrent generation of the same key (SingleFlight).
     """
 
     def __init__(
@@ -52,58 +61,95 @@ class AudioManager:
         Notes:
             cache_dir is kept as str for compatibility with tests comparing to str(Path).
             Audio processing is delegated to audio.py utilities.
-            Cache index is loaded from cache_index.json if present.
+            Cache index is loaded from cache_index.sqlite3; a legacy
+            cache_index.json is migrated on first load.
         """
         self.cache_dir = str(Path(cache_dir))
         self.max_cache_size = max_cache_size
         self.max_file_age = max_file_age
-        self.cache_index: dict[str, dict[str, Any]] = {}
+        self.cache_index: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._index_lock = threading.RLock()
         self.audio_processor = None
         self.cache_stats = {"hits": 0, "misses": 0, "total_requests": 0}
+        self.single_flight = get_single_flight()
 
         Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
 
+        self._index_store = self._open_index_store()
         self._load_cache_index()
 
+    def _open_index_store(self) -> CacheIndexStore | None:
+        """Open the SQLite cache index in cache_dir.
+
+        Returns:
+            CacheIndexStore or None: None if the database cannot be opened, in which
+            case the index is kept in memory only.
+        """
+        try:
+            return CacheIndexStore(Path(self.cache_dir) / "cache_index.sqlite3")
+        except Exception as e:
+            logger.warning(f"Cache index unavailable, keeping it in memory: {e}")
+            return None
+
     def _load_cache_index(self) -> None:
-        """Load the cache index from JSON file on disk.
+        """Load the cache index from disk in LRU order.
 
-        If the file exists, parses it and populates self.cache_index.
-        Logs the number of entries loaded or warns on failure, resetting to empty dict.
+        Reads the SQLite index, then migrates a legacy cache_index.json if one is
+        present. Warns on failure and keeps whatever could be loaded.
 
         Notes:
-            Index file is cache_index.json in self.cache_dir.
+            The legacy JSON file is removed once its entries are stored in SQLite.
         """
+        entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        if self._index_store is not None:
+            try:
+                entries = self._index_store.load()
+            except Exception as e:
+                logger.warning(f"Failed to load cache index: {e}")
+
         index_file = Path(self.cache_dir) / "cache_index.json"
         if index_file.exists():
             try:
-                import json
-
                 with open(index_file) as f:
-                    self.cache_index = json.load(f)
-                logger.info(f"Loaded cache index with {len(self.cache_index)} entries")
+                    legacy = json.load(f)
+                for key, entry in legacy.items():
+                    entries.setdefault(key, entry)
+                entries = OrderedDict(
+                    sorted(entries.items(), key=lambda x: x[1].get("last_accessed", 0))
+                )
+                if self._index_store is not None:
+                    self._index_store.replace_all(entries)
+                    index_file.unlink()
             except Exception as e:
-                logger.warning(f"Failed to load cache index: {e}")
-                self.cache_index = {}
+                logger.warning(f"Failed to migrate legacy cache index: {e}")
 
-    def _save_cache_index(self) -> None:
-        """Save the current cache index to JSON file on disk.
+        self.cache_index = entries
+        logger.info(f"Loaded cache index with {len(self.cache_index)} entries")
 
-        Writes self.cache_index with indentation for readability.
-        Warns on failure but does not raise.
+    def _save_cache_index(self) -> None:
+        """Write the whole in-memory index to disk in one transaction.
 
-        Notes:
-            Index file is cache_index.json in self.cache_dir.
+        Only needed after bulk changes (clear, age-based cleanup); single inserts,
+        hits and evictions are written incrementally. Warns on failure but does
+        not raise.
         """
-        index_file = Path(self.cache_dir) / "cache_index.json"
+        if self._index_store is None:
+            return
         try:
-            import json
-
-            with open(index_file, "w") as f:
-                json.dump(self.cache_index, f, indent=2)
+            with self._index_lock:
+                self._index_store.replace_all(self.cache_index)
         except Exception as e:
             logger.warning(f"Failed to save cache index: {e}")
 
+    def _index_call(self, method: str, *args) -> None:
+        """Apply one incremental change to the on-disk index, warning on failure."""
+        if self._index_store is None:
+            return
+        try:
+            getattr(self._index_store, method)(*args)
+        except Exception as e:
+            logger.warning(f"Failed to update cache index: {e}")
+
     def _generate_cache_key(
         self,
         text: str,
@@ -111,11 +157,12 @@ class AudioManager:
         engine: str,
         voice: str | None = None,
         effects: dict[str, Any] | None = None,
+        format: str | None = None,
     ) -> str:
         """Generate a unique cache key from synthesis parameters.
 
-        Combines text, language, engine, voice, and effects into a string,
-        then hashes it using SHA-256 for security and low collision risk.
+        Delegates to the canonical global_cache_key so keys match those of TTS,
+        the API and the bot.
 
         Args:
             text: The text to synthesize (str).
@@ -123,12 +170,14 @@ class AudioManager:
             engine: TTS engine name (str, e.g., 'gtts').
             voice: Optional voice name (str or None).
             effects: Optional audio effects dict (dict or None).
+            format: Optional output format (str or None).
 
         Returns:
             str: Hexdigest SHA-256 hash as cache key.
         """
-        key_data = f"{text}_{lang}_{engine}_{voice or ''}_{effects or ''}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        return global_cache_key(
+            text, lang, engine, voice=voice, effects=effects, output_format=format
+        )
 
     def _get_cache_key(
         self, text: str, lang: str, engine: str, voice: str | None = None
@@ -192,49 +241,48 @@ class AudioManager:
         Notes:
             Uses self.max_file_age for age check; stat().st_mtime for modification time.
         """
-        if cache_key not in self.cache_index:
+        with self._index_lock:
+            entry = self.cache_index.get(cache_key)
+        if entry is None:
             return False
 
-        entry = self.cache_index[cache_key]
         file_path = self._get_cache_path(cache_key, entry.get("format", "ogg"))
 
-        if not file_path.exists():
+        try:
+            # A concurrent eviction may remove the file at any point
+            file_age = time.time() - file_path.stat().st_mtime
+        except OSError:
             return False
-
-        file_age = time.time() - file_path.stat().st_mtime
         if file_age > self.max_file_age:
             return False
 
         return True
 
     def _cleanup_cache(self) -> None:
-        """Evict oldest cache entries if over max_cache_size.
+        """Evict least recently used entries while over max_cache_size.
 
-        Sorts entries by last_accessed time (oldest first), removes files and index entries.
-        Logs the number cleaned.
+        Pops entries from the front of the LRU-ordered index, removes their files
+        and deletes their rows in one transaction. Logs the number cleaned.
 
         Notes:
-            Only acts if len(cache_index) > max_cache_size.
-            Uses ascending sort on last_accessed (defaults to 0 if missing).
+            Each eviction is O(1); nothing is sorted.
         """
-        if len(self.cache_index) <= self.max_cache_size:
+        evicted = []
+        with self._index_lock:
+            while len(self.cache_index) > self.max_cache_size:
+                evicted.append(self.cache_index.popitem(last=False))
+        if not evicted:
             return
 
-        sorted_entries = sorted(
-            self.cache_index.items(), key=lambda x: x[1].get("last_accessed", 0)
-        )
-
-        to_remove = len(self.cache_index) - self.max_cache_size
-        for i in range(to_remove):
-            cache_key, entry = sorted_entries[i]
+        for cache_key, entry in evicted:
             file_path = self._get_cache_path(cache_key, entry.get("format", "ogg"))
+            try:
+                file_path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
-            if file_path.exists():
-                file_path.unlink()
-
-            del self.cache_index[cache_key]
-
-        logger.info(f"Cleaned up {to_remove} cache entries")
+        self._index_call("delete", [cache_key for cache_key, _ in evicted])
+        logger.info(f"Cleaned up {len(evicted)} cache entries")
 
     async def get_audio(
         self,
@@ -262,12 +310,16 @@ class AudioManager:
             bytes: Raw audio data; empty bytes b"" on generation failure.
 
         Notes:
-            Cache key uses global_cache_key(text, lang, engine or 'auto').
+            Cache key uses global_cache_key over text, lang, engine, voice,
+            effects and format, so non-default requests are cached correctly.
+            Concurrent misses for the same key share one synthesis via single_flight.
             Supports legacy 2-arg save via _save_to_cache_compat on TypeError.
             Logs debug messages for hit/miss.
             Post-processes if format != 'mp3' and not WAV from Piper.
         """
-        cache_key = global_cache_key(text, lang, engine or "auto")
+        cache_key = global_cache_key(
+            text, lang, engine, voice=voice, effects=effects, output_format=format
+        )
 
         self._update_cache_stats(None)
 
@@ -282,6 +334,39 @@ class AudioManager:
 
         logger.debug(f"Cache miss for key: {cache_key}")
         self._update_cache_stats(False)
+        audio = await self.single_flight.do(
+            cache_key,
+            lambda: self._generate_and_cache(
+                cache_key, text, lang, engine, voice, effects, format
+            ),
+        )
+        # TTS shares the single-flight layer and may hand back a decoded buffer
+        return audio.encode(format) if isinstance(audio, AudioBuffer) else audio
+
+    async def _generate_and_cache(
+        self,
+        cache_key: str,
+        text: str,
+        lang: str,
+        engine: str,
+        voice: str | None,
+        effects: dict[str, Any] | None,
+        format: str,
+    ) -> bytes:
+        """Synthesize audio for a cache miss and store it under cache_key.
+
+        Args:
+            cache_key: Key to store the generated audio under (str).
+            text: Text to synthesize into audio (str).
+            lang: Language code (str).
+            engine: TTS engine name (str).
+            voice: Optional voice identifier (str or None).
+            effects: Optional post-processing effects (dict or None).
+            format: Output audio format (str).
+
+        Returns:
+            bytes: Raw audio data; empty bytes b"" on generation failure.
+        """
         audio_data = await self._generate_audio(
             text, lang, engine, voice, effects, format
         )
@@ -308,7 +393,7 @@ class AudioManager:
         """Load cached audio bytes from disk.
 
         If not in index, attempts direct read of {cache_key}.ogg.
-        Updates last_accessed timestamp if indexed.
+        If indexed, marks the entry most recently used and records the access.
 
         Args:
             cache_key: Cache key to load (str).
@@ -316,19 +401,25 @@ class AudioManager:
         Returns:
             bytes or None: Audio data if found, None otherwise.
         """
-        if cache_key not in self.cache_index:
+        with self._index_lock:
+            entry = self.cache_index.get(cache_key)
+        if entry is None:
             raw = Path(self.cache_dir) / f"{cache_key}.ogg"
             if raw.exists():
                 with open(raw, "rb") as f:
                     return f.read()
             return None
-        entry = self.cache_index[cache_key]
         file_path = self._get_cache_path(cache_key, entry.get("format", "ogg"))
 
-        entry["last_accessed"] = time.time()
-
         with open(file_path, "rb") as f:
-            return f.read()
+            data = f.read()
+
+        with self._index_lock:
+            if cache_key in self.cache_index:
+                entry["last_accessed"] = time.time()
+                self.cache_index.move_to_end(cache_key)
+                self._index_call("touch", cache_key, entry["last_accessed"])
+        return data
 
     def _save_to_cache(
         self,
@@ -339,7 +430,8 @@ class AudioManager:
     ) -> None:
         """Save audio bytes to disk and update cache index.
 
-        Calls _cleanup_cache first if needed, then writes file and index.
+        Writes the file atomically, inserts one index row, then evicts least
+        recently used entries if over max_cache_size.
         Metadata defaults to basic format info.
 
         Args:
@@ -352,21 +444,26 @@ class AudioManager:
             Updates index with size, timestamps, and metadata.
             File saved as {cache_dir}/{key}.{format}.
         """
-        self._cleanup_cache()
-
         file_path = self._get_cache_path(cache_key, format)
-        with open(file_path, "wb") as f:
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        with open(tmp_path, "wb") as f:
             f.write(audio_data)
+        os.replace(tmp_path, file_path)
 
-        self.cache_index[cache_key] = {
+        now = time.time()
+        entry = {
             "format": format,
             "size": len(audio_data),
-            "created": time.time(),
-            "last_accessed": time.time(),
+            "created": now,
+            "last_accessed": now,
             "metadata": metadata or {"format": format},
         }
+        with self._index_lock:
+            self.cache_index[cache_key] = entry
+            self.cache_index.move_to_end(cache_key)
+            self._index_call("put", cache_key, entry)
 
-        self._save_cache_index()
+        self._cleanup_cache()
 
     def _save_to_cache_compat(self, cache_key: str, audio_data: bytes) -> None:
         """Backward-compatible save for tests using 2 arguments.
@@ -623,8 +720,9 @@ class AudioManager:
             except Exception:
                 pass
 
-        self.cache_index.clear()
-        self._save_cache_index()
+        with self._index_lock:
+            self.cache_index.clear()
+            self._save_cache_index()
 
         logger.info("Cache cleared")
 
@@ -657,7 +755,9 @@ class AudioManager:
                 continue
 
         stale_keys: list[str] = []
-        for cache_key, entry in list(self.cache_index.items()):
+        with self._index_lock:
+            entries = list(self.cache_index.items())
+        for cache_key, entry in entries:
             file_path = self._get_cache_path(cache_key, entry.get("format", "ogg"))
             if not file_path.exists():
                 stale_keys.append(cache_key)
@@ -674,11 +774,11 @@ class AudioManager:
             except Exception:
                 stale_keys.append(cache_key)
 
-        for k in stale_keys:
-            self.cache_index.pop(k, None)
-
         if stale_keys:
-            self._save_cache_index()
+            with self._index_lock:
+                for k in stale_keys:
+                    self.cache_index.pop(k, None)
+                self._save_cache_index()
         if deleted_count:
             logger.info(f"Cleaned up {deleted_count} old cache files")
 
@@ -693,10 +793,11 @@ class AudioManager:
         Returns:
             dict or None: File info (entry + path, exists, size, modified, age) or None if not in index.
         """
-        if cache_key not in self.cache_index:
+        with self._index_lock:
+            entry = self.cache_index.get(cache_key)
+        if entry is None:
             return None
 
-        entry = self.cache_index[cache_key]
         file_path = self._get_cache_path(cache_key, entry.get("format", "ogg"))
 
         info = entry.copy()
@@ -717,12 +818,14 @@ class AudioManager:
         Returns:
             list[dict]: Each item from get_file_info for keys in cache_index.
         """
-        return [self.get_file_info(key) for key in self.cache_index.keys()]
+        with self._index_lock:
+            keys = list(self.cache_index)
+        return [self.get_file_info(key) for key in keys]
 
     def remove_file(self, cache_key: str) -> bool:
         """Delete a specific cache entry and its file.
 
-        Removes file if exists, deletes from index, saves updated index.
+        Removes file if exists, deletes its index entry and row.
 
         Args:
             cache_key: Key to remove (str).
@@ -730,18 +833,17 @@ class AudioManager:
         Returns:
             bool: True if removed (was in index), False if not found.
         """
-        if cache_key not in self.cache_index:
-            return False
+        with self._index_lock:
+            entry = self.cache_index.pop(cache_key, None)
+            if entry is None:
+                return False
+            self._index_call("delete", [cache_key])
 
-        entry = self.cache_index[cache_key]
         file_path = self._get_cache_path(cache_key, entry.get("format", "mp3"))
 
         if file_path.exists():
             file_path.unlink()
 
-        del self.cache_index[cache_key]
-        self._save_cache_index()
-
         return True
 
     def export_cache(self, output_dir: str) -> None:
@@ -761,7 +863,9 @@ class AudioManager:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        for cache_key, entry in self.cache_index.items():
+        with self._index_lock:
+            entries = list(self.cache_index.items())
+        for cache_key, entry in entries:
             source_path = self._get_cache_path(cache_key, entry.get("format", "mp3"))
             if source_path.exists():
                 metadata = entry.get("metadata", {})
@@ -797,10 +901,11 @@ async def get_audio(text: str, lang: str, engine: str, **kwargs) -> bytes:
 
 
 def get_audio_info(self, audio_data: bytes) -> dict[str, Any]:
-    """Get comprehensive info for audio bytes using pydub.
+    """Get comprehensive info for audio bytes.
 
-    Analyzes audio data to extract real duration, sample_rate, channels, bitrate.
-    Falls back to defaults if analysis fails.
+    Reads duration, sample_rate and channels from the WAV, OGG or MP3 headers
+    when it can, and decodes with pydub otherwise. Falls back to defaults if
+    analysis fails.
 
     Args:
         audio_data: Raw audio bytes.
@@ -815,9 +920,27 @@ def get_audio_info(self, audio_data: bytes) -> dict[str, Any]:
             - format: Detected format (str)
 
     Notes:
-        Uses pydub for analysis; falls back to defaults on failure.
-        Supports common formats: MP3, WAV, OGG, M4A, etc.
+        Header parsing needs neither ffmpeg nor a decode; pydub handles other
+        formats (M4A, etc.) and malformed headers. Falls back to defaults on
+        failure.
     """
+    from ..audio.probe import probe
+
+    header = probe(audio_data)
+    if header is not None:
+        return {
+            "duration": header.duration,
+            "sample_rate": header.sample_rate,
+            "channels": header.channels,
+            "bitrate": (
+                max(1, int((len(audio_data) * 8) / header.duration / 1000))
+                if header.duration > 0
+                else 128
+            ),
+            "size": len(audio_data),
+            "format": header.format,
+        }
+
     # Try to detect format from audio_data header first
     detected_format = "unknown"
     if audio_data.startswith(b"ID3") or audio_data.startswith(b"\xff\xfb"):
@@ -0,0 +1,221 @@
+"""Persistent index for the AudioManager disk cache.
+
+Entries live in a SQLite table in WAL mode, so an insert, a touch or an eviction
+is a single-row write inside a transaction rather than a rewrite of the whole
+index, and a crash leaves either the old or the new row, never a torn file.
+Touches from cache hits are buffered and flushed in batches; open stores are
+closed (flushing them) by cleanup_resources() and at interpreter exit.
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Buffered last_accessed updates are written once this many are pending
+_TOUCH_FLUSH_SIZE = 64
+
+_open_stores: "weakref.WeakSet[CacheIndexStore]" = weakref.WeakSet()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    format TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL DEFAULT 0,
+    last_accessed REAL NOT NULL DEFAULT 0,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS cache_entries_lru ON cache_entries (last_accessed);
+"""
+
+
+class CacheIndexStore:
+    """SQLite-backed storage for cache index entries.
+
+    Entries are dicts with 'format', 'size', 'created', 'last_accessed' and
+    'metadata' keys, the same shape AudioManager keeps in memory.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the index database.
+
+        Args:
+            path: SQLite database file path.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._pending_touches: dict[str, float] = {}
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._closed = False
+        _open_stores.add(self)
+
+    def load(self) -> "OrderedDict[str, dict[str, Any]]":
+        """Load all entries, least recently used first.
+
+        Returns:
+            OrderedDict mapping cache keys to entries in LRU order.
+        """
+        entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, format, size, created, last_accessed, metadata "
+                "FROM cache_entries ORDER BY last_accessed"
+            ).fetchall()
+        for key, fmt, size, created, last_accessed, metadata in rows:
+            try:
+                meta = json.loads(metadata) if metadata else {}
+            except ValueError:
+                meta = {}
+            entries[key] = {
+                "format": fmt,
+                "size": size,
+                "created": created,
+                "last_accessed": last_accessed,
+                "metadata": meta,
+            }
+        return entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+            return row[0]
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Insert or replace one entry.
+
+        Args:
+            key: Cache key.
+            entry: Index entry.
+        """
+        with self._lock:
+            self._pending_touches.pop(key, None)
+            self._write(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row(key, entry)],
+            )
+
+    def touch(self, key: str, last_accessed: float) -> None:
+        """Record a cache hit; written with the next flush.
+
+        Args:
+            key: Cache key.
+            last_accessed: Access timestamp.
+        """
+        with self._lock:
+            self._pending_touches[key] = last_accessed
+            if len(self._pending_touches) >= _TOUCH_FLUSH_SIZE:
+                self._flush_touches()
+
+    def delete(self, keys: list[str]) -> None:
+        """Delete entries.
+
+        Args:
+            keys: Cache keys to remove.
+        """
+        if not keys:
+            return
+        with self._lock:
+            for key in keys:
+                self._pending_touches.pop(key, None)
+            self._write(
+                "DELETE FROM cache_entries WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def replace_all(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Replace the stored index with entries in one transaction.
+
+        Args:
+            entries: Complete index to store.
+        """
+        with self._lock:
+            self._pending_touches.clear()
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM cache_entries")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)",
+                    [self._row(key, entry) for key, entry in entries.items()],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def flush(self) -> None:
+        """Write any buffered touches."""
+        with self._lock:
+            self._flush_touches()
+
+    def close(self) -> None:
+        """Flush buffered touches and close the database; safe to call twice."""
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                self._flush_touches()
+            finally:
+                self._closed = True
+                self._conn.close()
+                _open_stores.discard(self)
+
+    def _flush_touches(self) -> None:
+        if not self._pending_touches:
+            return
+        touches = [(ts, key) for key, ts in self._pending_touches.items()]
+        self._pending_touches.clear()
+        self._write("UPDATE cache_entries SET last_accessed = ? WHERE key = ?", touches)
+
+    def _write(self, sql: str, rows: list[tuple]) -> None:
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(sql, rows)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _row(key: str, entry: dict[str, Any]) -> tuple:
+        return (
+            key,
+            entry.get("format", "ogg"),
+            entry.get("size", 0),
+            entry.get("created", 0.0),
+            entry.get("last_accessed", 0.0),
+            json.dumps(entry.get("metadata") or {}, ensure_ascii=False, default=str),
+        )
+
+
+def flush_all_stores() -> None:
+    """Write out buffered touches of every open CacheIndexStore, keeping it open."""
+    for store in list(_open_stores):
+        try:
+            store.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush cache index {store.path}: {e}")
+
+
+def close_all_stores() -> None:
+    """Close every open CacheIndexStore, writing out buffered touches."""
+    for store in list(_open_stores):
+        try:
+            store.close()
+        except Exception as e:
+            logger.warning(f"Failed to close cache index {store.path}: {e}")
+
+
+atexit.register(close_all_stores)
@@ -1,14 +1,19 @@
 """
 Performance optimization utilities for TTSKit.
 
-This module offers tools for efficient HTTP connection pooling, parallel batch/stream processing,
-memory-efficient audio streaming, and real-time performance monitoring. Designed for
-high-scale TTS applications with async support and resource management.
+This module offers tools for efficient HTTP connection pooling, shared thread pools for
+blocking engine work, parallel batch/stream processing, memory-efficient audio streaming,
+and real-time performance monitoring. Designed for high-scale TTS applications with async
+support and resource management.
 """
 
 import asyncio
+import os
+import threading
 import time
-from collections.abc import AsyncGenerator
+import weakref
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -47,10 +52,16 @@ class ConnectionPool:
     Manages per-origin sessions with limits to optimize reuse and concurrency.
     Uses semaphore for max_concurrent_requests control.
 
+    Sessions and the semaphore are bound to the event loop that creates them, so
+    the pool keeps a separate set per running loop. A process-wide pool can then
+    serve successive asyncio.run() calls; state for loops that have closed is
+    dropped.
+
     Attributes:
         config: PerformanceConfig instance (PerformanceConfig).
-        _sessions: Dict of base_url to AsyncClient (dict).
-        _semaphore: Limits concurrent requests (asyncio.Semaphore).
+        _sessions: Dict of base_url to AsyncClient for the running loop (dict).
+        _semaphore: Limits concurrent requests on the running loop
+            (asyncio.Semaphore).
     """
 
     def __init__(self, config: PerformanceConfig):
@@ -60,8 +71,33 @@ class ConnectionPool:
             config: Settings for connections/keepalives/semaphore (PerformanceConfig).
         """
         self.config = config
-        self._sessions: dict[str, httpx.AsyncClient] = {}
-        self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        # event loop -> (semaphore, {base_url: session})
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[asyncio.Semaphore, dict[str, httpx.AsyncClient]],
+        ] = weakref.WeakKeyDictionary()
+
+    def _loop_state(
+        self,
+    ) -> tuple[asyncio.Semaphore, dict[str, httpx.AsyncClient]]:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            # Sessions of a closed loop can never be used again
+            for other in list(self._loops):
+                if other is not loop and other.is_closed():
+                    del self._loops[other]
+            state = (asyncio.Semaphore(self.config.max_concurrent_requests), {})
+            self._loops[loop] = state
+        return state
+
+    @property
+    def _semaphore(self) -> asyncio.Semaphore:
+        return self._loop_state()[0]
+
+    @property
+    def _sessions(self) -> dict[str, httpx.AsyncClient]:
+        return self._loop_state()[1]
 
     async def get_session(self, base_url: str) -> httpx.AsyncClient:
         """Retrieve or create an AsyncClient for the URL's origin.
@@ -95,16 +131,114 @@ class ConnectionPool:
             httpx.Response: Server response.
         """
         async with self._semaphore:
-            session = await self.get_session(str(httpx.URL(url).origin))
+            session = await self.get_session(str(httpx.URL(url).join("/")))
             return await session.request(method, url, **kwargs)
 
     async def close_all(self):
-        """Close all open sessions and clear the pool."""
+        """Close the running loop's sessions and clear them from the pool."""
         for session in self._sessions.values():
             await session.aclose()
         self._sessions.clear()
 
 
+class ManagedExecutor(ThreadPoolExecutor):
+    """Named, size-limited thread pool that tracks its own load.
+
+    Drop-in replacement for ThreadPoolExecutor (usable with loop.run_in_executor)
+    that counts queued, running and completed jobs so pool saturation is visible.
+
+    Attributes:
+        name: Pool name, also used as the worker thread name prefix (str).
+        max_workers: Maximum number of worker threads (int).
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        """Initialize the pool.
+
+        Args:
+            name: Pool name (str).
+            max_workers: Maximum number of worker threads (int, at least 1).
+        """
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        super().__init__(
+            max_workers=self.max_workers, thread_name_prefix=f"ttskit-{name}"
+        )
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) and count it as queued until it starts.
+
+        Args:
+            fn: Callable to run on a worker thread (Callable).
+            *args: Positional args for fn.
+            **kwargs: Keyword args for fn.
+
+        Returns:
+            Future: Future for the call result.
+        """
+        with self._stats_lock:
+            self._queued += 1
+        try:
+            future = super().submit(self._run_tracked, fn, args, kwargs)
+        except BaseException:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        """Drop a job cancelled before it started from the queue depth."""
+        # Only a job still waiting for a thread can be cancelled
+        if future.cancelled():
+            with self._stats_lock:
+                self._queued -= 1
+
+    def _run_tracked(self, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        """Run a job on a worker thread, updating the load counters."""
+        with self._stats_lock:
+            self._queued -= 1
+            self._active += 1
+        success = False
+        try:
+            result = fn(*args, **kwargs)
+            success = True
+            return result
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._completed += 1
+                if not success:
+                    self._failed += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Snapshot of the pool's load.
+
+        Returns:
+            dict: Pool stats with:
+                - max_workers: Thread limit (int).
+                - active: Jobs currently running (int).
+                - queued: Jobs waiting for a free thread (int).
+                - completed: Jobs finished since start (int).
+                - failed: Jobs that raised (int).
+                - utilization: active / max_workers (float, 0-1).
+        """
+        with self._stats_lock:
+            return {
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "failed": self._failed,
+                "utilization": self._active / self.max_workers,
+            }
+
+
 class ParallelProcessor:
     """Async utilities for parallel batch and stream processing with concurrency limits.
 
@@ -437,9 +571,19 @@ class PerformanceMonitor:
         }
 
 
+# Default thread limits for the shared executors; Edge work is I/O bound,
+# Piper and audio work is CPU bound and should not oversubscribe the cores
+DEFAULT_EXECUTOR_WORKERS: dict[str, int] = {
+    "edge": 2,
+    "piper": max(1, min(4, (os.cpu_count() or 1) // 2)),
+    "audio": max(1, min(4, os.cpu_count() or 1)),
+}
+
 # Global singleton instances for pool and monitor (lazy initialization)
 _connection_pool: ConnectionPool | None = None
 _performance_monitor: PerformanceMonitor | None = None
+_executors: dict[str, ManagedExecutor] = {}
+_executors_lock = threading.Lock()
 
 
 def get_connection_pool(config: PerformanceConfig | None = None) -> ConnectionPool:
@@ -473,15 +617,72 @@ def get_performance_monitor() -> PerformanceMonitor:
     return _performance_monitor
 
 
+def get_executor(name: str, max_workers: int | None = None) -> ManagedExecutor:
+    """Retrieve or create the shared executor for a kind of blocking work.
+
+    Args:
+        name: Pool name, e.g. 'edge', 'piper' or 'audio' (str).
+        max_workers: Thread limit used when the pool is first created (int or None);
+            defaults to DEFAULT_EXECUTOR_WORKERS[name], or 4 for unknown names.
+
+    Returns:
+        ManagedExecutor: Shared instance.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ManagedExecutor(
+                name, max_workers or DEFAULT_EXECUTOR_WORKERS.get(name, 4)
+            )
+            _executors[name] = executor
+        return executor
+
+
+def get_executor_stats() -> dict[str, dict[str, Any]]:
+    """Collect load stats from every shared executor.
+
+    Returns:
+        dict: Pool name to ManagedExecutor.get_stats() snapshot.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.get_stats() for executor in executors}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down all shared executors and forget them.
+
+    Later get_executor calls create fresh pools.
+
+    Args:
+        wait: Whether to wait for running jobs; when False, queued jobs are cancelled (bool).
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
 async def cleanup_resources():
-    """Close global connection pool and reset instances.
+    """Close the connection pool, executors and ffmpeg pool; flush cache indexes.
 
     Calls close_all on pool if exists; sets to None for re-init.
 
     Notes:
         Monitor does not need explicit cleanup (in-memory).
+        Executors are shut down without waiting so the event loop is not blocked.
+        Cache index stores are flushed so buffered hit timestamps reach disk but
+        stay open for the live AudioManager (they are closed at exit), and the
+        shared ffmpeg pool's idle workers are stopped.
     """
+    from ..audio.ffmpeg_pool import shutdown_ffmpeg_pool
+    from .cache_index import flush_all_stores
+
     global _connection_pool
     if _connection_pool:
         await _connection_pool.close_all()
         _connection_pool = None
+    shutdown_executors(wait=False)
+    shutdown_ffmpeg_pool()
+    flush_all_stores()
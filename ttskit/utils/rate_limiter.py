@@ -5,17 +5,11 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
+from ..cache.async_redis import get_async_redis
+from ..cache.redis import REDIS_AVAILABLE as _REDIS_AVAILABLE
 from ..config import settings
 from ..exceptions import RateLimitExceededError
 
-try:
-    import redis  # type: ignore
-
-    _REDIS_AVAILABLE = True
-except Exception:
-    redis = None  # type: ignore
-    _REDIS_AVAILABLE = False
-
 
 @dataclass
 class RateLimitInfo:
@@ -223,7 +217,11 @@ class RateLimiter:
 
 
 class RedisRateLimiter:
-    """Redis-backed rate limiter (best-effort, single-node)."""
+    """Redis-backed rate limiter (best-effort, single-node).
+
+    Uses the async client on the shared connection pool, so checks never block
+    the event loop.
+    """
 
     def __init__(
         self,
@@ -235,73 +233,68 @@ class RedisRateLimiter:
         self.max_requests = max_requests or settings.rate_limit_rpm
         self.window_seconds = window_seconds or settings.rate_limit_window
         self.block_duration = block_duration
-        self._redis = redis.from_url(redis_url, decode_responses=True)  # type: ignore[arg-type]
+        self.redis_url = redis_url
+
+    @property
+    def _redis(self):
+        return get_async_redis(self.redis_url)
 
     def _keys(self, user_id: str) -> tuple[str, str]:
         return f"rl:c:{user_id}", f"rl:b:{user_id}"
 
     async def is_allowed(self, user_id: str) -> tuple[bool, str]:
         count_key, block_key = self._keys(user_id)
-
-        def _op() -> tuple[bool, str]:
-            # Blocked?
-            if self._redis.exists(block_key):
-                ttl = self._redis.ttl(block_key)
-                ttl = int(ttl) if ttl and ttl > 0 else self.block_duration
-                return False, f"Rate limit exceeded. Try again in {ttl} seconds."
-
-            pipe = self._redis.pipeline()
-            pipe.incr(count_key)
-            pipe.expire(count_key, self.window_seconds)
-            cnt, _ = pipe.execute()
-            cnt = int(cnt)
-            if cnt > self.max_requests:
-                # Set block and reset counter window
-                self._redis.setex(block_key, self.block_duration, "1")
-                return (
-                    False,
-                    f"Rate limit exceeded. Blocked for {self.block_duration} seconds.",
-                )
-            remaining = max(0, self.max_requests - cnt)
+        client = self._redis
+
+        # Blocked?
+        if await client.exists(block_key):
+            ttl = await client.ttl(block_key)
+            ttl = int(ttl) if ttl and ttl > 0 else self.block_duration
+            return False, f"Rate limit exceeded. Try again in {ttl} seconds."
+
+        pipe = client.pipeline()
+        pipe.incr(count_key)
+        pipe.expire(count_key, self.window_seconds)
+        cnt, _ = await pipe.execute()
+        cnt = int(cnt)
+        if cnt > self.max_requests:
+            # Set block and reset counter window
+            await client.setex(block_key, self.block_duration, "1")
             return (
-                True,
-                f"Request allowed. {remaining} requests remaining in this window.",
+                False,
+                f"Rate limit exceeded. Blocked for {self.block_duration} seconds.",
             )
-
-        return await asyncio.to_thread(_op)
+        remaining = max(0, self.max_requests - cnt)
+        return (
+            True,
+            f"Request allowed. {remaining} requests remaining in this window.",
+        )
 
     async def get_user_stats(self, user_id: str) -> dict[str, Any]:
         count_key, block_key = self._keys(user_id)
-
-        def _op() -> dict[str, Any]:
-            cnt = self._redis.get(count_key)
-            cnt = int(cnt) if cnt else 0
-            ttl = self._redis.ttl(count_key)
-            ttl = int(ttl) if ttl and ttl > 0 else self.window_seconds
-            blocked = self._redis.exists(block_key) == 1
-            blocked_ttl = self._redis.ttl(block_key) if blocked else -1
-            remaining = max(0, self.max_requests - cnt)
-            return {
-                "requests": cnt,
-                "remaining": remaining,
-                "window_start": None,
-                "window_remaining": ttl,
-                "blocked": blocked,
-                "blocked_until": int(time.time()) + int(blocked_ttl)
-                if blocked_ttl and blocked_ttl > 0
-                else None,
-            }
-
-        return await asyncio.to_thread(_op)
+        client = self._redis
+
+        cnt = await client.get(count_key)
+        cnt = int(cnt) if cnt else 0
+        ttl = await client.ttl(count_key)
+        ttl = int(ttl) if ttl and ttl > 0 else self.window_seconds
+        blocked = await client.exists(block_key) == 1
+        blocked_ttl = await client.ttl(block_key) if blocked else -1
+        remaining = max(0, self.max_requests - cnt)
+        return {
+            "requests": cnt,
+            "remaining": remaining,
+            "window_start": None,
+            "window_remaining": ttl,
+            "blocked": blocked,
+            "blocked_until": int(time.time()) + int(blocked_ttl)
+            if blocked_ttl and blocked_ttl > 0
+            else None,
+        }
 
     async def reset_user(self, user_id: str) -> None:
         count_key, block_key = self._keys(user_id)
-
-        def _op() -> None:
-            self._redis.delete(count_key)
-            self._redis.delete(block_key)
-
-        await asyncio.to_thread(_op)
+        await self._redis.delete(count_key, block_key)
 
     async def get_global_stats(self) -> dict[str, Any]:
         # Not efficient to scan; return configured limits only
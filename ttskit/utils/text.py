@@ -338,6 +338,110 @@ def split_long_text(text: str, max_length: int = 1000) -> list[str]:
     return [chunk for chunk in chunks if chunk]
 
 
+# Sentence boundary: terminal punctuation (Latin, Arabic/Persian, ellipsis) followed
+# by whitespace, or a line break. Decimal points such as "3.14" are not boundaries.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?\u061F\u06D4\u2026])\s+|\n+")
+
+
+def split_sentences(text: str, max_length: int = 1000) -> list[str]:
+    """Split text into sentences, keeping their terminal punctuation.
+
+    Sentences longer than max_length are further split with split_long_text.
+
+    Args:
+        text: Text to split (str).
+        max_length: Max chars per sentence (int); default 1000.
+
+    Returns:
+        list[str]: Non-empty, stripped sentences in original order.
+    """
+    if not text:
+        return []
+
+    sentences = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) > max_length:
+            sentences.extend(split_long_text(sentence, max_length))
+        else:
+            sentences.append(sentence)
+
+    return sentences
+
+
+# Arabic-script blocks: Arabic, Arabic Supplement, Presentation Forms A and B
+_ARABIC_SCRIPT_RANGES = (
+    ("\u0600", "\u06ff"),
+    ("\u0750", "\u077f"),
+    ("\ufb50", "\ufdff"),
+    ("\ufe70", "\ufeff"),
+)
+# Letters that only one of the two languages uses (Persian keheh/yeh vs Arabic kaf/yeh)
+_PERSIAN_ONLY_CHARS = frozenset("پچژگکی")
+_ARABIC_ONLY_CHARS = frozenset("كيةى")
+
+
+def _is_arabic_script(char: str) -> bool:
+    return any(start <= char <= end for start, end in _ARABIC_SCRIPT_RANGES)
+
+
+def split_script_runs(
+    text: str, rtl_lang: str = "fa", ltr_lang: str = "en"
+) -> list[tuple[str, str]]:
+    """Split mixed-script text into runs of a single language.
+
+    Letters decide the script of a run; digits, punctuation, spaces and ZWNJ stay
+    in the run they appear in. Arabic-script runs are labeled 'fa' or 'ar' from
+    their letters, falling back to rtl_lang; other letters are labeled ltr_lang.
+
+    Args:
+        text: Text to split (str).
+        rtl_lang: Label for Arabic-script runs without distinctive letters (str).
+        ltr_lang: Label for Latin (and other non-Arabic) runs (str).
+
+    Returns:
+        list[tuple[str, str]]: (lang, text) pairs in original order; text without
+        letters is returned as one ltr_lang run.
+    """
+    if not text or not text.strip():
+        return []
+
+    runs: list[tuple[bool, list[str]]] = []
+    pending: list[str] = []
+    for char in text:
+        if not char.isalpha():
+            (runs[-1][1] if runs else pending).append(char)
+            continue
+        rtl = _is_arabic_script(char)
+        if runs and runs[-1][0] == rtl:
+            runs[-1][1].append(char)
+        else:
+            runs.append((rtl, pending + [char]))
+            pending = []
+
+    if not runs:
+        return [(ltr_lang, text.strip())]
+
+    segments = []
+    for rtl, chars in runs:
+        segment = "".join(chars).strip()
+        if not segment:
+            continue
+        if not rtl:
+            lang = ltr_lang
+        elif _PERSIAN_ONLY_CHARS.intersection(segment):
+            lang = "fa"
+        elif _ARABIC_ONLY_CHARS.intersection(segment):
+            lang = "ar"
+        else:
+            lang = rtl_lang
+        segments.append((lang, segment))
+
+    return segments
+
+
 def validate_text(text: str, max_length: int = 1000) -> str | None:
     """Validate text for TTS: check non-empty and length.
 